@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,6 +13,119 @@ class Settings(BaseSettings):
     database_url: str = ""
     cors_origins: list[str] = ["http://localhost:5173"]
 
+    llm_model: str = "gemini-2.0-flash"
+    # Must be a current model ID; retired IDs fail at request time, which breaks failover
+    llm_anthropic_model: str = "claude-sonnet-4-6"
+    # Preferred first until latency says otherwise; providers without an API key are skipped
+    llm_providers: list[str] = ["gemini", "anthropic"]
+    # Hedge to the next provider once a call outlasts the preferred one's observed p95;
+    # this delay applies until enough calls have been timed. 0 disables hedging
+    llm_hedge_delay_ms: float = 10000.0
+    # Model per provider, temperature and output cap for each tier; a provider left out
+    # of a tier uses llm_model / llm_anthropic_model
+    llm_tiers: dict[str, dict[str, Any]] = {
+        "strong": {"temperature": 0.7, "max_output_tokens": 4096},
+        "fast": {
+            "gemini": "gemini-2.0-flash-lite",
+            "anthropic": "claude-haiku-4-5",
+            "temperature": 0.4,
+            "max_output_tokens": 1024,
+        },
+    }
+    # LLMService method -> tier; methods not listed use llm_default_tier
+    llm_method_tiers: dict[str, str] = {
+        "profile_analysis": "strong",
+        "cross_reference": "strong",
+        "generate_coaching": "strong",
+        "generate_dual_coaching": "strong",
+        "brainstorm_venue_queries": "fast",
+        "rank_venues": "fast",
+        "coach_chat": "fast",
+    }
+    llm_default_tier: str = "strong"
+    llm_max_concurrency: int = 8
+    llm_tokens_per_minute: int = 1_000_000  # 0 disables the token budget
+    llm_reserved_interactive: int = 1
+    # Budgeted per call on top of the prompt estimate, until the provider reports real usage
+    llm_output_tokens_estimate: int = 1024
+    # Estimated tokens of connector data sent to profile analysis; 0 disables the budget
+    profile_token_budget: int = 2500
+    # "dual": both briefings from one call, falling back to "parallel" (one call per user)
+    coaching_mode: str = "dual"
+
+    dossier_store_backend: str = "memory"  # "disk" or "redis" keep dossiers across restarts
+    dossier_store_dir: str = ".cache/dossiers"
+    dossier_store_max_entries: int = 4096
+    dossier_store_ttl: float = 7 * 86400.0
+
+    pair_cache_backend: str = "memory"
+    pair_cache_dir: str = ".cache/pairs"
+    pair_cache_max_entries: int = 4096
+    pair_cache_ttl: float = 7 * 86400.0
+
+    browser_pool_size: int = 2
+    browser_max_concurrency: int = 4
+    browser_max_pages: int = 50
+    browser_max_rss_mb: int = 1500
+    browser_rss_check_every: int = 10  # page releases between /proc scans
+    browser_health_interval: float = 30.0
+
+    blob_store_dir: str = ".cache/blobs"
+    blob_store_max_mb: int = 512  # least recently put screenshots are deleted past this; 0 keeps everything
+
+    # Seconds; whatever hasn't finished by the deadline is left out of the bundle
+    ingest_deadline: float = 15.0
+    connector_timeouts: dict[str, float] = {
+        "github": 8.0,
+        "spotify": 8.0,
+        "letterboxd": 5.0,
+        "instagram": 12.0,
+        "linkedin": 12.0,
+        "books": 5.0,
+    }
+    connector_cache_ttl: float = 1800.0
+    connector_cache_ttls: dict[str, float] = {
+        "letterboxd": 900.0,
+        "instagram": 3600.0,
+        "linkedin": 3600.0,
+    }
+    connector_cache_stale_ttl: float = 3600.0
+    connector_cache_max_entries: int = 2048
+    connector_cache_max_bytes: int = 64 * 1024 * 1024
+
+    http_http2: bool = True
+    http_host_timeouts: dict[str, float] = {}
+    http_host_max_connections: dict[str, int] = {}
+
+    github_token: str = ""
+    github_tokens: list[str] = []
+    github_rate_limit_max_wait: float = 0.0
+    github_fetch_mode: str = "rest"
+    github_etag_cache_backend: str = "memory"
+    github_etag_cache_dir: str = ".cache/github-etags"
+    github_etag_cache_max_entries: int = 4096
+
+    spotify_catalog_ttl: float = 7 * 86400.0
+    spotify_catalog_backend: str = "memory"
+    spotify_catalog_dir: str = ".cache/spotify-catalog"
+    spotify_catalog_max_entries: int = 50000
+
+    places_max_concurrency: int = 3
+    places_cache_backend: str = "memory"  # "redis" shares it across workers via REDIS_URL
+    places_cache_ttl: float = 86400.0
+    places_cache_max_entries: int = 4096
+    places_geohash_precision: int = 5
+
+    books_upstream: str = "openlibrary"  # or "static", read from books_static_catalog
+    books_static_catalog: str = ""
+    books_index_path: str = ".cache/books.sqlite3"
+
+    letterboxd_feed_ttl: float = 900.0
+    letterboxd_feed_stale_ttl: float = 86400.0
+    letterboxd_feed_cache_backend: str = "memory"
+    letterboxd_feed_cache_dir: str = ".cache/letterboxd-feeds"
+    letterboxd_feed_cache_max_entries: int = 4096
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
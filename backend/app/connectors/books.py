@@ -3,8 +3,24 @@ from __future__ import annotations
 from typing import Any
 
 from app.connectors.base import BaseConnector
+from app.services.books import BookResolver, get_book_resolver
 
 
 class BooksConnector(BaseConnector):
+    """Resolve a reading list to book metadata (authors, year, subjects)."""
+
+    def __init__(self, resolver: BookResolver | None = None) -> None:
+        self._resolver = resolver or get_book_resolver()
+
     async def fetch(self, identifier: str) -> dict[str, Any]:
-        return {}
+        """``identifier`` is the reading list, one title per line (see ``titles_identifier``)."""
+        return await self.fetch_titles(identifier.splitlines())
+
+    async def fetch_titles(self, titles: list[str]) -> dict[str, Any]:
+        return await self._resolver.resolve(titles)
+
+
+def titles_identifier(titles: list[str] | None) -> str | None:
+    """Pack a reading list into the single identifier string connectors take."""
+    titles = [t.strip() for t in titles or [] if t.strip()]
+    return "\n".join(titles) if titles else None
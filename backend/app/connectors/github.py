@@ -1,31 +1,71 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
 import httpx
 
+from app.config import settings
 from app.connectors.base import BaseConnector
-
-API_BASE = "https://api.github.com"
+from app.services.etag_cache import ETagCache, get_github_etag_cache
+from app.services.github_tokens import GitHubTokenPool, get_github_token_pool
+from app.services.http_clients import http_client
+
+logger = logging.getLogger(__name__)
+
+# Only the fields the extractors read. The public events feed has no GraphQL
+# equivalent, so commit hours still come from REST, fetched concurrently.
+PROFILE_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    repositories(first: 100, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { name description stargazerCount primaryLanguage { name } }
+    }
+    starredRepositories(first: 100, orderBy: {field: STARRED_AT, direction: DESC}) {
+      nodes { repositoryTopics(first: 20) { nodes { topic { name } } } }
+    }
+  }
+}
+"""
 
 
 class GitHubConnector(BaseConnector):
     """Fetch public GitHub profile data for a username."""
 
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        etag_cache: ETagCache | None = None,
+        mode: str | None = None,
+        token: str | None = None,
+    ) -> None:
+        self._client = client
+        self._etag_cache = etag_cache or get_github_etag_cache()
+        self._mode = mode or settings.github_fetch_mode
+        if token is None:
+            self._core_pool = get_github_token_pool("core")
+            self._graphql_pool = get_github_token_pool("graphql")
+        else:
+            self._core_pool = GitHubTokenPool([token], "core")
+            self._graphql_pool = GitHubTokenPool([token], "graphql")
+
     async def fetch(self, identifier: str) -> dict[str, Any]:
         username = identifier.strip().lstrip("@")
-        async with httpx.AsyncClient(
-            base_url=API_BASE,
-            headers={"Accept": "application/vnd.github+json"},
-            timeout=15,
-        ) as client:
-            repos_task = self._fetch_repos(client, username)
-            events_task = self._fetch_events(client, username)
-            starred_task = self._fetch_starred(client, username)
-            repos, events, starred = await asyncio.gather(
-                repos_task, events_task, starred_task
-            )
+        async with http_client("github", self._client) as client:
+            if self._use_graphql():
+                (repos, starred), events = await asyncio.gather(
+                    self._fetch_graphql(client, username),
+                    self._fetch_events(client, username),
+                )
+            else:
+                repos_task = self._fetch_repos(client, username)
+                events_task = self._fetch_events(client, username)
+                starred_task = self._fetch_starred(client, username)
+                repos, events, starred = await asyncio.gather(
+                    repos_task, events_task, starred_task
+                )
 
         return {
             "languages": self._extract_languages(repos),
@@ -34,41 +74,122 @@ class GitHubConnector(BaseConnector):
             "starred_topics": self._extract_starred_topics(starred),
         }
 
+    def _use_graphql(self) -> bool:
+        if self._mode != "graphql":
+            return False
+        if not self._graphql_pool.authenticated:
+            # GitHub's GraphQL API rejects anonymous requests
+            logger.warning("GitHub GraphQL mode needs a token; using REST")
+            return False
+        return True
+
     # ── individual API calls ──────────────────────────────────────
 
     async def _fetch_repos(
         self, client: httpx.AsyncClient, username: str
     ) -> list[dict]:
-        resp = await client.get(
+        return await self._get_json(
+            client,
             f"/users/{username}/repos",
             params={"per_page": 100, "sort": "updated"},
         )
-        if resp.status_code == 404:
-            return []
-        resp.raise_for_status()
-        return resp.json()
 
     async def _fetch_events(
         self, client: httpx.AsyncClient, username: str
     ) -> list[dict]:
-        resp = await client.get(
-            f"/users/{username}/events/public", params={"per_page": 100}
+        return await self._get_json(
+            client, f"/users/{username}/events/public", params={"per_page": 100}
         )
-        if resp.status_code == 404:
-            return []
-        resp.raise_for_status()
-        return resp.json()
 
     async def _fetch_starred(
         self, client: httpx.AsyncClient, username: str
     ) -> list[dict]:
-        resp = await client.get(
-            f"/users/{username}/starred", params={"per_page": 100}
+        return await self._get_json(
+            client, f"/users/{username}/starred", params={"per_page": 100}
+        )
+
+    async def _fetch_graphql(
+        self, client: httpx.AsyncClient, username: str
+    ) -> tuple[list[dict], list[dict]]:
+        """Repos and starred repos in one request, reshaped like the REST payloads."""
+        resp = await self._request(
+            client,
+            self._graphql_pool,
+            "POST",
+            "/graphql",
+            json={"query": PROFILE_QUERY, "variables": {"login": username}},
         )
+        resp.raise_for_status()
+        payload = resp.json()
+        user = (payload.get("data") or {}).get("user")
+        if user is None:
+            errors = payload.get("errors") or []
+            if any(e.get("type") != "NOT_FOUND" for e in errors):
+                raise RuntimeError(f"GitHub GraphQL error: {errors[0].get('message', errors[0])}")
+            return [], []
+
+        repos = [
+            {
+                "name": r["name"],
+                "description": r.get("description"),
+                "stargazers_count": r.get("stargazerCount", 0),
+                "language": (r.get("primaryLanguage") or {}).get("name"),
+            }
+            for r in user["repositories"]["nodes"]
+        ]
+        starred = [
+            {"topics": [t["topic"]["name"] for t in r["repositoryTopics"]["nodes"]]}
+            for r in user["starredRepositories"]["nodes"]
+        ]
+        return repos, starred
+
+    async def _get_json(
+        self, client: httpx.AsyncClient, url: str, params: dict[str, Any]
+    ) -> list[dict]:
+        """Conditional GET: a 304 reuses the cached body and doesn't count against the rate limit."""
+        cache = self._etag_cache
+        key = cache.key(url, params)
+        entry = await cache.lookup(key)
+        resp = await self._request(
+            client, self._core_pool, "GET", url, params=params, headers=cache.validators(entry)
+        )
+        if resp.status_code == 304 and entry is not None:
+            cache.record_hit()
+            return entry["body"]
+        cache.record_miss()
         if resp.status_code == 404:
             return []
         resp.raise_for_status()
-        return resp.json()
+        body = resp.json()
+        await cache.store(key, resp, body)
+        return body
+
+    @staticmethod
+    async def _request(
+        client: httpx.AsyncClient,
+        pool: GitHubTokenPool,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send with the token that has the most budget left, moving on if one is rate limited."""
+        resp: httpx.Response | None = None
+        for _ in range(len(pool) + 1):
+            state = await pool.acquire()
+            resp = None
+            try:
+                resp = await client.request(
+                    method, url, headers={**(headers or {}), **state.auth_headers()}, **kwargs
+                )
+            finally:
+                if resp is None:
+                    pool.release(state, 0, {})
+                else:
+                    pool.release(state, resp.status_code, resp.headers)
+            if not pool.is_rate_limited(resp.status_code, resp.headers):
+                return resp
+        return resp
 
     # ── data extraction ───────────────────────────────────────────
 
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 from typing import Any
 
-from playwright.async_api import async_playwright
-
 from app.connectors.base import BaseConnector
+from app.connectors.static_page import fetch_html, meta_content, page_title, parse_html
+from app.services.blobs import BlobStore, get_blob_store
+from app.services.browser_pool import BrowserPool, open_page
 
 PROFILE_URL = "https://www.instagram.com/{username}/"
 USER_AGENT = (
@@ -18,17 +18,68 @@ _LOGIN_KEYWORDS = ("Login", "login", "Log in", "accounts/login", "Log into")
 
 
 class InstagramConnector(BaseConnector):
-    """Scrape a public Instagram profile for bio and a screenshot."""
-
-    async def fetch(self, identifier: str) -> dict[str, Any]:
+    """Scrape a public Instagram profile for bio and, on request, a screenshot."""
+
+    def __init__(
+        self,
+        browser_pool: BrowserPool | None = None,
+        blob_store: BlobStore | None = None,
+    ) -> None:
+        self._browser_pool = browser_pool
+        self._blob_store = blob_store or get_blob_store()
+
+    async def fetch(self, identifier: str, *, screenshot: bool = False) -> dict[str, Any]:
+        """With ``screenshot=True`` the viewport PNG is stored and returned as ``screenshot_ref``."""
         username = identifier.strip().lstrip("@")
-        page_data = await self._fetch_profile(username)
-        return self._extract_profile_data(page_data)
+        page_data = await self._fetch_profile(username, screenshot=screenshot)
+        profile = self._extract_profile_data(page_data)
+        shot = page_data.get("screenshot_bytes")
+        if shot and not profile["login_wall"]:
+            profile["screenshot_ref"] = await self._blob_store.put(shot)
+        return profile
 
     # ── data fetching ──────────────────────────────────────────────
 
-    async def _fetch_profile(self, username: str) -> dict:
-        """Launch headless browser and grab raw page data + screenshot."""
+    async def _fetch_profile(self, username: str, screenshot: bool = False) -> dict:
+        """Try a plain HTTP fetch first; fall back to the browser on a login wall or empty page."""
+        if not screenshot:
+            raw = await self._fetch_profile_http(username)
+            if raw and not self._needs_browser(raw):
+                return raw
+        return await self._fetch_profile_browser(username, screenshot=screenshot)
+
+    async def _fetch_profile_http(self, username: str) -> dict:
+        url = PROFILE_URL.format(username=username)
+        try:
+            final_url, html = await fetch_html(url, USER_AGENT, "instagram")
+        except Exception:
+            return {}
+        if not html:
+            return {}
+        return self._parse_profile_html(html, final_url)
+
+    @staticmethod
+    def _parse_profile_html(html: str, final_url: str) -> dict:
+        """Build the same raw dict the browser tier produces from static HTML."""
+        soup = parse_html(html)
+        meta_desc = meta_content(soup, prop="og:description") or meta_content(soup, name="description")
+        return {
+            "title": page_title(soup),
+            # Without JS the header section isn't rendered; og:description is the bio we get
+            "bio_text": meta_desc,
+            "screenshot_bytes": b"",
+            "final_url": final_url,
+            "meta_description": meta_desc,
+        }
+
+    @staticmethod
+    def _needs_browser(raw: dict) -> bool:
+        if _is_login_wall(raw.get("title", ""), raw.get("final_url", "")):
+            return True
+        return not (raw.get("bio_text") or raw.get("meta_description"))
+
+    async def _fetch_profile_browser(self, username: str, screenshot: bool = False) -> dict:
+        """Load the profile in a pooled headless browser and grab raw page data (+ screenshot)."""
         url = PROFILE_URL.format(username=username)
         result: dict[str, Any] = {
             "title": "",
@@ -39,53 +90,47 @@ class InstagramConnector(BaseConnector):
         }
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(user_agent=USER_AGENT)
-                page = await context.new_page()
+            async with open_page(USER_AGENT, self._browser_pool) as page:
                 try:
-                    try:
-                        await page.goto(url, wait_until="networkidle", timeout=20000)
-                    except Exception:
-                        pass
-
-                    await asyncio.sleep(1)
+                    await page.goto(url, wait_until="networkidle", timeout=20000)
+                except Exception:
+                    pass
 
-                    result["title"] = await page.title()
-                    result["final_url"] = page.url
+                await asyncio.sleep(1)
 
-                    # Bio text — in header section (only works if profile loaded)
-                    try:
-                        bio_el = await page.wait_for_selector(
-                            "header section", timeout=5000
-                        )
-                        if bio_el:
-                            result["bio_text"] = (await bio_el.inner_text()).strip()
-                    except Exception:
-                        pass
+                result["title"] = await page.title()
+                result["final_url"] = page.url
 
-                    # Fallback: meta description sometimes has bio info
-                    try:
-                        meta = await page.query_selector(
-                            'meta[property="og:description"]'
+                # Bio text — in header section (only works if profile loaded)
+                try:
+                    bio_el = await page.wait_for_selector(
+                        "header section", timeout=5000
+                    )
+                    if bio_el:
+                        result["bio_text"] = (await bio_el.inner_text()).strip()
+                except Exception:
+                    pass
+
+                # Fallback: meta description sometimes has bio info
+                try:
+                    meta = await page.query_selector(
+                        'meta[property="og:description"]'
+                    )
+                    if meta:
+                        result["meta_description"] = (
+                            await meta.get_attribute("content") or ""
                         )
-                        if meta:
-                            result["meta_description"] = (
-                                await meta.get_attribute("content") or ""
-                            )
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
 
-                    # Screenshot of the viewport
+                # Screenshot of the viewport, only when the caller asked for one
+                if screenshot:
                     try:
                         result["screenshot_bytes"] = await page.screenshot(
                             full_page=False
                         )
                     except Exception:
                         pass
-
-                finally:
-                    await browser.close()
         except Exception:
             pass
 
@@ -95,19 +140,18 @@ class InstagramConnector(BaseConnector):
 
     @staticmethod
     def _extract_profile_data(raw: dict) -> dict[str, Any]:
-        """Turn raw page scrape into clean profile dict."""
+        """Turn raw page scrape into clean profile dict.
+
+        ``screenshot_ref`` starts empty; ``fetch`` fills it once the bytes are stored.
+        """
         title = raw.get("title", "")
         final_url = raw.get("final_url", "")
 
         # Detect login wall from title, URL redirect, or page content
-        hit_login_wall = (
-            any(kw in title for kw in _LOGIN_KEYWORDS)
-            or "accounts/login" in final_url
-        )
+        hit_login_wall = _is_login_wall(title, final_url)
 
         bio = raw.get("bio_text", "")
         meta_desc = raw.get("meta_description", "")
-        screenshot_bytes = raw.get("screenshot_bytes", b"")
 
         # If login wall, don't trust scraped data
         if hit_login_wall:
@@ -117,12 +161,12 @@ class InstagramConnector(BaseConnector):
             if meta_desc and "log in" not in meta_desc.lower():
                 bio = meta_desc
 
-        screenshot_b64 = ""
-        if screenshot_bytes and not hit_login_wall:
-            screenshot_b64 = base64.b64encode(screenshot_bytes).decode("utf-8")
-
         return {
             "bio": bio,
-            "screenshot_b64": screenshot_b64,
+            "screenshot_ref": "",
             "login_wall": hit_login_wall,
         }
+
+
+def _is_login_wall(title: str, final_url: str) -> bool:
+    return any(kw in title for kw in _LOGIN_KEYWORDS) or "accounts/login" in final_url
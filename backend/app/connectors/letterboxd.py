@@ -1,39 +1,154 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from xml.etree.ElementTree import ParseError, XMLPullParser
 
-import feedparser
 import httpx
 
+from app.config import settings
 from app.connectors.base import BaseConnector
+from app.services.cache import FRESH, STALE
+from app.services.etag_cache import ETagCache, get_letterboxd_feed_cache
+from app.services.http_clients import http_client
+
+logger = logging.getLogger(__name__)
 
 FEED_URL = "https://letterboxd.com/{username}/rss/"
+MAX_FILMS = 20
+
+# Parsing is CPU work; keep it off the shared default executor and bounded
+_PARSE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="letterboxd-rss")
+
+# Background revalidations: strong refs so tasks aren't collected mid-flight
+_revalidating: dict[str, asyncio.Task] = {}
+
+
+class FeedStreamParser:
+    """Incremental RSS parser that keeps only the first ``max_items`` items.
+
+    Produces the same entry dicts ``_extract_films`` reads from feedparser
+    (``title``, ``link``, ``letterboxd_memberrating``). Each finished
+    ``<item>`` is cleared so memory stays flat however long the feed is.
+    """
+
+    def __init__(self, max_items: int = MAX_FILMS) -> None:
+        self.max_items = max_items
+        self.entries: list[dict[str, str]] = []
+        self._parser = XMLPullParser(events=("end",))
+
+    @property
+    def done(self) -> bool:
+        return len(self.entries) >= self.max_items
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse one chunk; returns True once enough items have been read."""
+        self._parser.feed(chunk)
+        for _, elem in self._parser.read_events():
+            if elem.tag != "item":
+                continue
+            self.entries.append(self._entry(elem))
+            elem.clear()
+            if self.done:
+                break
+        return self.done
+
+    @staticmethod
+    def _entry(item) -> dict[str, str]:
+        entry: dict[str, str] = {}
+        for child in item:
+            name = child.tag.rsplit("}", 1)[-1]
+            text = (child.text or "").strip()
+            if name in ("title", "link"):
+                entry[name] = text
+            elif name == "memberRating" and child.tag.startswith("{"):
+                entry["letterboxd_memberrating"] = text
+        return entry
 
 
 class LetterboxdConnector(BaseConnector):
     """Fetch recent Letterboxd activity from a user's public RSS feed."""
 
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        feed_cache: ETagCache | None = None,
+    ) -> None:
+        self._client = client
+        self._feed_cache = feed_cache or get_letterboxd_feed_cache()
+
     async def fetch(self, identifier: str) -> dict[str, Any]:
         username = identifier.strip().lstrip("@")
-        feed_data = await self._fetch_feed(username)
         return {
-            "recent_films": self._extract_films(feed_data),
+            "recent_films": await self._recent_films(username),
         }
 
+    # ── feed cache ─────────────────────────────────────────────────
+
+    async def _recent_films(self, username: str) -> list[dict[str, Any]]:
+        """Serve from the feed cache: fresh as is, stale while refreshing in the background."""
+        cache = self._feed_cache
+        key = username.lower()
+        entry = await cache.lookup(key)
+        state = cache.freshness(entry, settings.letterboxd_feed_ttl, settings.letterboxd_feed_stale_ttl)
+        if state == FRESH:
+            cache.record_hit()
+            return entry["body"]
+        if state == STALE:
+            cache.record_hit()
+            if key not in _revalidating:
+                task = asyncio.create_task(self._revalidate_quietly(key, username, entry))
+                _revalidating[key] = task
+                task.add_done_callback(lambda _: _revalidating.pop(key, None))
+            return entry["body"]
+        return await self._revalidate(key, username, entry)
+
+    async def _revalidate(self, key: str, username: str, entry: dict | None) -> list[dict[str, Any]]:
+        cache = self._feed_cache
+        resp, feed_data = await self._fetch_feed(username, cache.validators(entry))
+        if resp.status_code == 304 and entry is not None:
+            cache.record_hit()
+            await cache.touch(key, entry, ttl=self._entry_ttl())
+            return entry["body"]
+        cache.record_miss()
+        films = self._extract_films(feed_data)
+        if resp.status_code == 200:
+            await cache.store(key, resp, films, ttl=self._entry_ttl())
+        return films
+
+    async def _revalidate_quietly(self, key: str, username: str, entry: dict) -> None:
+        try:
+            await self._revalidate(key, username, entry)
+        except Exception:
+            logger.warning("Background refresh of Letterboxd feed for %s failed", username, exc_info=True)
+
+    @staticmethod
+    def _entry_ttl() -> float | None:
+        return (settings.letterboxd_feed_ttl + settings.letterboxd_feed_stale_ttl) or None
+
     # ── data fetching ──────────────────────────────────────────────
 
-    async def _fetch_feed(self, username: str) -> dict:
+    async def _fetch_feed(
+        self, username: str, headers: dict[str, str] | None = None
+    ) -> tuple[httpx.Response, dict]:
         url = FEED_URL.format(username=username)
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(url)
-            if resp.status_code == 404:
-                return {}
-            resp.raise_for_status()
-        # feedparser is sync, run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, feedparser.parse, resp.text)
+        parser = FeedStreamParser()
+        loop = asyncio.get_running_loop()
+        async with http_client("letterboxd", self._client) as client:
+            async with client.stream("GET", url, headers=headers) as resp:
+                if resp.status_code in (304, 404):
+                    return resp, {}
+                resp.raise_for_status()
+                try:
+                    async for chunk in resp.aiter_bytes():
+                        if await loop.run_in_executor(_PARSE_POOL, parser.feed, chunk):
+                            break  # leaving the block drops the rest of the body
+                except ParseError as exc:
+                    logger.warning("Malformed Letterboxd feed for %s: %s", username, exc)
+        return resp, {"entries": parser.entries}
 
     # ── data extraction ────────────────────────────────────────────
 
@@ -41,7 +156,7 @@ class LetterboxdConnector(BaseConnector):
     def _extract_films(feed: dict) -> list[dict[str, Any]]:
         entries = feed.get("entries", [])
         films: list[dict[str, Any]] = []
-        for entry in entries[:20]:
+        for entry in entries[:MAX_FILMS]:
             title_raw = entry.get("title", "")
             link = entry.get("link", "")
             rating = LetterboxdConnector._parse_rating(entry)
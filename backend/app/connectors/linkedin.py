@@ -3,9 +3,9 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-from playwright.async_api import async_playwright
-
 from app.connectors.base import BaseConnector
+from app.connectors.static_page import fetch_html, meta_content, page_title, parse_html, select_text
+from app.services.browser_pool import BrowserPool, open_page
 
 PROFILE_URL = "https://www.linkedin.com/in/{username}/"
 USER_AGENT = (
@@ -20,6 +20,9 @@ _AUTH_WALL_KEYWORDS = ("Sign In", "Sign Up", "Login", "Join LinkedIn", "authwall
 class LinkedInConnector(BaseConnector):
     """Scrape a public LinkedIn profile for basic info."""
 
+    def __init__(self, browser_pool: BrowserPool | None = None) -> None:
+        self._browser_pool = browser_pool
+
     async def fetch(self, identifier: str) -> dict[str, Any]:
         username = identifier.strip().lstrip("@")
         page_content = await self._fetch_profile(username)
@@ -28,7 +31,42 @@ class LinkedInConnector(BaseConnector):
     # ── data fetching ──────────────────────────────────────────────
 
     async def _fetch_profile(self, username: str) -> dict:
-        """Launch headless browser and grab raw page data.
+        """Try a plain HTTP fetch first; fall back to the browser on an auth wall or empty page."""
+        raw = await self._fetch_profile_http(username)
+        if raw and not self._needs_browser(raw):
+            return raw
+        return await self._fetch_profile_browser(username)
+
+    async def _fetch_profile_http(self, username: str) -> dict:
+        url = PROFILE_URL.format(username=username)
+        try:
+            final_url, html = await fetch_html(url, USER_AGENT, "linkedin")
+        except Exception:
+            return {}
+        if not html:
+            return {}
+        return self._parse_profile_html(html, final_url)
+
+    @staticmethod
+    def _parse_profile_html(html: str, final_url: str) -> dict:
+        """Build the same raw dict the browser tier produces from static HTML."""
+        soup = parse_html(html)
+        return {
+            "name_text": select_text(soup, "h1"),
+            "meta_description": meta_content(soup, name="description"),
+            "title": page_title(soup),
+            "headline_text": select_text(soup, ".top-card-layout__headline"),
+            "final_url": final_url,
+        }
+
+    @staticmethod
+    def _needs_browser(raw: dict) -> bool:
+        if _is_auth_wall(raw.get("title", ""), raw.get("name_text", ""), raw.get("final_url", "")):
+            return True
+        return not (raw.get("name_text") or raw.get("meta_description") or raw.get("headline_text"))
+
+    async def _fetch_profile_browser(self, username: str) -> dict:
+        """Load the profile in a pooled headless browser and grab raw page data.
 
         Returns a dict with raw extracted fields; empty strings on failure.
         """
@@ -42,55 +80,48 @@ class LinkedInConnector(BaseConnector):
         }
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(user_agent=USER_AGENT)
-                page = await context.new_page()
+            async with open_page(USER_AGENT, self._browser_pool) as page:
+                # Use networkidle to wait for redirects to settle
+                try:
+                    await page.goto(url, wait_until="networkidle", timeout=15000)
+                except Exception:
+                    pass
+
+                # Give redirects a moment to settle
+                await asyncio.sleep(1)
+
+                result["final_url"] = page.url
+                result["title"] = await page.title()
+
+                # Name — usually in h1
                 try:
-                    # Use networkidle to wait for redirects to settle
-                    try:
-                        await page.goto(url, wait_until="networkidle", timeout=15000)
-                    except Exception:
-                        pass
-
-                    # Give redirects a moment to settle
-                    await asyncio.sleep(1)
-
-                    result["final_url"] = page.url
-                    result["title"] = await page.title()
-
-                    # Name — usually in h1
-                    try:
-                        name_el = await page.wait_for_selector("h1", timeout=5000)
-                        if name_el:
-                            result["name_text"] = (await name_el.inner_text()).strip()
-                    except Exception:
-                        pass
-
-                    # Meta description often contains the bio/headline
-                    try:
-                        meta = await page.query_selector('meta[name="description"]')
-                        if meta:
-                            result["meta_description"] = (
-                                await meta.get_attribute("content") or ""
-                            )
-                    except Exception:
-                        pass
-
-                    # Headline — the text right below the name
-                    try:
-                        headline_el = await page.query_selector(
-                            ".top-card-layout__headline"
+                    name_el = await page.wait_for_selector("h1", timeout=5000)
+                    if name_el:
+                        result["name_text"] = (await name_el.inner_text()).strip()
+                except Exception:
+                    pass
+
+                # Meta description often contains the bio/headline
+                try:
+                    meta = await page.query_selector('meta[name="description"]')
+                    if meta:
+                        result["meta_description"] = (
+                            await meta.get_attribute("content") or ""
                         )
-                        if headline_el:
-                            result["headline_text"] = (
-                                await headline_el.inner_text()
-                            ).strip()
-                    except Exception:
-                        pass
-
-                finally:
-                    await browser.close()
+                except Exception:
+                    pass
+
+                # Headline — the text right below the name
+                try:
+                    headline_el = await page.query_selector(
+                        ".top-card-layout__headline"
+                    )
+                    if headline_el:
+                        result["headline_text"] = (
+                            await headline_el.inner_text()
+                        ).strip()
+                except Exception:
+                    pass
         except Exception:
             pass
 
@@ -105,11 +136,7 @@ class LinkedInConnector(BaseConnector):
         final_url = raw.get("final_url", "")
 
         # Detect auth wall from title, h1 text, or redirect URL
-        hit_login_wall = (
-            any(kw in title for kw in _AUTH_WALL_KEYWORDS)
-            or any(kw in raw.get("name_text", "") for kw in ("Join LinkedIn", "Sign"))
-            or "authwall" in final_url
-        )
+        hit_login_wall = _is_auth_wall(title, raw.get("name_text", ""), final_url)
 
         name = raw.get("name_text", "")
         meta = raw.get("meta_description", "")
@@ -135,3 +162,11 @@ class LinkedInConnector(BaseConnector):
             "about": about,
             "login_wall": hit_login_wall,
         }
+
+
+def _is_auth_wall(title: str, name_text: str, final_url: str) -> bool:
+    return (
+        any(kw in title for kw in _AUTH_WALL_KEYWORDS)
+        or any(kw in name_text for kw in ("Join LinkedIn", "Sign"))
+        or "authwall" in final_url
+    )
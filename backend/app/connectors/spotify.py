@@ -1,37 +1,49 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from collections import Counter
 from typing import Any
 
 import httpx
 
 from app.connectors.base import BaseConnector
+from app.services.http_clients import http_client
+from app.services.spotify_catalog import SpotifyCatalog, get_spotify_catalog
 
-API_BASE = "https://api.spotify.com/v1"
+logger = logging.getLogger(__name__)
 
 
 class SpotifyConnector(BaseConnector):
     """Fetch Spotify listening profile using an OAuth access token."""
 
-    def __init__(self, access_token: str) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        client: httpx.AsyncClient | None = None,
+        catalog: SpotifyCatalog | None = None,
+    ) -> None:
         self.access_token = access_token
+        self._client = client
+        self._catalog = catalog or get_spotify_catalog()
 
     async def fetch(self, identifier: str = "") -> dict[str, Any]:
-        async with httpx.AsyncClient(
-            base_url=API_BASE,
-            headers={"Authorization": f"Bearer {self.access_token}"},
-            timeout=15,
-        ) as client:
+        # The client is shared across users, so the token travels per request
+        async with http_client("spotify", self._client) as client:
             artists, tracks, recent = await asyncio.gather(
                 self._fetch_top_artists(client),
                 self._fetch_top_tracks(client),
                 self._fetch_recently_played(client),
             )
+            played = [*tracks.get("items", []), *(i["track"] for i in recent.get("items", []) if i.get("track"))]
+            track_artists = await self._track_artists(client, artists, played)
+
+        # Full artists we were sent anyway; other users' track lookups read them from the catalog
+        self._catalog.remember_in_background(artists.get("items", []))
 
         return {
             "top_artists": self._extract_artists(artists),
-            "top_genres": self._extract_top_genres(artists),
+            "top_genres": self._extract_top_genres(artists, track_artists),
             "top_tracks": self._extract_tracks(tracks),
             "listening_hours": self._extract_listening_hours(recent),
         }
@@ -40,7 +52,9 @@ class SpotifyConnector(BaseConnector):
 
     async def _fetch_top_artists(self, client: httpx.AsyncClient) -> dict:
         resp = await client.get(
-            "/me/top/artists", params={"limit": 50, "time_range": "medium_term"}
+            "/me/top/artists",
+            params={"limit": 50, "time_range": "medium_term"},
+            headers=self._auth_headers(),
         )
         if resp.status_code == 401:
             raise PermissionError("Spotify token expired or invalid")
@@ -49,7 +63,9 @@ class SpotifyConnector(BaseConnector):
 
     async def _fetch_top_tracks(self, client: httpx.AsyncClient) -> dict:
         resp = await client.get(
-            "/me/top/tracks", params={"limit": 50, "time_range": "medium_term"}
+            "/me/top/tracks",
+            params={"limit": 50, "time_range": "medium_term"},
+            headers=self._auth_headers(),
         )
         if resp.status_code == 401:
             raise PermissionError("Spotify token expired or invalid")
@@ -57,12 +73,35 @@ class SpotifyConnector(BaseConnector):
         return resp.json()
 
     async def _fetch_recently_played(self, client: httpx.AsyncClient) -> dict:
-        resp = await client.get("/me/player/recently-played", params={"limit": 50})
+        resp = await client.get(
+            "/me/player/recently-played", params={"limit": 50}, headers=self._auth_headers()
+        )
         if resp.status_code == 401:
             raise PermissionError("Spotify token expired or invalid")
         resp.raise_for_status()
         return resp.json()
 
+    async def _track_artists(
+        self, client: httpx.AsyncClient, artists: dict, played: list[dict]
+    ) -> list[dict[str, Any]]:
+        """Catalog records for the artists of ``played``, one per play, skipping top artists.
+
+        Track objects only name their artists, so their genres come from the
+        shared catalog, which fetches just the artists no user has brought in yet.
+        """
+        known = {a.get("id") for a in artists.get("items", [])}
+        ids = [a["id"] for t in played for a in t.get("artists", []) if a.get("id") and a["id"] not in known]
+        if not ids:
+            return []
+        try:
+            return await self._catalog.artists(client, ids, self._auth_headers())
+        except httpx.HTTPError:
+            logger.warning("Resolving %d track artists failed; genres from top artists only", len(ids), exc_info=True)
+            return []
+
+    def _auth_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
     # ── data extraction ───────────────────────────────────────────
 
     @staticmethod
@@ -77,9 +116,9 @@ class SpotifyConnector(BaseConnector):
         ]
 
     @staticmethod
-    def _extract_top_genres(data: dict) -> list[str]:
+    def _extract_top_genres(data: dict, track_artists: list[dict] | None = None) -> list[str]:
         counts: Counter[str] = Counter()
-        for a in data.get("items", []):
+        for a in [*data.get("items", []), *(track_artists or [])]:
             for g in a.get("genres", []):
                 counts[g] += 1
         return [g for g, _ in counts.most_common(20)]
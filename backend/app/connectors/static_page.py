@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import httpx
+from bs4 import BeautifulSoup
+
+from app.services.http_clients import http_client
+
+
+async def fetch_html(
+    url: str, user_agent: str, host: str, client: httpx.AsyncClient | None = None
+) -> tuple[str, str]:
+    """Plain GET of a profile page. Returns (final_url, html); empty html on non-200."""
+    headers = {"User-Agent": user_agent, "Accept-Language": "en-US,en;q=0.9"}
+    async with http_client(host, client) as c:
+        resp = await c.get(url, headers=headers, follow_redirects=True)
+    if resp.status_code != 200:
+        return str(resp.url), ""
+    return str(resp.url), resp.text
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "html.parser")
+
+
+def meta_content(soup: BeautifulSoup, *, prop: str | None = None, name: str | None = None) -> str:
+    attrs = {"property": prop} if prop else {"name": name}
+    tag = soup.find("meta", attrs=attrs)
+    return (tag.get("content") or "").strip() if tag else ""
+
+
+def page_title(soup: BeautifulSoup) -> str:
+    return soup.title.get_text(strip=True) if soup.title else ""
+
+
+def select_text(soup: BeautifulSoup, selector: str) -> str:
+    el = soup.select_one(selector)
+    return el.get_text(" ", strip=True) if el else ""
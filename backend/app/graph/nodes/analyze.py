@@ -3,11 +3,11 @@ from __future__ import annotations
 import asyncio
 
 from app.models.state import PipelineState
-from app.services.llm import LLMService
+from app.services.llm import get_llm_service
 
 
 async def analyze_node(state: PipelineState) -> dict:
-    llm = LLMService()
+    llm = get_llm_service()
 
     raw_a = state.get("user_a", {}).get("raw_data", {})
     raw_b = state.get("user_b", {}).get("raw_data", {})
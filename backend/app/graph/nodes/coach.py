@@ -1,36 +1,57 @@
 from __future__ import annotations
 
-from app.models.state import PipelineState
-
+import asyncio
 
-from app.services.llm import LLMService
+from app.config import settings
+from app.models.state import PipelineState
+from app.services.llm import get_llm_service
+from app.services.metrics import metrics
+from app.services.pair_context import coaching_view
 
 
 async def coach_node(state: PipelineState) -> dict:
-    llm = LLMService()
+    llm = get_llm_service()
 
     cross_ref = state.get("cross_ref", {})
     user_a_dossier = state.get("user_a", {}).get("dossier", {})
     user_b_dossier = state.get("user_b", {}).get("dossier", {})
     venues = state.get("venues", [])
+    pair_context = state.get("pair_context")
+    labels = list(pair_context["people"]) if pair_context else [None, None]
 
     # If venues were suggested, pick the top one as context
     selected_venue = venues[0] if venues else None
 
-    # Generate briefing for User A (how to talk to B)
-    briefing_a = await llm.generate_coaching(
-        target_user=user_a_dossier,
-        other_user=user_b_dossier,
-        cross_ref=cross_ref,
-        venue=selected_venue
-    )
-
-    # Generate briefing for User B (how to talk to A)
-    briefing_b = await llm.generate_coaching(
-        target_user=user_b_dossier,
-        other_user=user_a_dossier,
-        cross_ref=cross_ref,
-        venue=selected_venue
+    # Both briefings from one call, so the dossiers and crossref are sent once
+    if settings.coaching_mode == "dual":
+        briefings = await llm.generate_dual_coaching(
+            user_a_dossier,
+            user_b_dossier,
+            cross_ref,
+            selected_venue,
+            context=coaching_view(pair_context) if pair_context else None,
+        )
+        if briefings is not None:
+            briefing_a, briefing_b = briefings
+            return {"coaching_a": briefing_a, "coaching_b": briefing_b}
+        metrics.incr("coaching.dual_fallback")
+
+    # One briefing per user (A on talking to B, B on talking to A), run concurrently
+    briefing_a, briefing_b = await asyncio.gather(
+        llm.generate_coaching(
+            target_user=user_a_dossier,
+            other_user=user_b_dossier,
+            cross_ref=cross_ref,
+            venue=selected_venue,
+            context=coaching_view(pair_context, target=labels[0]) if pair_context else None,
+        ),
+        llm.generate_coaching(
+            target_user=user_b_dossier,
+            other_user=user_a_dossier,
+            cross_ref=cross_ref,
+            venue=selected_venue,
+            context=coaching_view(pair_context, target=labels[1]) if pair_context else None,
+        ),
     )
 
     return {
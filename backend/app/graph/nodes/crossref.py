@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 from app.models.state import PipelineState
-from app.services.llm import LLMService
+from app.services.llm import get_llm_service
+from app.services.pair_context import build_pair_context, with_crossref
 
 
 async def crossref_node(state: PipelineState) -> dict:
-    llm = LLMService()
+    llm = get_llm_service()
 
     dossier_a = state.get("user_a", {}).get("dossier", {})
     dossier_b = state.get("user_b", {}).get("dossier", {})
 
-    cross_ref, venue_appropriate = await llm.cross_reference(dossier_a, dossier_b)
+    # Built once here and reused by the venue and coach nodes instead of the full dossiers
+    pair_context = build_pair_context(dossier_a, dossier_b)
+    cross_ref, venue_appropriate = await llm.cross_reference(dossier_a, dossier_b, context=pair_context)
 
-    return {"cross_ref": cross_ref, "include_venue": venue_appropriate}
+    return {
+        "cross_ref": cross_ref,
+        "include_venue": venue_appropriate,
+        "pair_context": with_crossref(pair_context, cross_ref),
+    }
@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 from app.connectors import (
+    BooksConnector,
     GitHubConnector,
     LetterboxdConnector,
     InstagramConnector,
     LinkedInConnector,
 )
+from app.connectors.books import titles_identifier
+from app.config import settings
 from app.models.state import PipelineState, UserDataBundle
+from app.services.connector_cache import ConnectorCache, get_connector_cache
+from app.services.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -20,51 +25,96 @@ CONNECTOR_MAP: dict[str, type] = {
     "letterboxd": LetterboxdConnector,
     "instagram": InstagramConnector,
     "linkedin": LinkedInConnector,
+    "books": BooksConnector,
 }
 
 
-async def _fetch_one(service: str, identifier: str) -> tuple[str, dict[str, Any]]:
-    """Fetch data from a single connector, returning (service, data)."""
+# One in-flight connector run per (service, identifier), shared by concurrent requests.
+# Runs outlive callers that give up on them, so late results still backfill the cache.
+_flights = SingleFlight("connector")
+
+
+async def _run_connector(service: str, identifier: str) -> dict[str, Any]:
+    """Run one connector through the connector cache; failures come back empty."""
     try:
-        connector_cls = CONNECTOR_MAP.get(service)
-        if not connector_cls:
-            logger.warning("No connector for service: %s", service)
-            return service, {}
-        connector = connector_cls()
-        data = await connector.fetch(identifier)
-        # Strip screenshot_b64 from instagram — too large for LLM
-        if service == "instagram":
-            data.pop("screenshot_b64", None)
-        return service, data
+        data = await get_connector_cache().fetch(
+            service, identifier, lambda: CONNECTOR_MAP[service]().fetch(identifier)
+        )
     except Exception:
         logger.exception("Connector %s failed for %s", service, identifier)
+        return {}
+    # A screenshot reference means nothing to the LLM; copy, the cache owns ``data``
+    if service == "instagram":
+        data = {k: v for k, v in data.items() if k != "screenshot_ref"}
+    return data
+
+
+async def _fetch_one(service: str, identifier: str) -> tuple[str, dict[str, Any]]:
+    """Fetch data from a single connector, returning (service, data).
+
+    Goes through the connector cache, and concurrent requests for the same
+    account share one run. On a miss the connector gets
+    ``settings.connector_timeouts[service]`` seconds; if it runs over, this
+    returns empty data but the fetch carries on and caches its result for
+    the next request.
+    """
+    if service not in CONNECTOR_MAP:
+        logger.warning("No connector for service: %s", service)
         return service, {}
 
+    key = ConnectorCache.key(service, identifier)
+    try:
+        data = await asyncio.wait_for(
+            _flights.do(key, lambda: _run_connector(service, identifier)),
+            settings.connector_timeouts.get(service),
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Connector %s timed out for %s; result will backfill the cache", service, identifier)
+        return service, {}
+    return service, data
 
-async def _fetch_user_data(identifiers: dict[str, str | None]) -> UserDataBundle:
-    """Run all non-null connectors in parallel for a user."""
-    tasks = []
-    for service, identifier in identifiers.items():
-        if identifier:
-            tasks.append(_fetch_one(service, identifier))
 
-    if not tasks:
-        return {}
+async def _iter_user_data(identifiers: dict[str, str | None]) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """Yield (service, data) for each non-null connector as soon as it finishes.
+
+    Stops at ``settings.ingest_deadline``; connectors still running then are
+    cancelled here but keep backfilling the cache (see ``_fetch_one``).
+    """
+    tasks = [
+        asyncio.create_task(_fetch_one(service, identifier))
+        for service, identifier in identifiers.items()
+        if identifier
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=settings.ingest_deadline):
+            yield await next_done
+    except asyncio.TimeoutError:
+        pending = sum(not t.done() for t in tasks)
+        logger.warning("Ingest deadline hit with %d connector(s) still running", pending)
+    finally:
+        for task in tasks:
+            task.cancel()  # the shielded connector run keeps going
+
+
+async def _fetch_user_data(identifiers: dict[str, str | None]) -> UserDataBundle:
+    """Run all non-null connectors in parallel for a user.
 
-    results = await asyncio.gather(*tasks)
-    bundle: dict[str, Any] = {}
-    for service, data in results:
+    Returns whatever has finished by ``settings.ingest_deadline``.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    async for service, data in _iter_user_data(identifiers):
         if data:
-            bundle[service] = data
-    return bundle
+            results[service] = data
+    return {service: results[service] for service in identifiers if service in results}
 
 
 async def ingest_node(state: PipelineState) -> dict:
     user_a = state.get("user_a", {})
     user_b = state.get("user_b", {})
 
-    ids_a = user_a.get("identifiers", {})
-    ids_b = user_b.get("identifiers", {})
+    # The reading list rides along as the "books" identifier
+    ids_a = {**user_a.get("identifiers", {}), "books": titles_identifier(user_a.get("book_titles"))}
+    ids_b = {**user_b.get("identifiers", {}), "books": titles_identifier(user_b.get("book_titles"))}
 
     raw_a, raw_b = await asyncio.gather(
         _fetch_user_data(ids_a),
@@ -1,31 +1,65 @@
 from __future__ import annotations
 
+import asyncio
+
+from app.config import settings
 from app.models.state import PipelineState
-from app.services.llm import LLMService
-from app.services.places import PlacesService
+from app.services.dossier_store import fingerprint
+from app.services.llm import VENUE_PROMPT_VERSION, get_llm_service
+from app.services.llm_router import resolve_tier
+from app.services.pair_cache import PairCache, get_pair_cache
+from app.services.pair_context import context_mode, venue_view
+from app.services.places import PlacesService, location_bucket
 
 
 async def venue_node(state: PipelineState) -> dict:
-    llm = LLMService()
-    places = PlacesService()
-
     cross_ref = state.get("cross_ref", {})
+    # What the venue prompts read: the run's compact pair context if crossref_node built one
+    pair_context = state.get("pair_context")
+    context = venue_view(pair_context) if pair_context else cross_ref
     # Use user_b's location as a default bias, or user_a's if B's is missing
     location = state.get("user_b", {}).get("location") or state.get("user_a", {}).get("location")
 
+    dossier_a = state.get("user_a", {}).get("dossier")
+    dossier_b = state.get("user_b", {}).get("dossier")
+    if not dossier_a or not dossier_b:
+        return {"venues": await _suggest_venues(context, location)}
+
+    # The prompts' input is part of the key: it carries the crossref, and names people
+    # in this request's order, so the picks' reasons and tips are only reused for the same view
+    key = PairCache.key(
+        "venues",
+        fingerprint(dossier_a),
+        fingerprint(dossier_b),
+        fingerprint(context),
+        location_bucket(location),
+        context_mode(pair_context),
+        resolve_tier("brainstorm_venue_queries").key,
+        resolve_tier("rank_venues").key,
+        VENUE_PROMPT_VERSION,
+    )
+    return {"venues": await get_pair_cache().get_or_compute(key, lambda: _suggest_venues(context, location))}
+
+
+async def _suggest_venues(context: dict, location: str | None) -> list[dict]:
+    llm = get_llm_service()
+    places = PlacesService()
+
     # 1. Brainstorm creative ideas and search queries
-    suggested_queries = await llm.brainstorm_venue_queries(cross_ref)
+    suggested_queries = await llm.brainstorm_venue_queries(context)
 
-    # 2. Search for real-world candidates based on those queries
-    candidates = []
-    for q in suggested_queries:
-        query_text = q.get("search_query") or q.get("name")
-        real_places = await places.search_venue(query_text, location=location)
-        
-        # Take up to 5 matches per query as candidates
-        candidates.extend(real_places[:5])
+    # 2. Search for real-world candidates based on those queries, a few at a time
+    sem = asyncio.Semaphore(settings.places_max_concurrency)
 
-    # 3. Rank the candidates and contextualize them for the match
-    final_venues = await llm.rank_venues(candidates, cross_ref)
+    async def search(query_text: str) -> list[dict]:
+        async with sem:
+            return await places.search_venue(query_text, location=location)
 
-    return {"venues": final_venues}
+    query_texts = [q.get("search_query") or q.get("name") for q in suggested_queries]
+    results = await asyncio.gather(*(search(q) for q in query_texts if q))
+
+    # Take up to 5 matches per query as candidates
+    candidates = [place for real_places in results for place in real_places[:5]]
+
+    # 3. Rank the candidates and contextualize them for the match
+    return await llm.rank_venues(candidates, context)
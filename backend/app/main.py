@@ -3,21 +3,25 @@ import json
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 from sse_starlette.sse import EventSourceResponse
 
 from app.config import settings
 from app.connectors import (
+    BooksConnector,
     GitHubConnector,
     LetterboxdConnector,
     InstagramConnector,
     LinkedInConnector,
 )
+from app.connectors.books import titles_identifier
 from app.graph.builder import build_graph
-from app.graph.nodes.ingest import _fetch_user_data
+from app.graph.nodes.ingest import _fetch_user_data, _iter_user_data
 from app.models.schemas import (
     MatchRequest,
     CoachingResponse,
@@ -32,13 +36,38 @@ from app.models.schemas import (
     ProfileResponse,
     UserInput,
 )
-from app.services.findings import generate_findings
-from app.services.llm import LLMService
+from app.services.blobs import get_blob_store
+from app.services.browser_pool import BrowserPool, set_browser_pool
+from app.services.connector_cache import get_connector_cache
+from app.services.findings import generate_findings, source_findings
+from app.services.http_clients import HTTPClientRegistry, set_http_registry
+from app.services.metrics import metrics
+from app.services.llm import LLMService, get_llm_service, set_llm_service
 from app.services.preview import generate_preview
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Starstruck", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    http_registry = HTTPClientRegistry()
+    set_http_registry(http_registry)
+    browser_pool = BrowserPool.from_settings()
+    await browser_pool.start()
+    set_browser_pool(browser_pool)
+    # One Gemini client for the whole process instead of one per request
+    set_llm_service(LLMService())
+    try:
+        yield
+    finally:
+        set_llm_service(None)
+        set_browser_pool(None)
+        await browser_pool.stop()
+        set_http_registry(None)
+        await http_registry.aclose()
+
+
+app = FastAPI(title="Starstruck", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,13 +78,14 @@ app.add_middleware(
 )
 
 pipeline = build_graph()
-llm_service = LLMService()
 
 CONNECTOR_MAP: dict[str, type] = {
     "github": GitHubConnector,
     "letterboxd": LetterboxdConnector,
     "instagram": InstagramConnector,
     "linkedin": LinkedInConnector,
+    # /api/connect takes the reading list as "username", one title per line
+    "books": BooksConnector,
 }
 
 
@@ -64,6 +94,11 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    return metrics.snapshot()
+
+
 # ── New frontend-facing endpoints ─────────────────────────────
 
 
@@ -76,34 +111,98 @@ async def connect_service(request: ConnectRequest):
 
     try:
         connector = connector_cls()
-        data = await connector.fetch(request.username)
+        cache = get_connector_cache()
+        # Only Instagram can capture a screenshot, and only when asked; never serve that from cache
+        if request.screenshot and request.service == "instagram":
+            data = await connector.fetch(request.username, screenshot=True)
+            if data:
+                await cache.set(request.service, request.username, data)
+        else:
+            # Same cache /api/analyze reads, so analyzing right after connecting doesn't refetch
+            data = await cache.fetch(request.service, request.username, lambda: connector.fetch(request.username))
         preview = generate_preview(request.service, data)
-        return ConnectResponse(success=True, preview=preview)
+        return ConnectResponse(
+            success=True, preview=preview, screenshot_ref=data.get("screenshot_ref") or None
+        )
     except Exception:
         logger.exception("Connector %s failed", request.service)
         return ConnectResponse(success=True, preview="Connected (limited data)")
 
 
-@app.post("/api/analyze", response_model=AnalysisResult)
-async def analyze_user(request: AnalyzeRequest):
-    """Run all connectors + LLM analysis for one user."""
-    raw_data = await _fetch_user_data(request.identifiers)
+@app.get("/api/screenshots/{digest}")
+async def get_screenshot(digest: str):
+    """Stream a stored screenshot by the ``screenshot_ref`` /api/connect returned."""
+    path = get_blob_store().path(digest)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Screenshot not found")
+    # Content-addressed, so the bytes behind a digest never change
+    return FileResponse(
+        path, media_type="image/png", headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
 
-    llm = LLMService()
-    dossier = await llm.profile_analysis(raw_data)
 
-    public = dossier.get("public", {})
-    findings = generate_findings(dossier, raw_data)
+def _analyze_identifiers(request: AnalyzeRequest) -> dict[str, str | None]:
+    return {**request.identifiers, "books": titles_identifier(request.book_titles)}
 
+
+def _analysis_result(dossier: dict, raw_data: dict) -> AnalysisResult:
+    public = dossier.get("public", {})
     return AnalysisResult(
         bio=public.get("vibe", ""),
-        findings=findings,
+        findings=generate_findings(dossier, raw_data),
         tags=public.get("tags", []),
         schedule=public.get("schedule_pattern", "mixed"),
         dossier=dossier,
     )
 
 
+@app.post("/api/analyze", response_model=AnalysisResult)
+async def analyze_user(request: AnalyzeRequest):
+    """Run all connectors + LLM analysis for one user."""
+    raw_data = await _fetch_user_data(_analyze_identifiers(request))
+
+    llm = get_llm_service()
+    dossier = await llm.profile_analysis(raw_data)
+
+    return _analysis_result(dossier, raw_data)
+
+
+@app.post("/api/analyze/stream")
+async def analyze_user_stream(request: AnalyzeRequest):
+    """Streaming /api/analyze: a ``connector`` event as each source finishes, then
+    ``dossier_partial`` events as the analysis streams in, then ``dossier``."""
+    identifiers = _analyze_identifiers(request)
+
+    async def event_generator():
+        raw_data: dict[str, Any] = {}
+        async for service, data in _iter_user_data(identifiers):
+            if data:
+                raw_data[service] = data
+            yield {
+                "event": "connector",
+                "data": json.dumps({
+                    "service": service,
+                    "success": bool(data),
+                    "preview": generate_preview(service, data),
+                    "findings": source_findings(service, data) if data else [],
+                }),
+            }
+
+        # Same order as the non-streaming bundle, so the LLM sees the same input
+        raw_data = {s: raw_data[s] for s in identifiers if s in raw_data}
+        llm = get_llm_service()
+        # Hold one back: every dossier but the last is partial
+        dossier = None
+        async for latest in llm.stream_profile_analysis(raw_data):
+            if dossier is not None:
+                yield {"event": "dossier_partial", "data": _analysis_result(dossier, raw_data).model_dump_json()}
+            dossier = latest
+        yield {"event": "dossier", "data": _analysis_result(dossier or {}, raw_data).model_dump_json()}
+        yield {"event": "done", "data": "{}"}
+
+    return EventSourceResponse(event_generator())
+
+
 @app.post("/api/match", response_model=MatchResult)
 async def match_users(request: MatchInput):
     """Run full pipeline for two users: ingest → analyze → crossref."""
@@ -114,7 +213,7 @@ async def match_users(request: MatchInput):
     )
 
     # Analyze both in parallel
-    llm = LLMService()
+    llm = get_llm_service()
     dossier_a, dossier_b = await asyncio.gather(
         llm.profile_analysis(raw_a),
         llm.profile_analysis(raw_b),
@@ -176,7 +275,7 @@ def _build_identifiers(user: Any) -> dict[str, str | None]:
 
 @app.post("/profile", response_model=ProfileResponse)
 async def analyze_profile(request: UserInput):
-    llm = LLMService()
+    llm = get_llm_service()
     
     raw_data = {}
     if request.letterboxd_username:
@@ -244,7 +343,7 @@ async def stream_pipeline(request: MatchRequest):
 
 @app.post("/coach/chat", response_model=CoachChatResponse)
 async def coach_chat(request: CoachChatRequest):
-    reply = await llm_service.coach_chat(
+    reply = await get_llm_service().coach_chat(
         dossier_a=request.user_a_dossier,
         dossier_b=request.user_b_dossier,
         crossref=request.crossref,
@@ -58,15 +58,18 @@ class CoachChatResponse(BaseModel):
 class ConnectRequest(BaseModel):
     service: str
     username: str
+    screenshot: bool = False
 
 
 class ConnectResponse(BaseModel):
     success: bool
     preview: str
+    screenshot_ref: str | None = None
 
 
 class AnalyzeRequest(BaseModel):
     identifiers: dict[str, str | None]
+    book_titles: list[str] | None = None
 
 
 class AnalysisResult(BaseModel):
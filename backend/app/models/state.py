@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 from typing_extensions import TypedDict
 
 
@@ -17,10 +17,31 @@ class UserDataBundle(TypedDict, total=False):
 class UserProfile(TypedDict, total=False):
     username: str
     identifiers: dict[str, str | None]
+    book_titles: list[str]
+    location: str | None
     raw_data: UserDataBundle
     dossier: dict[str, Any]
 
 
+class DossierPublic(TypedDict, total=False):
+    vibe: str
+    tags: list[str]
+    schedule_pattern: Literal["night_owl", "early_bird", "mixed"]
+
+
+class DossierPrivate(TypedDict, total=False):
+    summary: str
+    traits: list[str]
+    interests: list[str]
+    deep_cuts: list[str]
+
+
+class Dossier(TypedDict, total=False):
+    public: DossierPublic
+    private: DossierPrivate
+    data_sources: list[str]
+
+
 class CrossRefResult(TypedDict, total=False):
     shared: list[dict[str, Any]]
     complementary: list[dict[str, Any]]
@@ -47,6 +68,8 @@ class PipelineState(TypedDict, total=False):
     user_a: UserProfile
     user_b: UserProfile
     cross_ref: CrossRefResult
+    # Compact, deduplicated view of both dossiers plus the crossref, built by crossref_node
+    pair_context: dict[str, Any]
     venues: list[VenueRecommendation]
     coaching_a: CoachingBriefing
     coaching_b: CoachingBriefing
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from app.config import settings
+from app.services.metrics import metrics
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobStore:
+    """Content-addressed files on local disk, named by their sha256.
+
+    Identical content is stored once; a digest handed out by ``put`` can be
+    served straight from ``path`` without loading it into memory.
+
+    With ``max_bytes`` set, each new blob evicts the least recently put
+    ones until the store fits, so an old digest can stop resolving; callers
+    treat a missing blob like any other expired reference.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = 0) -> None:
+        self._root = Path(root)
+        self._max_bytes = max_bytes
+
+    async def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            # Putting it again counts as use, so eviction leaves it for later
+            await asyncio.to_thread(os.utime, path)
+        else:
+            await asyncio.to_thread(self._write, path, data)
+            if self._max_bytes:
+                await asyncio.to_thread(self._evict, path)
+        return digest
+
+    def path(self, digest: str) -> Path | None:
+        """Location of a stored blob, or None for unknown or malformed digests."""
+        if not _DIGEST.match(digest):
+            return None
+        path = self._path(digest)
+        return path if path.is_file() else None
+
+    def _path(self, digest: str) -> Path:
+        return self._root / digest[:2] / digest
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp name, so concurrent puts of the same content don't share one
+        tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False)
+        try:
+            with tmp:
+                tmp.write(data)
+            os.replace(tmp.name, path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+    def _evict(self, keep: Path) -> None:
+        """Delete the least recently put blobs, never ``keep``, until the store fits in ``max_bytes``."""
+        blobs = []
+        for path in self._root.glob("*/*"):
+            if not _DIGEST.match(path.name):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in blobs)
+        evicted = 0
+        for _, size, path in sorted(blobs):
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        if evicted:
+            metrics.incr("blob_store.evicted", evicted)
+
+
+_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    global _store
+    if _store is None:
+        _store = BlobStore(settings.blob_store_dir, max_bytes=settings.blob_store_max_mb * 1024 * 1024)
+    return _store
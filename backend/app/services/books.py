@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.services.http_clients import http_client
+from app.services.metrics import metrics
+
+_ARTICLES = re.compile(r"^(the|a|an)\s+")
+
+
+def normalize_title(title: str) -> str:
+    """Fold case, accents, punctuation, subtitles and leading articles.
+
+    "The Left Hand of Darkness", "left hand of darkness" and
+    "The Left Hand of Darkness: A Novel" all normalize to the same key.
+    """
+    text = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode()
+    text = text.lower().split(":", 1)[0].split(" (", 1)[0]
+    text = re.sub(r"[^\w\s]", " ", text.replace("&", " and "))
+    text = " ".join(text.split())
+    return _ARTICLES.sub("", text)
+
+
+def _book_record(title: str, authors: list[str], year: int | None, subjects: list[str]) -> dict[str, Any]:
+    return {"title": title, "authors": authors[:3], "year": year, "subjects": subjects[:8]}
+
+
+# ── upstreams ─────────────────────────────────────────────────────
+
+class BookUpstream(ABC):
+    """Somewhere to look up titles the local index doesn't know yet."""
+
+    @abstractmethod
+    async def lookup(self, keys: dict[str, str]) -> dict[str, dict[str, Any]]:
+        """Resolve ``{normalized key: original title}`` in one batch; unknown keys are omitted."""
+
+
+class OpenLibraryUpstream(BookUpstream):
+    """One Open Library search for the whole batch: ``title:"a" OR title:"b" ...``."""
+
+    SEARCH_URL = "https://openlibrary.org/search.json"
+
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
+    async def lookup(self, keys: dict[str, str]) -> dict[str, dict[str, Any]]:
+        query = " OR ".join(f'title:"{title.replace(chr(34), "")}"' for title in keys.values())
+        params = {
+            "q": query,
+            "fields": "title,author_name,first_publish_year,subject",
+            "limit": len(keys) * 5,
+        }
+        async with http_client("openlibrary", self._client) as client:
+            resp = await client.get(self.SEARCH_URL, params=params)
+            resp.raise_for_status()
+            docs = resp.json().get("docs", [])
+
+        # Search ranks by relevance, so the first doc matching each key wins
+        found: dict[str, dict[str, Any]] = {}
+        for doc in docs:
+            key = normalize_title(doc.get("title", ""))
+            if key in keys and key not in found:
+                found[key] = _book_record(
+                    doc["title"], doc.get("author_name", []), doc.get("first_publish_year"), doc.get("subject", [])
+                )
+        return found
+
+
+class StaticUpstream(BookUpstream):
+    """A fixed catalog, for tests and offline development.
+
+    Loaded from a JSON list of ``{"title", "authors", "year", "subjects"}``.
+    """
+
+    def __init__(self, books: list[dict[str, Any]]) -> None:
+        self._books = {
+            normalize_title(b["title"]): _book_record(
+                b["title"], b.get("authors", []), b.get("year"), b.get("subjects", [])
+            )
+            for b in books
+        }
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> StaticUpstream:
+        return cls(json.loads(Path(path).read_text()))
+
+    async def lookup(self, keys: dict[str, str]) -> dict[str, dict[str, Any]]:
+        return {k: self._books[k] for k in keys if k in self._books}
+
+
+# ── local index ───────────────────────────────────────────────────
+
+class BookIndex:
+    """SQLite table of resolved titles, keyed by normalized title.
+
+    Titles the upstream couldn't find are remembered too (with no record)
+    and retried after ``miss_ttl`` seconds.
+    """
+
+    def __init__(self, path: str | Path, miss_ttl: float = 86400.0) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS books (key TEXT PRIMARY KEY, record TEXT, updated_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._miss_ttl = miss_ttl
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any] | None]:
+        """Known keys only; a None value is a remembered miss."""
+        if not keys:
+            return {}
+        marks = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, record, updated_at FROM books WHERE key IN ({marks})", keys
+            ).fetchall()
+        cutoff = time.time() - self._miss_ttl
+        return {
+            key: json.loads(record) if record else None
+            for key, record, updated_at in rows
+            if record or updated_at > cutoff
+        }
+
+    def put_many(self, records: dict[str, dict[str, Any] | None]) -> None:
+        now = time.time()
+        rows = [(k, json.dumps(r) if r else None, now) for k, r in records.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO books VALUES (?, ?, ?)", rows)
+
+
+# ── resolver ──────────────────────────────────────────────────────
+
+class BookResolver:
+    """Resolves a user's whole title list: local index first, one upstream batch for the rest."""
+
+    def __init__(self, index: BookIndex, upstream: BookUpstream) -> None:
+        self._index = index
+        self._upstream = upstream
+
+    async def resolve(self, titles: list[str]) -> dict[str, Any]:
+        keys: dict[str, str] = {}
+        for title in titles:
+            key = normalize_title(title)
+            if key:
+                keys.setdefault(key, title.strip())
+        if not keys:
+            return {"books": [], "unresolved": []}
+
+        known = await asyncio.to_thread(self._index.get_many, list(keys))
+        missing = {k: t for k, t in keys.items() if k not in known}
+        metrics.incr("books.index.hits", len(known))
+        if missing:
+            metrics.incr("books.index.misses", len(missing))
+            found = await self._upstream.lookup(missing)
+            fetched = {k: found.get(k) for k in missing}
+            await asyncio.to_thread(self._index.put_many, fetched)
+            known.update(fetched)
+
+        return {
+            "books": [known[k] for k in keys if known.get(k)],
+            "unresolved": [t for k, t in keys.items() if not known.get(k)],
+        }
+
+
+_resolver: BookResolver | None = None
+
+
+def get_book_resolver() -> BookResolver:
+    global _resolver
+    if _resolver is None:
+        if settings.books_upstream == "static":
+            upstream: BookUpstream = StaticUpstream.from_file(settings.books_static_catalog)
+        elif settings.books_upstream == "openlibrary":
+            upstream = OpenLibraryUpstream()
+        else:
+            raise ValueError(f"Unknown books upstream: {settings.books_upstream}")
+        _resolver = BookResolver(BookIndex(settings.books_index_path), upstream)
+    return _resolver
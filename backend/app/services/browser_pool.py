@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from playwright.async_api import Browser, Page, async_playwright
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Launcher = Callable[[], Awaitable[Browser]]
+
+
+class _Slot:
+    """One long-lived browser plus the bookkeeping needed to recycle it."""
+
+    def __init__(self) -> None:
+        self.browser: Browser | None = None
+        self.pages_served = 0
+        self.recycle = False
+        self.lock = asyncio.Lock()
+
+
+class BrowserPool:
+    """A small set of warm Chromium instances shared by the scraping connectors.
+
+    Callers borrow an isolated context/page via ``pool.page(user_agent)``. The
+    pool caps concurrent pages, retires a browser after ``max_pages`` pages or
+    when the browser process tree grows past ``max_rss_mb`` (checked every
+    ``rss_check_every`` releases, since it walks ``/proc``), and replaces
+    browsers that have crashed or disconnected.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_concurrency: int = 4,
+        max_pages: int = 50,
+        max_rss_mb: int = 0,
+        rss_check_every: int = 10,
+        health_interval: float = 30.0,
+        launcher: Launcher | None = None,
+    ) -> None:
+        self._slots = [_Slot() for _ in range(max(1, size))]
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._max_pages = max_pages
+        self._max_rss_mb = max_rss_mb
+        self._rss_check_every = max(1, rss_check_every)
+        self._releases = 0
+        self._health_interval = health_interval
+        self._launcher = launcher
+        self._playwright: Any = None
+        self._active: dict[Browser, int] = {}
+        self._retired: set[Browser] = set()
+        self._closing: set[asyncio.Task] = set()
+        self._next = 0
+        self._health_task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(cls) -> BrowserPool:
+        return cls(
+            size=settings.browser_pool_size,
+            max_concurrency=settings.browser_max_concurrency,
+            max_pages=settings.browser_max_pages,
+            max_rss_mb=settings.browser_max_rss_mb,
+            rss_check_every=settings.browser_rss_check_every,
+            health_interval=settings.browser_health_interval,
+        )
+
+    # ── lifecycle ──────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Warm up every slot. Launch failures are logged and retried lazily."""
+        if self._launcher is None:
+            self._playwright = await async_playwright().start()
+        for slot in self._slots:
+            try:
+                await self._ensure_browser(slot)
+            except Exception:
+                logger.exception("Failed to warm browser slot")
+        if self._health_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        browsers = {s.browser for s in self._slots if s.browser} | self._retired
+        for slot in self._slots:
+            slot.browser = None
+        self._retired.clear()
+        self._active.clear()
+        for browser in browsers:
+            await self._close(browser)
+        await asyncio.gather(*self._closing)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    # ── borrowing pages ────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def page(self, user_agent: str) -> AsyncIterator[Page]:
+        """Yield a fresh page in its own browser context; closed on exit."""
+        async with self._semaphore:
+            slot = self._pick_slot()
+            browser, context = await self._new_context(slot, user_agent)
+            self._active[browser] = self._active.get(browser, 0) + 1
+            try:
+                yield await context.new_page()
+            finally:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                await self._release(slot, browser)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "browsers": sum(1 for s in self._slots if s.browser is not None),
+            "pages_served": [s.pages_served for s in self._slots],
+            "active_pages": sum(self._active.values()),
+            "retired_pending": len(self._retired),
+        }
+
+    # ── internals ──────────────────────────────────────────────────
+
+    def _pick_slot(self) -> _Slot:
+        # Prefer the least-busy slot, breaking ties round-robin.
+        order = self._slots[self._next:] + self._slots[:self._next]
+        self._next = (self._next + 1) % len(self._slots)
+        return min(order, key=lambda s: self._active.get(s.browser, 0) if s.browser else 0)
+
+    async def _new_context(self, slot: _Slot, user_agent: str) -> tuple[Browser, Any]:
+        # One retry covers a browser that died between the health check and use.
+        for attempt in range(2):
+            browser = await self._ensure_browser(slot)
+            try:
+                return browser, await browser.new_context(user_agent=user_agent)
+            except Exception:
+                if attempt:
+                    raise
+                logger.warning("Browser context creation failed; replacing browser")
+                async with slot.lock:
+                    if slot.browser is browser:
+                        self._retire(slot)
+        raise RuntimeError("unreachable")
+
+    async def _ensure_browser(self, slot: _Slot) -> Browser:
+        async with slot.lock:
+            browser = slot.browser
+            if browser is not None and (not browser.is_connected() or slot.recycle):
+                self._retire(slot)
+                browser = None
+            if browser is None:
+                browser = await self._launch()
+                slot.browser = browser
+                slot.pages_served = 0
+                slot.recycle = False
+            return browser
+
+    async def _launch(self) -> Browser:
+        if self._launcher is not None:
+            return await self._launcher()
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(headless=True)
+
+    async def _release(self, slot: _Slot, browser: Browser) -> None:
+        remaining = self._active.get(browser, 1) - 1
+        if remaining:
+            self._active[browser] = remaining
+        else:
+            self._active.pop(browser, None)
+
+        self._releases += 1
+        if slot.browser is browser:
+            slot.pages_served += 1
+            if self._max_pages and slot.pages_served >= self._max_pages:
+                slot.recycle = True
+            elif self._rss_due() and _process_tree_rss_mb() > self._max_rss_mb:
+                logger.info("Browser pool over RSS limit; recycling busiest browser")
+                max(self._slots, key=lambda s: s.pages_served).recycle = True
+        elif browser in self._retired and not remaining:
+            self._retired.discard(browser)
+            await self._close(browser)
+
+    def _rss_due(self) -> bool:
+        return bool(self._max_rss_mb) and self._releases % self._rss_check_every == 0
+
+    def _retire(self, slot: _Slot) -> None:
+        """Detach the slot's browser; it is closed once its last page is released."""
+        browser = slot.browser
+        slot.browser = None
+        if browser is None:
+            return
+        if self._active.get(browser):
+            self._retired.add(browser)
+        else:
+            # Held until done so the close isn't garbage-collected mid-flight
+            task = asyncio.create_task(self._close(browser))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            for slot in self._slots:
+                browser = slot.browser
+                if browser is not None and browser.is_connected() and not slot.recycle:
+                    continue
+                try:
+                    await self._ensure_browser(slot)
+                except Exception:
+                    logger.exception("Failed to replace unhealthy browser")
+
+    @staticmethod
+    async def _close(browser: Browser) -> None:
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+
+def _process_tree_rss_mb() -> float:
+    """RSS of this process and all descendants (Chromium runs as children). Linux only."""
+    try:
+        children: dict[int, list[int]] = {}
+        rss_pages: dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    fields = f.read().rsplit(")", 1)[1].split()
+            except OSError:
+                continue
+            pid = int(entry)
+            children.setdefault(int(fields[1]), []).append(pid)
+            rss_pages[pid] = int(fields[21])
+    except OSError:
+        return 0.0
+
+    total = 0
+    stack = [os.getpid()]
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+# ── process-wide pool ─────────────────────────────────────────────
+
+_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool | None:
+    return _pool
+
+
+def set_browser_pool(pool: BrowserPool | None) -> None:
+    global _pool
+    _pool = pool
+
+
+@asynccontextmanager
+async def open_page(user_agent: str, pool: BrowserPool | None = None) -> AsyncIterator[Page]:
+    """Borrow a page from the pool, or launch a one-off browser when no pool is running."""
+    pool = pool or get_browser_pool()
+    if pool is not None:
+        async with pool.page(user_agent) as page:
+            yield page
+        return
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context(user_agent=user_agent)
+            yield await context.new_page()
+        finally:
+            await browser.close()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:  # optional: only needed for the "redis" backend
+    aioredis = None
+    RedisError = OSError
+
+logger = logging.getLogger(__name__)
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+
+def freshness(
+    stored_at: float | None, ttl: float, stale_while_revalidate: float = 0.0, now: float | None = None
+) -> str:
+    """Classify an entry's age: serve FRESH as is, serve STALE while refreshing, refetch EXPIRED."""
+    if stored_at is None:
+        return EXPIRED
+    age = (time.time() if now is None else now) - stored_at
+    if age < ttl:
+        return FRESH
+    if age < ttl + stale_while_revalidate:
+        return STALE
+    return EXPIRED
+
+
+class CacheBackend(ABC):
+    """Async key/value store for JSON-serializable values."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        ...
+
+
+class MemoryBackend(CacheBackend):
+    """Process-local LRU with optional per-entry expiry.
+
+    Bounded by entry count and, when ``max_bytes`` is set, by the total
+    JSON-encoded size of the values.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 0) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self.bytes = 0
+
+    async def get(self, key: str) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires is not None and expires <= time.time():
+            self._drop(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires = time.time() + ttl if ttl else None
+        self._drop(key)
+        self._data[key] = (expires, value)
+        if self._max_bytes:
+            size = len(json.dumps(value, separators=(",", ":"), default=str))
+            self._sizes[key] = size
+            self.bytes += size
+        while self._data and (
+            (self._max_entries and len(self._data) > self._max_entries)
+            or (self._max_bytes and self.bytes > self._max_bytes)
+        ):
+            self._drop(next(iter(self._data)))
+
+    async def delete(self, key: str) -> None:
+        self._drop(key)
+
+    async def clear(self) -> None:
+        self._data.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def _drop(self, key: str) -> None:
+        if self._data.pop(key, None) is not None:
+            self.bytes -= self._sizes.pop(key, 0)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskBackend(CacheBackend):
+    """One JSON file per key under ``root``; survives restarts."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._root / digest[:2] / f"{digest}.json"
+
+    async def get(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self._read, self._path(key))
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires = time.time() + ttl if ttl else None
+        payload = json.dumps({"expires": expires, "value": value}, separators=(",", ":"), default=str)
+        await asyncio.to_thread(self._write, self._path(key), payload)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, True)
+
+    async def clear(self) -> None:
+        def _clear() -> None:
+            for path in self._root.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+        await asyncio.to_thread(_clear)
+
+    @staticmethod
+    def _read(path: Path) -> Any | None:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        expires = data.get("expires")
+        if expires is not None and expires <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return data.get("value")
+
+    @staticmethod
+    def _write(path: Path, payload: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp name, so concurrent writes of the same key don't rename each other's file
+        tmp = tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=path.stem, suffix=".tmp", delete=False, encoding="utf-8"
+        )
+        try:
+            with tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+
+class RedisBackend(CacheBackend):
+    """JSON values in Redis, shared by every process pointed at ``url``.
+
+    A cache miss is cheaper than a failed request, so Redis errors are
+    logged and treated as misses rather than raised.
+    """
+
+    def __init__(self, url: str, prefix: str = "starstruck:") -> None:
+        if aioredis is None:
+            raise RuntimeError("The redis package is required for the redis cache backend")
+        self._redis = aioredis.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self._redis.get(self._prefix + key)
+        except RedisError as exc:
+            logger.warning("Redis get failed: %s", exc)
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        payload = json.dumps(value, separators=(",", ":"), default=str)
+        try:
+            await self._redis.set(self._prefix + key, payload, ex=math.ceil(ttl) if ttl else None)
+        except RedisError as exc:
+            logger.warning("Redis set failed: %s", exc)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._redis.delete(self._prefix + key)
+        except RedisError as exc:
+            logger.warning("Redis delete failed: %s", exc)
+
+    async def clear(self) -> None:
+        try:
+            async for key in self._redis.scan_iter(match=f"{self._prefix}*"):
+                await self._redis.delete(key)
+        except RedisError as exc:
+            logger.warning("Redis clear failed: %s", exc)
+
+
+def make_backend(
+    kind: str, *, path: str = "", max_entries: int = 1024, url: str = "", prefix: str = ""
+) -> CacheBackend:
+    """Build a backend from a Settings value: "memory", "disk" or "redis".
+
+    "redis" falls back to memory when the redis package isn't installed.
+    """
+    if kind == "disk":
+        return DiskBackend(path)
+    if kind == "redis":
+        if aioredis is not None:
+            return RedisBackend(url, prefix=f"starstruck:{prefix}:" if prefix else "starstruck:")
+        logger.warning("redis package not installed; using an in-memory cache instead")
+    elif kind != "memory":
+        raise ValueError(f"Unknown cache backend: {kind}")
+    return MemoryBackend(max_entries=max_entries)
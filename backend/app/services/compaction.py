@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections import Counter
+from typing import Any, Callable
+
+from app.services.metrics import metrics
+from app.services.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Items kept per list at full scale; every list keeps at least MIN_ITEMS
+LIMITS = {
+    "languages": 12,
+    "repos": 15,
+    "starred_topics": 25,
+    "top_artists": 20,
+    "top_genres": 15,
+    "top_tracks": 15,
+    "recent_films": 20,
+    "books": 20,
+    "subjects": 12,
+    "unresolved": 10,
+}
+DEFAULT_LIMIT = 20
+MIN_ITEMS = 3
+DESCRIPTION_CHARS = 140
+TEXT_CHARS = 600
+
+# Tried in order until the bundle fits the budget
+SCALES = (1.0, 0.5, 0.25, 0.0)
+
+
+def compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def hour_histogram(hours: list[int]) -> list[int]:
+    """Counts per hour of day, index 0-23."""
+    bins = [0] * 24
+    for h in hours:
+        if isinstance(h, int) and 0 <= h < 24:
+            bins[h] += 1
+    return bins
+
+
+def _limit(key: str, scale: float) -> int:
+    return max(MIN_ITEMS, int(LIMITS.get(key, DEFAULT_LIMIT) * scale))
+
+
+def _clip(text: Any, chars: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= chars else text[: chars - 1].rstrip() + "…"
+
+
+def _prune(value: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in value.items() if v not in (None, "", [], {})}
+
+
+def _is_records(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(v, dict) for v in value)
+
+
+def _is_hours(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(v, int) for v in value)
+
+
+def _generic(data: dict[str, Any], scale: float, done: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Clip strings and cap lists, leaving the fields in ``done`` as the caller compacted them."""
+    done = done or {}
+    out: dict[str, Any] = {}
+    for key, value in data.items():
+        if key in done:
+            value = done[key]
+        elif isinstance(value, str):
+            value = _clip(value, TEXT_CHARS)
+        elif isinstance(value, list):
+            value = value[: _limit(key, scale)]
+        out[key] = value
+    out.update((k, v) for k, v in done.items() if k not in out)
+    return _prune(out)
+
+
+def _github(data: dict[str, Any], scale: float) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    repos = data.get("repos")
+    if _is_records(repos):
+        ranked = sorted(repos, key=lambda r: r.get("stars") or 0, reverse=True)
+        chars = max(40, int(DESCRIPTION_CHARS * max(scale, 0.25)))
+        out["repos"] = [
+            _prune({
+                "name": r.get("name"),
+                "description": _clip(r.get("description") or "", chars),
+                "stars": r.get("stars") or None,
+                "language": r.get("language"),
+            })
+            for r in ranked[: _limit("repos", scale)]
+        ]
+    if _is_hours(data.get("commit_hours")):
+        out["commit_hours"] = hour_histogram(data["commit_hours"])
+    return _generic(data, scale, out)
+
+
+def _spotify(data: dict[str, Any], scale: float) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    artists = data.get("top_artists")
+    if _is_records(artists):
+        # Per-artist genres repeat what top_genres already aggregates
+        out["top_artists"] = [a.get("name") for a in artists if a.get("name")][: _limit("top_artists", scale)]
+        if not data.get("top_genres"):
+            genres = Counter(g for a in artists for g in a.get("genres", []))
+            out["top_genres"] = [g for g, _ in genres.most_common(_limit("top_genres", scale))]
+    tracks = data.get("top_tracks")
+    if _is_records(tracks):
+        by_artist: dict[str, list[str]] = {}
+        for t in tracks[: _limit("top_tracks", scale)]:
+            by_artist.setdefault(t.get("artist") or "?", []).append(t.get("name", ""))
+        out["top_tracks"] = by_artist
+    if _is_hours(data.get("listening_hours")):
+        out["listening_hours"] = hour_histogram(data["listening_hours"])
+    return _generic(data, scale, out)
+
+
+def _letterboxd(data: dict[str, Any], scale: float) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    films = data.get("recent_films")
+    if _is_records(films):
+        out["recent_films"] = [
+            f"{f.get('title', '')} ({f['rating']:g}/5)" if isinstance(f.get("rating"), (int, float)) else f.get("title", "")
+            for f in films[: _limit("recent_films", scale)]
+        ]
+    return _generic(data, scale, out)
+
+
+def _books(data: dict[str, Any], scale: float) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    books = data.get("books")
+    if _is_records(books):
+        kept = books[: _limit("books", scale)]
+        out["books"] = [
+            " — ".join(filter(None, [
+                b.get("title", ""),
+                ", ".join(b.get("authors") or []),
+                str(b["year"]) if b.get("year") else "",
+            ]))
+            for b in kept
+        ]
+        subjects = Counter(s for b in kept for s in b.get("subjects") or [])
+        out["subjects"] = [s for s, _ in subjects.most_common(_limit("subjects", scale))]
+    return _generic(data, scale, out)
+
+
+def _page(data: dict[str, Any], scale: float) -> dict[str, Any]:
+    # Scraped profiles: the flags and blob references mean nothing to the model
+    return _generic({k: v for k, v in data.items() if k not in ("screenshot_ref", "login_wall")}, scale)
+
+
+COMPACTORS: dict[str, Callable[[dict[str, Any], float], dict[str, Any]]] = {
+    "github": _github,
+    "spotify": _spotify,
+    "letterboxd": _letterboxd,
+    "books": _books,
+    "instagram": _page,
+    "linkedin": _page,
+}
+
+
+def compact_raw_data(raw_data: dict[str, Any], max_tokens: int = 0) -> dict[str, Any]:
+    """Shrink a connector bundle to what profile analysis needs, within ``max_tokens``.
+
+    Each source is compacted on its own: lists are ranked and cut, repeated
+    values are collapsed, hour lists become 24-bin histograms and empty
+    fields are dropped. If the compact JSON is still over budget the list
+    limits are scaled down until it fits or every list is at ``MIN_ITEMS``.
+    """
+    compacted: dict[str, Any] = {}
+    tokens = 0
+    for scale in SCALES:
+        compacted = {
+            source: COMPACTORS.get(source, _generic)(data, scale) if isinstance(data, dict) else data
+            for source, data in raw_data.items()
+        }
+        tokens = estimate_tokens(compact_json(compacted))
+        if not max_tokens or tokens <= max_tokens:
+            break
+    else:
+        logger.debug("Compacted bundle still %d tokens over a %d budget", tokens - max_tokens, max_tokens)
+    if scale < 1.0:
+        metrics.incr("compaction.scaled_down")
+    metrics.observe("compaction.tokens", tokens)
+    return compacted
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.services.cache import FRESH, STALE, CacheBackend, MemoryBackend, freshness
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+Fetch = Callable[[], Awaitable[dict[str, Any]]]
+
+
+class ConnectorCache:
+    """Recent connector results keyed by service and normalized identifier.
+
+    ``fetch`` is the read-through entry point shared by /api/connect and
+    ingest. Fresh entries are returned as is; stale ones (within the
+    stale-while-revalidate window) are returned while one background task
+    refreshes them; anything else runs the fetch and stores a non-empty
+    result. TTLs come from Settings and can differ per service.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float | None = None,
+        ttls: dict[str, float] | None = None,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        self._backend = backend
+        self._ttl = ttl or 0.0
+        self._ttls = ttls or {}
+        self._stale_ttl = stale_ttl
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def key(service: str, identifier: str) -> str:
+        return f"{service}:{identifier.strip().lstrip('@').lower()}"
+
+    def ttl_for(self, service: str) -> float:
+        return self._ttls.get(service, self._ttl)
+
+    async def get(self, service: str, identifier: str) -> dict[str, Any] | None:
+        """The cached result if it is still fresh."""
+        entry = await self._backend.get(self.key(service, identifier))
+        if entry and freshness(entry["stored_at"], self.ttl_for(service)) == FRESH:
+            return entry["data"]
+        return None
+
+    async def set(self, service: str, identifier: str, data: dict[str, Any]) -> None:
+        ttl = self.ttl_for(service)
+        entry = {"data": data, "stored_at": time.time()}
+        await self._backend.set(self.key(service, identifier), entry, (ttl + self._stale_ttl) or None)
+        if isinstance(self._backend, MemoryBackend):
+            metrics.gauge("connector_cache.bytes", self._backend.bytes)
+            metrics.gauge("connector_cache.entries", len(self._backend))
+
+    async def fetch(self, service: str, identifier: str, fetch: Fetch) -> dict[str, Any]:
+        key = self.key(service, identifier)
+        entry = await self._backend.get(key)
+        state = freshness(entry["stored_at"], self.ttl_for(service), self._stale_ttl) if entry else None
+        if state == FRESH:
+            metrics.incr("connector_cache.hits", service=service)
+            return entry["data"]
+        if state == STALE:
+            metrics.incr("connector_cache.stale", service=service)
+            if key not in self._refreshing:
+                task = asyncio.create_task(self._refresh(service, identifier, fetch))
+                self._refreshing[key] = task
+                task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+            return entry["data"]
+
+        metrics.incr("connector_cache.misses", service=service)
+        data = await fetch()
+        if data:
+            await self.set(service, identifier, data)
+        return data
+
+    async def _refresh(self, service: str, identifier: str, fetch: Fetch) -> None:
+        try:
+            data = await fetch()
+        except Exception:
+            logger.warning("Background refresh of %s for %s failed", service, identifier, exc_info=True)
+            return
+        if data:
+            await self.set(service, identifier, data)
+
+
+_cache: ConnectorCache | None = None
+
+
+def get_connector_cache() -> ConnectorCache:
+    global _cache
+    if _cache is None:
+        _cache = ConnectorCache(
+            MemoryBackend(
+                max_entries=settings.connector_cache_max_entries,
+                max_bytes=settings.connector_cache_max_bytes,
+            ),
+            ttl=settings.connector_cache_ttl,
+            ttls=settings.connector_cache_ttls,
+            stale_ttl=settings.connector_cache_stale_ttl,
+        )
+    return _cache
+
+
+def set_connector_cache(cache: ConnectorCache | None) -> None:
+    global _cache
+    _cache = cache
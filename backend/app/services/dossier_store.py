@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.services.cache import CacheBackend, make_backend
+from app.services.metrics import metrics
+from app.services.singleflight import SingleFlight
+
+
+def fingerprint(value: Any) -> str:
+    """sha256 of ``value``'s canonical JSON, so key order and whitespace don't change it."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class DossierStore:
+    """Profile dossiers keyed by the data they were built from.
+
+    The key covers the model, the prompt version, the display name and a
+    fingerprint of the filtered ``raw_data``, so unchanged input is answered
+    from the store and changing any of them is a miss. Concurrent misses
+    for the same key share one LLM call. Results rejected by ``store_if``
+    (a blank dossier from an unusable reply) are returned but not stored,
+    so the next request tries again instead of reading them for a week.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 0.0) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._flights = SingleFlight("dossier")
+
+    @staticmethod
+    def key(raw_data: dict[str, Any], name: str, *, model: str, prompt_version: str) -> str:
+        return f"dossier:{model}:{prompt_version}:{fingerprint({'name': name, 'raw_data': raw_data})}"
+
+    async def get_or_analyze(
+        self,
+        raw_data: dict[str, Any],
+        name: str,
+        analyze: Callable[[], Awaitable[dict]],
+        *,
+        model: str,
+        prompt_version: str,
+        store_if: Callable[[dict], bool] | None = None,
+    ) -> dict:
+        key = self.key(raw_data, name, model=model, prompt_version=prompt_version)
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+        return await self._flights.do(key, lambda: self._analyze(key, analyze, store_if))
+
+    async def get(self, raw_data: dict[str, Any], name: str, *, model: str, prompt_version: str) -> dict | None:
+        """The stored dossier, or None; for callers that stream the analysis themselves."""
+        return await self._lookup(self.key(raw_data, name, model=model, prompt_version=prompt_version))
+
+    async def put(
+        self, raw_data: dict[str, Any], name: str, dossier: dict, *, model: str, prompt_version: str
+    ) -> None:
+        key = self.key(raw_data, name, model=model, prompt_version=prompt_version)
+        await self._backend.set(key, copy.deepcopy(dossier), self._ttl or None)
+
+    async def _lookup(self, key: str) -> dict | None:
+        cached = await self._backend.get(key)
+        if cached is None:
+            metrics.incr("dossier_store.misses")
+            return None
+        metrics.incr("dossier_store.hits")
+        return copy.deepcopy(cached)
+
+    async def _analyze(
+        self, key: str, analyze: Callable[[], Awaitable[dict]], store_if: Callable[[dict], bool] | None
+    ) -> dict:
+        dossier = await analyze()
+        if store_if is None or store_if(dossier):
+            await self._backend.set(key, copy.deepcopy(dossier), self._ttl or None)
+        else:
+            metrics.incr("dossier_store.skipped")
+        return dossier
+
+
+_store: DossierStore | None = None
+
+
+def get_dossier_store() -> DossierStore:
+    global _store
+    if _store is None:
+        backend = make_backend(
+            settings.dossier_store_backend,
+            path=settings.dossier_store_dir,
+            max_entries=settings.dossier_store_max_entries,
+            url=settings.redis_url,
+            prefix="dossiers",
+        )
+        _store = DossierStore(backend, ttl=settings.dossier_store_ttl)
+    return _store
+
+
+def set_dossier_store(store: DossierStore | None) -> None:
+    global _store
+    _store = store
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+from app.config import settings
+from app.services.cache import EXPIRED, CacheBackend, freshness, make_backend
+from app.services.metrics import metrics
+
+
+class ETagCache:
+    """Stores each endpoint's validators plus its decoded JSON body.
+
+    Callers send the cached ``ETag``/``Last-Modified`` back as
+    ``If-None-Match``/``If-Modified-Since``; on a 304 the cached body is
+    reused without downloading or decoding anything. Bodies are stored even
+    when the origin sends neither header, so they are still served while
+    fresh; only the conditional request is lost.
+    """
+
+    def __init__(self, backend: CacheBackend, name: str = "etag") -> None:
+        self._backend = backend
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return f"{url}?{query}" if query else url
+
+    async def lookup(self, key: str) -> dict[str, Any] | None:
+        return await self._backend.get(key)
+
+    @staticmethod
+    def validators(entry: dict[str, Any] | None) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def store(self, key: str, resp: httpx.Response, body: Any, ttl: float | None = None) -> None:
+        entry = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+            "body": body,
+        }
+        await self._backend.set(key, entry, ttl)
+
+    async def touch(self, key: str, entry: dict[str, Any], ttl: float | None = None) -> None:
+        """Restart an entry's age after the origin confirmed it with a 304."""
+        await self._backend.set(key, {**entry, "stored_at": time.time()}, ttl)
+
+    @staticmethod
+    def freshness(entry: dict[str, Any] | None, ttl: float, stale_while_revalidate: float = 0.0) -> str:
+        if entry is None:
+            return EXPIRED
+        return freshness(entry.get("stored_at"), ttl, stale_while_revalidate)
+
+    def record_hit(self) -> None:
+        self.hits += 1
+        metrics.incr("etag_cache.hits", cache=self.name)
+
+    def record_miss(self) -> None:
+        self.misses += 1
+        metrics.incr("etag_cache.misses", cache=self.name)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_github_cache: ETagCache | None = None
+
+
+def get_github_etag_cache() -> ETagCache:
+    global _github_cache
+    if _github_cache is None:
+        backend = make_backend(
+            settings.github_etag_cache_backend,
+            path=settings.github_etag_cache_dir,
+            max_entries=settings.github_etag_cache_max_entries,
+        )
+        _github_cache = ETagCache(backend, name="github")
+    return _github_cache
+
+
+def set_github_etag_cache(cache: ETagCache | None) -> None:
+    global _github_cache
+    _github_cache = cache
+
+
+_letterboxd_cache: ETagCache | None = None
+
+
+def get_letterboxd_feed_cache() -> ETagCache:
+    global _letterboxd_cache
+    if _letterboxd_cache is None:
+        backend = make_backend(
+            settings.letterboxd_feed_cache_backend,
+            path=settings.letterboxd_feed_cache_dir,
+            max_entries=settings.letterboxd_feed_cache_max_entries,
+        )
+        _letterboxd_cache = ETagCache(backend, name="letterboxd")
+    return _letterboxd_cache
+
+
+def set_letterboxd_feed_cache(cache: ETagCache | None) -> None:
+    global _letterboxd_cache
+    _letterboxd_cache = cache
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any
 
 
+def source_findings(service: str, data: dict) -> list[dict[str, Any]]:
+    """Findings for one connector's data, before any dossier exists."""
+    return generate_findings({"data_sources": [service]}, {service: data})
+
+
 def generate_findings(dossier: dict, raw_data: dict) -> list[dict[str, Any]]:
     """Transform dossier + raw_data into findings cards for the frontend."""
     findings: list[dict[str, Any]] = []
@@ -83,4 +89,15 @@ def generate_findings(dossier: dict, raw_data: dict) -> list[dict[str, Any]]:
             "detail": headline or "Professional profile connected",
         })
 
+    if "books" in sources:
+        bk = raw_data.get("books", {})
+        books = bk.get("books", [])
+        subjects = Counter(s for b in books for s in b.get("subjects", []))
+        top_subject = subjects.most_common(1)[0][0] if subjects else None
+        findings.append({
+            "label": "Reading",
+            "value": f"{len(books)} books",
+            "detail": f"Into: {top_subject}" if top_subject else "Reading list connected",
+        })
+
     return findings
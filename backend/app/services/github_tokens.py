@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Mapping
+
+from app.config import settings
+from app.services.metrics import metrics
+
+ANONYMOUS_LIMIT = 60
+AUTHENTICATED_LIMIT = 5000
+
+
+class RateLimitExhausted(RuntimeError):
+    """Every configured GitHub token is out of budget until ``reset_at``."""
+
+    def __init__(self, resource: str, reset_at: float) -> None:
+        self.resource = resource
+        self.reset_at = reset_at
+        wait = max(0, int(reset_at - time.time()))
+        super().__init__(f"GitHub {resource} rate limit exhausted for all tokens; resets in {wait}s")
+
+
+@dataclass
+class TokenState:
+    token: str
+    limit: int
+    remaining: int
+    reset_at: float = 0.0
+    in_flight: int = 0
+    requests: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"…{self.token[-4:]}" if self.token else "anonymous"
+
+    @property
+    def available(self) -> int:
+        return self.remaining - self.in_flight
+
+    def auth_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+
+class GitHubTokenPool:
+    """Spreads requests over tokens using the budgets GitHub reports back.
+
+    ``acquire`` hands out the token with the most remaining budget. When all
+    are spent it waits for the earliest reset if that is within ``max_wait``
+    seconds, and otherwise raises ``RateLimitExhausted`` instead of letting
+    the request hit a 403.
+    """
+
+    def __init__(self, tokens: list[str], resource: str = "core", max_wait: float = 0.0) -> None:
+        tokens = list(dict.fromkeys(t for t in tokens if t))
+        self.resource = resource
+        self._max_wait = max_wait
+        if tokens:
+            self._states = [TokenState(t, AUTHENTICATED_LIMIT, AUTHENTICATED_LIMIT) for t in tokens]
+        else:
+            self._states = [TokenState("", ANONYMOUS_LIMIT, ANONYMOUS_LIMIT)]
+
+    @property
+    def authenticated(self) -> bool:
+        return bool(self._states[0].token)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    async def acquire(self) -> TokenState:
+        while True:
+            now = time.time()
+            for s in self._states:
+                if s.reset_at and s.reset_at <= now:
+                    s.remaining, s.reset_at = s.limit, 0.0
+            best = max(self._states, key=lambda s: s.available)
+            if best.available > 0:
+                best.in_flight += 1
+                return best
+
+            reset_at = min(s.reset_at or now for s in self._states)
+            wait = reset_at - now
+            if wait > self._max_wait:
+                metrics.incr("github.rate_limit.rejected", resource=self.resource)
+                raise RateLimitExhausted(self.resource, reset_at)
+            metrics.incr("github.rate_limit.queued", resource=self.resource)
+            await asyncio.sleep(max(wait, 0.05))
+
+    def release(self, state: TokenState, status_code: int, headers: Mapping[str, str]) -> None:
+        state.in_flight = max(0, state.in_flight - 1)
+        state.requests += 1
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            state.remaining = int(remaining)
+            state.limit = int(headers.get("X-RateLimit-Limit", state.limit))
+            state.reset_at = float(headers.get("X-RateLimit-Reset", state.reset_at))
+        elif status_code == 429 or (status_code == 403 and "Retry-After" in headers):
+            # Secondary rate limit: back this token off for Retry-After seconds
+            state.remaining = 0
+            state.reset_at = time.time() + float(headers.get("Retry-After", 60))
+        self._publish(state)
+
+    @staticmethod
+    def is_rate_limited(status_code: int, headers: Mapping[str, str]) -> bool:
+        if status_code == 429:
+            return True
+        return status_code == 403 and (
+            headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers
+        )
+
+    def stats(self) -> list[dict]:
+        return [
+            {
+                "token": s.label,
+                "limit": s.limit,
+                "remaining": s.remaining,
+                "reset_at": s.reset_at,
+                "in_flight": s.in_flight,
+                "requests": s.requests,
+            }
+            for s in self._states
+        ]
+
+    def _publish(self, state: TokenState) -> None:
+        labels = {"resource": self.resource, "token": state.label}
+        metrics.incr("github.token.requests", **labels)
+        metrics.gauge("github.token.remaining", state.remaining, **labels)
+        metrics.gauge("github.token.utilization", round(1 - state.remaining / max(state.limit, 1), 4), **labels)
+
+
+_pools: dict[str, GitHubTokenPool] = {}
+
+
+def get_github_token_pool(resource: str = "core") -> GitHubTokenPool:
+    """Process-wide pool per GitHub rate-limit resource ("core", "graphql")."""
+    pool = _pools.get(resource)
+    if pool is None:
+        pool = _pools[resource] = GitHubTokenPool(
+            [settings.github_token, *settings.github_tokens],
+            resource=resource,
+            max_wait=settings.github_rate_limit_max_wait,
+        )
+    return pool
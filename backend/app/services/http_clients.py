@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import AsyncIterator
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HostConfig:
+    base_url: str = ""
+    timeout: float = 15
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry: float = 30
+    headers: dict[str, str] = field(default_factory=dict)
+    follow_redirects: bool = False
+    # Scraping clients are shared across users, so a cookie one user's request
+    # picked up must not ride along on the next user's
+    store_cookies: bool = True
+
+
+# One entry per upstream. Connectors borrow a client by name.
+HOSTS: dict[str, HostConfig] = {
+    "github": HostConfig(
+        base_url="https://api.github.com",
+        headers={"Accept": "application/vnd.github+json"},
+    ),
+    "spotify": HostConfig(base_url="https://api.spotify.com/v1"),
+    "letterboxd": HostConfig(max_connections=10, store_cookies=False),
+    "places": HostConfig(timeout=10, max_connections=10),
+    "openlibrary": HostConfig(timeout=10, max_connections=5),
+    "instagram": HostConfig(timeout=10, max_connections=10, follow_redirects=True, store_cookies=False),
+    "linkedin": HostConfig(timeout=10, max_connections=10, follow_redirects=True, store_cookies=False),
+}
+
+
+def host_config(name: str) -> HostConfig:
+    """HOSTS entry with per-host overrides from Settings applied."""
+    config = HOSTS.get(name, HostConfig())
+    overrides: dict = {}
+    if name in settings.http_host_timeouts:
+        overrides["timeout"] = settings.http_host_timeouts[name]
+    if name in settings.http_host_max_connections:
+        overrides["max_connections"] = settings.http_host_max_connections[name]
+    return replace(config, **overrides) if overrides else config
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _no_cookies() -> CookieJar:
+    """A jar whose policy accepts no domain, so Set-Cookie is ignored."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def build_client(config: HostConfig) -> httpx.AsyncClient:
+    http2 = settings.http_http2 and _http2_available()
+    return httpx.AsyncClient(
+        base_url=config.base_url,
+        headers=config.headers,
+        cookies=None if config.store_cookies else _no_cookies(),
+        timeout=config.timeout,
+        follow_redirects=config.follow_redirects,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+    )
+
+
+class HTTPClientRegistry:
+    """Long-lived, pooled ``httpx.AsyncClient`` per upstream host.
+
+    Clients are created on first use and closed together at shutdown, so
+    repeated calls to the same host reuse warm TLS connections.
+    """
+
+    def __init__(self, hosts: dict[str, HostConfig] | None = None) -> None:
+        self._hosts = hosts
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            config = self._hosts[name] if self._hosts is not None else host_config(name)
+            client = self._clients[name] = build_client(config)
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception:
+                logger.exception("Failed to close HTTP client")
+
+
+# ── process-wide registry ─────────────────────────────────────────
+
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_registry() -> HTTPClientRegistry | None:
+    return _registry
+
+
+def set_http_registry(registry: HTTPClientRegistry | None) -> None:
+    global _registry
+    _registry = registry
+
+
+@asynccontextmanager
+async def http_client(name: str, client: httpx.AsyncClient | None = None) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the injected client, the shared one for ``name``, or a throwaway client.
+
+    The throwaway path keeps connectors usable without the app lifespan
+    (tests, scripts); it is closed on exit, shared clients are not.
+    """
+    if client is not None:
+        yield client
+        return
+    registry = get_http_registry()
+    if registry is not None:
+        yield registry.get(name)
+        return
+    async with build_client(host_config(name)) as temp:
+        yield temp
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import time
+from typing import Any, AsyncIterator
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.config import settings
+from app.services.compaction import compact_json, compact_raw_data
+from app.services.dossier_store import DossierStore, get_dossier_store
+from app.services.dossier_store import fingerprint
+from app.services.llm_governor import BACKGROUND, INTERACTIVE, LLMGovernor, get_llm_governor
+from app.services.llm_json import IncrementalDecoder, conform, decode, is_valid
+from app.services.llm_router import build_router, resolve_tier
+from app.services.metrics import metrics
+from app.services.pair_cache import PairCache, get_pair_cache, rename
+from app.services.pair_context import DEFAULT_LABELS, context_mode, crossref_view
+from app.services.tokens import estimate_tokens
 
 CROSSREF_SYSTEM_PROMPT = """\
 You are a compatibility analyst. Given two personality dossiers for {name_a} and {name_b} (each with public and private tiers), \
@@ -85,6 +97,16 @@ Return ONLY valid JSON with these exact keys:
 Do NOT wrap the JSON in markdown code fences. Return raw JSON only."""
 
 
+
+def _prompt_version(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode()).hexdigest()[:12]
+
+
+# Part of every stored result's key, so editing a prompt retires what it produced
+PROFILE_PROMPT_VERSION = _prompt_version(PROFILE_SYSTEM_PROMPT)
+CROSSREF_PROMPT_VERSION = _prompt_version(CROSSREF_SYSTEM_PROMPT)
+
+
 VENUE_SYSTEM_PROMPT = """\
 You are a local concierge and matchmaker. You will be used in two modes:
 
@@ -100,6 +122,8 @@ You are a local concierge and matchmaker. You will be used in two modes:
 
 Do NOT wrap the JSON in markdown code fences. Return raw JSON only."""
 
+VENUE_PROMPT_VERSION = _prompt_version(VENUE_SYSTEM_PROMPT)
+
 COACHING_SYSTEM_PROMPT = """\
 You are an expert dating coach and conversational strategist. Given two user profiles, their cross-reference analysis, \
 and a selected venue/activity, generate a personalized briefing for ONE of the users.
@@ -117,6 +141,34 @@ Return ONLY valid JSON with these exact keys:
 
 Do NOT wrap the JSON in markdown code fences. Return raw JSON only."""
 
+COACHING_PROMPT_VERSION = _prompt_version(COACHING_SYSTEM_PROMPT)
+
+DUAL_COACHING_SYSTEM_PROMPT = """\
+You are an expert dating coach and conversational strategist. Given two user profiles, their cross-reference analysis, \
+and a selected venue/activity, generate a personalized briefing for EACH of the two users: one for user_a about \
+meeting user_b, and one for user_b about meeting user_a.
+
+Your goal is to help each user navigate the interaction smoothly, highlighting opportunities for connection \
+and helping them avoid potential friction. Write each briefing from its own user's perspective.
+
+Return ONLY valid JSON of the form {"user_a": <briefing>, "user_b": <briefing>}, where each briefing has these exact keys:
+
+"match_intel": 2-3 sentences on why this match has potential (or what the main challenge is).
+"conversation_playbook": list of 3 specific, open-ended questions or topics to bring up, based on shared interests.
+"minefield_map": list of 2 topics or sensitivities to be careful about (based on tension points or private traits).
+"venue_cheat_sheet": 1-2 sentences on why the suggested venue contributes to the vibe.
+"vibe_calibration": A tip on the energy to bring (e.g. "High energy", "Chill and observant").
+
+Do NOT wrap the JSON in markdown code fences. Return raw JSON only."""
+
+DUAL_COACHING_PROMPT_VERSION = _prompt_version(DUAL_COACHING_SYSTEM_PROMPT)
+
+def _cancelled_hedges(response: Any) -> int:
+    """How many duplicate provider calls ``ProviderRouter`` cancelled to return ``response``."""
+    metadata = getattr(response, "response_metadata", None)
+    router = metadata.get("router") if isinstance(metadata, dict) else None
+    return len(router.get("cancelled", [])) if isinstance(router, dict) else 0
+
 
 def _empty_crossref() -> dict:
     return {
@@ -144,127 +196,370 @@ def _empty_dossier() -> dict:
     }
 
 
+def _decode_reply(content: str, method: str) -> Any:
+    """``decode``, or None for a reply with no JSON in it at all (a refusal, an apology)."""
+    try:
+        return decode(content)
+    except json.JSONDecodeError:
+        metrics.incr("llm_json.unrecoverable", method=method)
+        return None
+
+
+def _has_content(dossier: dict) -> bool:
+    """False for a dossier that is still all defaults, i.e. the reply gave us nothing usable."""
+    empty = _empty_dossier()
+    return any(dossier.get(k) != empty[k] for k in ("public", "private"))
+
+
 class LLMService:
-    def __init__(self) -> None:
-        self._llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
-            google_api_key=settings.gemini_api_key,
-            temperature=0.7,
-        )
+    """Prompts and parsing for every LLM step.
+
+    Build one per process (see ``get_llm_service``) so the provider clients
+    and their connections are reused; every call goes through the shared
+    ``LLMGovernor`` and then the ``ProviderRouter`` for its method's tier,
+    which hedges slow calls across Gemini and Anthropic. Dossiers are read
+    through ``DossierStore`` and pair artifacts (crossref, coaching) through
+    ``PairCache``.
+
+    Anything not passed in is the process-wide instance. ``clients`` maps a
+    tier name to the chat model or router that serves it; tiers left out
+    get a ``ProviderRouter`` built from settings on first use.
+    """
+
+    def __init__(
+        self,
+        governor: LLMGovernor | None = None,
+        dossiers: DossierStore | None = None,
+        pairs: PairCache | None = None,
+        clients: dict[str, Any] | None = None,
+    ) -> None:
+        self._governor = governor or get_llm_governor()
+        self._dossiers = dossiers or get_dossier_store()
+        self._pairs = pairs or get_pair_cache()
+        self._clients: dict[str, Any] = dict(clients or {})
+
+    def _client_for(self, method: str):
+        """The router for ``method``'s tier (see ``settings.llm_method_tiers``)."""
+        tier = resolve_tier(method)
+        if tier.name not in self._clients:
+            self._clients[tier.name] = build_router(tier.temperature, tier.max_output_tokens, tier.models)
+        return self._clients[tier.name]
+
+    def _estimate(self, messages: list, method: str) -> int:
+        input_tokens = estimate_tokens(messages)
+        metrics.incr("llm.input_tokens", input_tokens, method=method)
+        metrics.observe("llm.input_tokens_per_call", input_tokens, method=method)
+        return input_tokens + settings.llm_output_tokens_estimate
+
+    async def _invoke(self, messages: list, lane: str = BACKGROUND, method: str = ""):
+        governor = self._governor
+        tier = resolve_tier(method).name
+        client = self._client_for(method)
+        estimate = self._estimate(messages, method)
+        async with governor.slot(lane, estimate) as ticket:
+            start = time.perf_counter()
+            response = await client.ainvoke(messages)
+            usage = getattr(response, "usage_metadata", None)
+            tokens = usage["total_tokens"] if isinstance(usage, dict) and usage.get("total_tokens") else estimate
+            cancelled = _cancelled_hedges(response)
+            if cancelled:
+                # A cancelled hedge was sent the whole prompt and may have written most
+                # of a reply before losing; charge it the admission estimate
+                metrics.incr("llm.hedge_tokens", cancelled * estimate, tier=tier)
+                tokens += cancelled * estimate
+            if tokens != ticket.tokens:
+                ticket.settle(tokens)
+        self._record_tier(tier, method, time.perf_counter() - start, ticket.tokens)
+        return response
+
+    async def _invoke_stream(
+        self, messages: list, lane: str = BACKGROUND, method: str = ""
+    ) -> AsyncIterator[str]:
+        """Like ``_invoke``, but yields the reply's text as it arrives."""
+        governor = self._governor
+        tier = resolve_tier(method).name
+        client = self._client_for(method)
+        async with governor.slot(lane, self._estimate(messages, method)) as ticket:
+            start = time.perf_counter()
+            total = 0
+            async for chunk in client.astream(messages):
+                usage = getattr(chunk, "usage_metadata", None)
+                if isinstance(usage, dict):
+                    total += usage.get("total_tokens") or 0
+                if isinstance(chunk.content, str) and chunk.content:
+                    yield chunk.content
+            if total:
+                ticket.settle(total)
+        self._record_tier(tier, method, time.perf_counter() - start, ticket.tokens)
+
+    @staticmethod
+    def _record_tier(tier: str, method: str, seconds: float, tokens: int) -> None:
+        # Tokens are the provider-reported total when it sent one, else the estimate
+        metrics.incr("llm.tier.calls", tier=tier, method=method)
+        metrics.incr("llm.tier.tokens", tokens, tier=tier)
+        metrics.observe("llm.tier.latency_ms", seconds * 1000, tier=tier)
 
     async def profile_analysis(self, raw_data: dict, name: str = "") -> dict:
         filtered = {k: v for k, v in raw_data.items() if v}
         if not filtered:
             return _empty_dossier()
+        return await self._dossiers.get_or_analyze(
+            filtered,
+            name,
+            lambda: self._profile_analysis(filtered, name),
+            model=resolve_tier("profile_analysis").key,
+            prompt_version=self._profile_version(),
+            store_if=_has_content,
+        )
 
-        data_sources = list(filtered.keys())
-        human_content = json.dumps(filtered, indent=2, default=str)
-        prompt = PROFILE_SYSTEM_PROMPT.format(name=name or "this person")
-
-        response = await self._llm.ainvoke([
-            SystemMessage(content=prompt),
-            HumanMessage(content=human_content),
-        ])
+    async def stream_profile_analysis(self, raw_data: dict, name: str = "") -> AsyncIterator[dict]:
+        """``profile_analysis`` yielding partial dossiers as the reply streams in.
 
-        text = response.content.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+        Every partial is already schema-conformed, so callers can render it
+        as is; the last dossier yielded is the final one, and is stored like
+        ``profile_analysis`` stores it (blank ones are not). A stored dossier
+        is yielded once.
+        """
+        filtered = {k: v for k, v in raw_data.items() if v}
+        if not filtered:
+            yield _empty_dossier()
+            return
+        version = {"model": resolve_tier("profile_analysis").key, "prompt_version": self._profile_version()}
+        cached = await self._dossiers.get(filtered, name, **version)
+        if cached is not None:
+            yield cached
+            return
+
+        decoder = IncrementalDecoder()
+        last = None
+        async for text in self._invoke_stream(self._profile_messages(filtered, name), method="profile_analysis"):
+            partial = decoder.feed(text)
+            if isinstance(partial, dict) and partial != last:
+                last = partial
+                yield self._finish_dossier(partial, filtered)
+        try:
+            final = decoder.close()
+        except json.JSONDecodeError:
+            metrics.incr("llm_json.unrecoverable", method="profile_analysis")
+            final = None
+        dossier = self._finish_dossier(final, filtered)
+        if _has_content(dossier):
+            await self._dossiers.put(filtered, name, dossier, **version)
+        else:
+            metrics.incr("dossier_store.skipped")
+        yield dossier
+
+    @staticmethod
+    def _profile_version() -> str:
+        # The budget changes what the model sees, so it is part of the version
+        return f"{PROFILE_PROMPT_VERSION}:{settings.profile_token_budget}"
+
+    @staticmethod
+    def _profile_messages(filtered: dict, name: str) -> list:
+        human_content = compact_json(compact_raw_data(filtered, settings.profile_token_budget))
+        prompt = PROFILE_SYSTEM_PROMPT.format(name=name or "this person")
+        return [SystemMessage(content=prompt), HumanMessage(content=human_content)]
 
-        dossier = json.loads(text)
-        dossier["data_sources"] = data_sources
+    @staticmethod
+    def _finish_dossier(value: Any, filtered: dict) -> dict:
+        dossier = conform(value, "dossier", _empty_dossier())
+        dossier["data_sources"] = list(filtered.keys())
         return dossier
 
-    async def cross_reference(self, dossier_a: dict, dossier_b: dict, name_a: str = "", name_b: str = "") -> tuple[dict, bool]:
+    async def _profile_analysis(self, filtered: dict, name: str) -> dict:
+        response = await self._invoke(self._profile_messages(filtered, name), method="profile_analysis")
+        return self._finish_dossier(_decode_reply(response.content, "profile_analysis"), filtered)
+
+    async def cross_reference(
+        self, dossier_a: dict, dossier_b: dict, name_a: str = "", name_b: str = "", context: dict | None = None
+    ) -> tuple[dict, bool]:
+        """``context`` is the run's pair context; when given it is sent instead of both dossiers."""
         has_a = dossier_a and any(dossier_a.get(k) for k in ("public", "private"))
         has_b = dossier_b and any(dossier_b.get(k) for k in ("public", "private"))
         if not has_a or not has_b:
             return _empty_crossref(), False
 
-        human_content = json.dumps(
-            {name_a or "person_a": dossier_a, name_b or "person_b": dossier_b},
-            indent=2,
-            default=str,
-        )
-        prompt = CROSSREF_SYSTEM_PROMPT.format(
-            name_a=name_a or "Person A",
-            name_b=name_b or "Person B",
+        fp_a, fp_b = fingerprint(dossier_a), fingerprint(dossier_b)
+        if fp_a == fp_b:
+            return await self._cross_reference(dossier_a, dossier_b, name_a, name_b, context)
+
+        # Stored with the names it was written with, in fingerprint order, so a
+        # swapped or renamed request reuses it with the names substituted
+        names = {fp_a: name_a or DEFAULT_LABELS[0], fp_b: name_b or DEFAULT_LABELS[1]}
+        order = sorted(names)
+
+        async def compute() -> dict | None:
+            result, venue_appropriate = await self._cross_reference(dossier_a, dossier_b, name_a, name_b, context)
+            if result == _empty_crossref():
+                return None  # nothing usable in the reply; not worth storing
+            return {"result": result, "venue_appropriate": venue_appropriate, "names": [names[fp] for fp in order]}
+
+        key = PairCache.key(
+            "crossref",
+            fp_a,
+            fp_b,
+            context_mode(context),
+            resolve_tier("cross_reference").key,
+            CROSSREF_PROMPT_VERSION,
         )
-
-        response = await self._llm.ainvoke([
+        entry = await self._pairs.get_or_compute(key, compute)
+        if entry is None:
+            return _empty_crossref(), False
+        result = rename(entry["result"], dict(zip(entry["names"], (names[fp] for fp in order))))
+        return result, entry["venue_appropriate"]
+
+    async def _cross_reference(
+        self, dossier_a: dict, dossier_b: dict, name_a: str, name_b: str, context: dict | None = None
+    ) -> tuple[dict, bool]:
+        label_a, label_b = name_a or DEFAULT_LABELS[0], name_b or DEFAULT_LABELS[1]
+        if context is not None:
+            human_content = compact_json(crossref_view(context))
+        else:
+            human_content = compact_json({label_a: dossier_a, label_b: dossier_b})
+        prompt = CROSSREF_SYSTEM_PROMPT.format(name_a=label_a, name_b=label_b)
+
+        response = await self._invoke([
             SystemMessage(content=prompt),
             HumanMessage(content=human_content),
-        ])
+        ], method="cross_reference")
 
-        text = response.content.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-
-        result = json.loads(text)
-        venue_appropriate = result.pop("venue_appropriate", False)
-        return result, venue_appropriate
+        result = _decode_reply(response.content, "cross_reference")
+        venue_appropriate = result.pop("venue_appropriate", False) if isinstance(result, dict) else False
+        return conform(result, "crossref", _empty_crossref()), venue_appropriate is True
 
     async def brainstorm_venue_queries(self, context: dict) -> list[dict]:
-        human_content = json.dumps(context, indent=2, default=str)
+        human_content = compact_json(context)
 
-        response = await self._llm.ainvoke([
+        response = await self._invoke([
             SystemMessage(content=VENUE_SYSTEM_PROMPT),
             HumanMessage(content=f"BRAINSTORM MODE: Suggest queries based on this analysis:\n{human_content}"),
-        ])
-
-        text = response.content.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+        ], method="brainstorm_venue_queries")
 
         try:
-            result = json.loads(text)
-            return result.get("queries", [])
+            result = decode(response.content)
         except json.JSONDecodeError:
             return []
+        items = result.get("queries") if isinstance(result, dict) else None
+        return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
 
     async def rank_venues(self, candidates: list[dict], context: dict) -> list[dict]:
         data = {
             "analysis": context,
             "candidates": candidates
         }
-        human_content = json.dumps(data, indent=2, default=str)
+        human_content = compact_json(data)
 
-        response = await self._llm.ainvoke([
+        response = await self._invoke([
             SystemMessage(content=VENUE_SYSTEM_PROMPT),
             HumanMessage(content=f"RANK MODE: Select the best 3 venues from these candidates:\n{human_content}"),
-        ])
-
-        text = response.content.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+        ], method="rank_venues")
 
         try:
-            result = json.loads(text)
-            return result.get("venues", [])
+            result = decode(response.content)
         except json.JSONDecodeError:
             return []
+        items = result.get("venues") if isinstance(result, dict) else None
+        return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+    async def generate_coaching(
+        self, target_user: str, other_user: str, cross_ref: dict, venue: dict | None, context: dict | None = None
+    ) -> dict:
+        """``context`` is the run's coaching view (naming the target); when given it replaces the dossiers."""
+        fp_target, fp_other = fingerprint(target_user), fingerprint(other_user)
+        key = PairCache.key(
+            "coaching",
+            fp_target,
+            fp_other,
+            fp_target,
+            fingerprint({"cross_ref": cross_ref, "venue": venue}),
+            context_mode(context),
+            resolve_tier("generate_coaching").key,
+            COACHING_PROMPT_VERSION,
+        )
+        return await self._pairs.get_or_compute(
+            key, lambda: self._generate_coaching(target_user, other_user, cross_ref, venue, context)
+        )
 
-    async def generate_coaching(self, target_user: str, other_user: str, cross_ref: dict, venue: dict | None) -> dict:
-        data = {
-            "target_user_profile": target_user,
-            "other_user_profile": other_user,
-            "cross_reference": cross_ref,
-            "selected_venue": venue
-        }
-        human_content = json.dumps(data, indent=2, default=str)
-
-        response = await self._llm.ainvoke([
+    async def _generate_coaching(
+        self, target_user: str, other_user: str, cross_ref: dict, venue: dict | None, context: dict | None = None
+    ) -> dict:
+        if context is not None:
+            data = {"pair": context, "selected_venue": venue}
+        else:
+            data = {
+                "target_user_profile": target_user,
+                "other_user_profile": other_user,
+                "cross_reference": cross_ref,
+                "selected_venue": venue
+            }
+        human_content = compact_json(data)
+
+        response = await self._invoke([
             SystemMessage(content=COACHING_SYSTEM_PROMPT),
             HumanMessage(content=f"Generate coaching briefing for the target user:\n{human_content}"),
-        ])
-
-        text = response.content.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+        ], method="generate_coaching")
 
         try:
-            return json.loads(text)
+            result = decode(response.content)
         except json.JSONDecodeError:
             return {}
+        return conform(result, "coaching", {}) if isinstance(result, dict) else {}
+
+    async def generate_dual_coaching(
+        self, dossier_a: dict, dossier_b: dict, cross_ref: dict, venue: dict | None, context: dict | None = None
+    ) -> tuple[dict, dict] | None:
+        """Both users' briefings from one call, or None if the reply doesn't validate."""
+        fp_a, fp_b = fingerprint(dossier_a), fingerprint(dossier_b)
+        if fp_a == fp_b:
+            return await self._generate_dual_coaching(dossier_a, dossier_b, cross_ref, venue, context)
+
+        async def compute() -> dict | None:
+            pair = await self._generate_dual_coaching(dossier_a, dossier_b, cross_ref, venue, context)
+            return dict(zip((fp_a, fp_b), pair)) if pair else None
+
+        key = PairCache.key(
+            "coaching-dual",
+            fp_a,
+            fp_b,
+            fingerprint({"cross_ref": cross_ref, "venue": venue}),
+            context_mode(context),
+            resolve_tier("generate_dual_coaching").key,
+            DUAL_COACHING_PROMPT_VERSION,
+        )
+        briefings = await self._pairs.get_or_compute(key, compute)
+        return (briefings[fp_a], briefings[fp_b]) if briefings else None
+
+    async def _generate_dual_coaching(
+        self, dossier_a: dict, dossier_b: dict, cross_ref: dict, venue: dict | None, context: dict | None = None
+    ) -> tuple[dict, dict] | None:
+        if context is not None:
+            # The context keys people by label; say which label is user_a and which user_b
+            label_a, label_b = list(context["people"])[:2]
+            data = {"user_a": label_a, "user_b": label_b, "pair": context, "selected_venue": venue}
+        else:
+            data = {
+                "user_a_profile": dossier_a,
+                "user_b_profile": dossier_b,
+                "cross_reference": cross_ref,
+                "selected_venue": venue,
+            }
+        human_content = compact_json(data)
+
+        response = await self._invoke([
+            SystemMessage(content=DUAL_COACHING_SYSTEM_PROMPT),
+            HumanMessage(content=f"Generate coaching briefings for both users:\n{human_content}"),
+        ], method="generate_dual_coaching")
+
+        try:
+            result = decode(response.content)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(result, dict):
+            return None
+        briefing_a, briefing_b = result.get("user_a"), result.get("user_b")
+        if not (is_valid(briefing_a, "coaching") and is_valid(briefing_b, "coaching")):
+            return None
+        return briefing_a, briefing_b
 
     async def coach_chat(
         self,
@@ -293,8 +588,24 @@ class LLMService:
                 messages.append(AIMessage(content=msg["content"]))
         messages.append(HumanMessage(content=message))
 
-        response = await self._llm.ainvoke(messages)
+        response = await self._invoke(messages, lane=INTERACTIVE, method="coach_chat")
         return response.content.strip()
 
     async def analyze_image(self, image_url: str) -> dict:
         return {}
+
+
+_service: LLMService | None = None
+
+
+def get_llm_service() -> LLMService:
+    """The process-wide service; the app lifespan installs it, scripts and tests get one lazily."""
+    global _service
+    if _service is None:
+        _service = LLMService()
+    return _service
+
+
+def set_llm_service(service: LLMService | None) -> None:
+    global _service
+    _service = service
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.config import settings
+from app.services.metrics import metrics
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+# Highest priority first
+LANES = (INTERACTIVE, BACKGROUND)
+
+WINDOW = 60.0
+
+
+class Ticket:
+    """An admitted call's share of the token budget."""
+
+    def __init__(self, governor: LLMGovernor, entry: list[float]) -> None:
+        self._governor = governor
+        self._entry = entry
+
+    @property
+    def tokens(self) -> int:
+        return int(self._entry[1])
+
+    def settle(self, actual_tokens: int) -> None:
+        """Replace the up-front estimate with what the provider reported."""
+        self._governor._settle(self._entry, actual_tokens)
+
+
+class LLMGovernor:
+    """Process-wide limit on in-flight LLM calls and tokens per minute.
+
+    Callers queue in a lane and are admitted strictly by lane priority, so
+    a backlog of background analysis never gets ahead of an interactive
+    chat request. ``reserved_interactive`` slots are held back from the
+    background lane so a chat turn doesn't wait for a long analysis call
+    to finish. A call is charged its estimated tokens on admission; a call
+    larger than the whole budget is still admitted once the window is empty.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 8, tokens_per_minute: int = 0, reserved_interactive: int = 1
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.reserved_interactive = reserved_interactive
+        self.in_flight = 0
+        self._waiters: dict[str, deque[tuple[asyncio.Future, int]]] = {lane: deque() for lane in LANES}
+        self._window: deque[list[float]] = deque()
+        self._window_tokens = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def window_tokens(self) -> int:
+        self._expire(time.monotonic())
+        return int(self._window_tokens)
+
+    def queued(self, lane: str) -> int:
+        return sum(not fut.done() for fut, _ in self._waiters[lane])
+
+    @asynccontextmanager
+    async def slot(self, lane: str = BACKGROUND, tokens: int = 0) -> AsyncIterator[Ticket]:
+        if lane not in self._waiters:
+            raise ValueError(f"Unknown LLM lane: {lane}")
+        start = time.perf_counter()
+        fut: asyncio.Future[Ticket] = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append((fut, tokens))
+        self._dispatch()
+        try:
+            ticket = await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Admitted in the same tick we were cancelled
+                self._release()
+            else:
+                self._dispatch()
+            raise
+        metrics.observe("llm.governor.wait_ms", (time.perf_counter() - start) * 1000, lane=lane)
+        try:
+            yield ticket
+        finally:
+            self._release()
+
+    def _admit(self, lane: str, tokens: int, now: float) -> bool:
+        limit = self.max_concurrency
+        if lane != INTERACTIVE:
+            limit = max(1, limit - self.reserved_interactive)
+        if self.in_flight >= limit:
+            return False
+        if self.tokens_per_minute and self._window and self._window_tokens + tokens > self.tokens_per_minute:
+            self._schedule(self._window[0][0] + WINDOW - now)
+            return False
+        return True
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        self._expire(now)
+        for lane in LANES:
+            queue = self._waiters[lane]
+            while queue:
+                fut, tokens = queue[0]
+                if fut.done():
+                    queue.popleft()
+                    continue
+                if not self._admit(lane, tokens, now):
+                    # Strict priority: nothing below a blocked lane goes first
+                    self._publish()
+                    return
+                queue.popleft()
+                entry = [now, float(tokens)]
+                self._window.append(entry)
+                self._window_tokens += tokens
+                self.in_flight += 1
+                metrics.incr("llm.governor.admitted", lane=lane)
+                fut.set_result(Ticket(self, entry))
+        self._publish()
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _settle(self, entry: list[float], actual_tokens: int) -> None:
+        if any(e is entry for e in self._window):
+            self._window_tokens += actual_tokens - entry[1]
+        entry[1] = float(actual_tokens)
+        self._dispatch()
+
+    def _expire(self, now: float) -> None:
+        while self._window and self._window[0][0] + WINDOW <= now:
+            self._window_tokens -= self._window.popleft()[1]
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None and not self._timer.cancelled():
+            return
+
+        def fire() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = asyncio.get_running_loop().call_later(max(delay, 0.01), fire)
+
+    def _publish(self) -> None:
+        metrics.gauge("llm.governor.in_flight", self.in_flight)
+        metrics.gauge("llm.governor.window_tokens", self._window_tokens)
+        for lane in LANES:
+            metrics.gauge("llm.governor.queued", self.queued(lane), lane=lane)
+
+
+_governor: LLMGovernor | None = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    global _governor
+    if _governor is None:
+        _governor = LLMGovernor(
+            max_concurrency=settings.llm_max_concurrency,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            reserved_interactive=settings.llm_reserved_interactive,
+        )
+    return _governor
+
+
+def set_llm_governor(governor: LLMGovernor | None) -> None:
+    global _governor
+    _governor = governor
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.models.state import CoachingBriefing, CrossRefResult, Dossier
+from app.services.metrics import metrics
+
+# Compiled once; validating against a TypeAdapter is cheap, building one is not
+SCHEMAS: dict[str, TypeAdapter] = {
+    "dossier": TypeAdapter(Dossier),
+    "crossref": TypeAdapter(CrossRefResult),
+    "coaching": TypeAdapter(CoachingBriefing),
+}
+
+# How far back from the end of a truncated reply to look for a clean cut
+MAX_CUTS = 64
+
+
+class _Scanner:
+    """Tracks JSON structure across chunks so a truncated prefix can be closed.
+
+    Text before the first ``{``/``[`` (prose, a code fence) and after the
+    top-level value closes is ignored. Whitespace outside strings and
+    trailing commas are dropped as they are seen. ``cuts`` records points
+    where a value has just ended, with the closers needed at that point,
+    so a prefix that cannot be closed as is can fall back to the last
+    complete element.
+    """
+
+    def __init__(self) -> None:
+        self.out: list[str] = []
+        self.stack: list[str] = []
+        self.cuts: list[tuple[int, str]] = []
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.done = False
+
+    def feed(self, text: str) -> None:
+        for ch in text:
+            if self.done:
+                return
+            if not self.started:
+                if ch not in "{[":
+                    continue
+                self.started = True
+            if self.in_string:
+                self.out.append(ch)
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                    self._cut()
+            elif ch == '"':
+                self.in_string = True
+                self.out.append(ch)
+            elif ch in "{[":
+                self.out.append(ch)
+                self.stack.append("}" if ch == "{" else "]")
+                self._cut()
+            elif ch in "}]":
+                if self.out and self.out[-1] == ",":
+                    self.out.pop()
+                self.out.append(ch)
+                if self.stack:
+                    self.stack.pop()
+                self._cut()
+                self.done = not self.stack
+            elif ch == ",":
+                self._cut()
+                self.out.append(ch)
+            elif not ch.isspace():
+                self.out.append(ch)
+
+    def _cut(self) -> None:
+        self.cuts.append((len(self.out), "".join(reversed(self.stack))))
+        if len(self.cuts) > MAX_CUTS * 2:
+            del self.cuts[:MAX_CUTS]
+
+    def value(self) -> Any:
+        text = "".join(self.out)
+        if not self.started:
+            raise json.JSONDecodeError("No JSON value found", text, 0)
+        closers = "".join(reversed(self.stack))
+        candidates = []
+        if self.in_string:
+            candidates.append(text.removesuffix("\\") + '"' + closers)
+        candidates.append(text.rstrip(",:") + closers)
+        candidates.extend(text[:n] + c for n, c in reversed(self.cuts[-MAX_CUTS:]))
+        for candidate in candidates:
+            try:
+                return json.loads(candidate)
+            except ValueError:
+                continue
+        raise json.JSONDecodeError("Unrecoverable JSON", text, 0)
+
+
+def decode(text: str) -> Any:
+    """Parse an LLM reply, repairing it if needed.
+
+    Handles code fences and prose around the JSON, trailing commas and
+    output cut off mid-value (unterminated strings, unclosed arrays and
+    objects). Raises ``json.JSONDecodeError`` when no JSON value can be
+    recovered at all.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    scanner = _Scanner()
+    scanner.feed(text)
+    value = scanner.value()
+    metrics.incr("llm_json.repaired")
+    return value
+
+
+class IncrementalDecoder:
+    """Feed a streamed reply chunk by chunk and read the best parse so far.
+
+    ``feed`` returns the current partial value (or None before any JSON
+    has arrived); ``close`` returns the final value, raising like
+    ``decode`` if nothing is recoverable.
+    """
+
+    def __init__(self) -> None:
+        self._scanner = _Scanner()
+        self._raw: list[str] = []
+
+    def feed(self, chunk: str) -> Any | None:
+        self._raw.append(chunk)
+        self._scanner.feed(chunk)
+        try:
+            return self._scanner.value()
+        except json.JSONDecodeError:
+            return None
+
+    def close(self) -> Any:
+        raw = "".join(self._raw)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+        value = self._scanner.value()
+        metrics.incr("llm_json.repaired")
+        return value
+
+
+def _merge(defaults: Any, value: Any) -> Any:
+    if isinstance(defaults, dict) and isinstance(value, dict):
+        merged = copy.deepcopy(defaults)
+        for k, v in value.items():
+            merged[k] = _merge(defaults.get(k), v) if k in defaults else v
+        return merged
+    return value
+
+
+def _default_at(defaults: Any, loc: tuple) -> Any:
+    for part in loc:
+        if isinstance(defaults, dict) and part in defaults:
+            defaults = defaults[part]
+        else:
+            return None
+    return copy.deepcopy(defaults)
+
+
+def _reset(value: Any, loc: tuple, defaults: Any) -> None:
+    """Replace the field at ``loc`` with its default, or drop it if it has none."""
+    parent, path = value, ()
+    for part in loc[:-1]:
+        child = parent[part] if isinstance(parent, dict) and part in parent else None
+        if child is None and isinstance(parent, list) and isinstance(part, int) and part < len(parent):
+            child = parent[part]
+        if not isinstance(child, (dict, list)):
+            break
+        parent, path = child, (*path, part)
+    else:
+        part = loc[-1]
+        if isinstance(parent, list) and isinstance(part, int) and part < len(parent):
+            del parent[part]
+            return
+        if isinstance(parent, dict):
+            default = _default_at(defaults, (*path, part))
+            if default is None:
+                parent.pop(part, None)
+            else:
+                parent[part] = default
+            return
+    # The offending value sits above the error location; reset that instead
+    if path:
+        _reset(value, path, defaults)
+
+
+def _loc_order(error: dict) -> tuple:
+    return tuple((isinstance(part, str), part) for part in error["loc"])
+
+
+def conform(value: Any, schema: str, defaults: dict) -> dict:
+    """Fit a decoded reply to a precompiled schema, keeping every valid field.
+
+    Missing fields are filled from ``defaults``; wrongly typed fields are
+    reset to their default, and bad list items are dropped, so one bad field
+    doesn't throw away the rest of the reply.
+    """
+    adapter = SCHEMAS[schema]
+    merged = _merge(defaults, value if isinstance(value, dict) else {})
+    for _ in range(5):
+        try:
+            return adapter.validate_python(merged)
+        except ValidationError as exc:
+            metrics.incr("llm_json.schema_repairs", schema=schema)
+            # Deepest and last items first, so list indices stay valid while deleting;
+            # indices compare as ints ("10" sorts before "9" as a string)
+            for error in sorted(exc.errors(), key=_loc_order, reverse=True):
+                _reset(merged, tuple(error["loc"]), defaults)
+    return copy.deepcopy(defaults)
+
+
+def is_valid(value: Any, schema: str) -> bool:
+    """True if ``value`` has every field of the schema with exactly the right types."""
+    adapter = SCHEMAS[schema]
+    keys = adapter.core_schema.get("schema", adapter.core_schema).get("fields", {})
+    if not isinstance(value, dict) or not set(keys) <= value.keys():
+        return False
+    try:
+        adapter.validate_python(value, strict=True)
+    except ValidationError:
+        return False
+    return True
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from langchain_anthropic import ChatAnthropic
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app.config import settings
+from app.services.metrics import metrics
+
+GEMINI = "gemini"
+ANTHROPIC = "anthropic"
+
+# Weight of the newest sample in the moving averages
+ALPHA = 0.2
+# Seconds a fully failing provider is charged when ranking; a failure costs about a timeout
+ERROR_PENALTY = 30.0
+# Completed calls kept per provider for its latency p95, and how many it takes to trust it
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+
+
+class ProviderStats:
+    """Moving-average latency and error rate for one provider."""
+
+    def __init__(self) -> None:
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self._recent: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def score(self) -> float:
+        return (self.latency or 0.0) + self.error_rate * ERROR_PENALTY
+
+    @property
+    def p95(self) -> float | None:
+        """p95 of recent completed calls, or None until there are enough of them."""
+        if len(self._recent) < MIN_LATENCY_SAMPLES:
+            return None
+        return sorted(self._recent)[math.ceil(len(self._recent) * 0.95) - 1]
+
+    def success(self, seconds: float) -> None:
+        self._recent.append(seconds)
+        self._latency(seconds)
+        self.error_rate -= ALPHA * self.error_rate
+
+    def failure(self) -> None:
+        self.error_rate += ALPHA * (1.0 - self.error_rate)
+
+    def lost(self, seconds: float) -> None:
+        """Cancelled after ``seconds`` because another provider answered first.
+
+        Its real latency is at least that, so a provider that keeps losing
+        drifts down the ranking without being counted as an error.
+        """
+        if self.latency is None or seconds > self.latency:
+            self._latency(seconds)
+
+    def _latency(self, seconds: float) -> None:
+        self.latency = seconds if self.latency is None else self.latency + ALPHA * (seconds - self.latency)
+
+
+class ProviderRouter:
+    """Sends each call to the provider that has been fastest lately, and hedges.
+
+    Providers are ranked by moving-average latency plus a penalty for their
+    error rate; configured order breaks ties, so a provider that hasn't
+    answered yet is tried in turn. If the preferred provider hasn't answered
+    within its own recent p95 the same call goes to the next one, the first
+    answer wins and the other call is cancelled, so only the slowest ~5% of
+    calls are doubled. Until a provider has enough timed calls for a p95,
+    ``hedge_delay`` seconds is used instead. A provider that fails outright
+    fails over to the next at once. ``hedge_delay=0`` disables hedging but
+    keeps failover.
+
+    Quacks like a chat model (``ainvoke``/``astream``), so ``LLMService``
+    uses it in place of one. The winning response's ``response_metadata``
+    gets a ``router`` entry naming the provider and any calls that were
+    cancelled, so the caller can account for their tokens.
+    """
+
+    def __init__(self, models: dict[str, Any], hedge_delay: float = 0.0) -> None:
+        if not models:
+            raise ValueError("ProviderRouter needs at least one provider")
+        self._models = models
+        self.hedge_delay = hedge_delay
+        self.stats = {name: ProviderStats() for name in models}
+
+    @property
+    def providers(self) -> list[str]:
+        return list(self._models)
+
+    def ranked(self) -> list[str]:
+        order = list(self._models)
+        return sorted(order, key=lambda name: (self.stats[name].score, order.index(name)))
+
+    def hedge_after(self, name: str) -> float:
+        """Seconds to wait on ``name`` before hedging; 0 means never hedge."""
+        if self.hedge_delay <= 0:
+            return 0.0
+        p95 = self.stats[name].p95
+        return self.hedge_delay if p95 is None else p95
+
+    async def ainvoke(self, messages: list, **kwargs: Any) -> Any:
+        queue = self.ranked()
+        tasks: dict[asyncio.Task, str] = {}
+
+        def launch() -> None:
+            name = queue.pop(0)
+            tasks[asyncio.create_task(self._call(name, messages, **kwargs))] = name
+
+        launch()
+        # Hedging waits on the call that has been running longest
+        delay = self.hedge_after(next(iter(tasks.values())))
+        error: BaseException | None = None
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks, timeout=delay if queue and delay > 0 else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    metrics.incr("llm.router.hedged", provider=queue[0])
+                    launch()
+                    continue
+                for task in done:
+                    name = tasks.pop(task)
+                    if task.exception() is None:
+                        metrics.incr("llm.router.wins", provider=name)
+                        return self._annotate(task.result(), name, list(tasks.values()))
+                    error = task.exception()
+                if queue and not tasks:
+                    metrics.incr("llm.router.failover", provider=queue[0])
+                    launch()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self._publish()
+        assert error is not None
+        raise error
+
+    @staticmethod
+    def _annotate(response: Any, provider: str, cancelled: list[str]) -> Any:
+        metadata = getattr(response, "response_metadata", None)
+        if isinstance(metadata, dict):
+            metadata["router"] = {"provider": provider, "cancelled": cancelled}
+        return response
+
+    async def astream(self, messages: list, **kwargs: Any) -> AsyncIterator[Any]:
+        """Stream from the best-ranked provider, failing over only before the first chunk.
+
+        Not hedged: a stream that has started can't be swapped for another.
+        """
+        error: BaseException | None = None
+        for name in self.ranked():
+            started = False
+            try:
+                async for chunk in self._models[name].astream(messages, **kwargs):
+                    started = True
+                    yield chunk
+                return
+            except Exception as exc:
+                self.stats[name].failure()
+                metrics.incr("llm.router.errors", provider=name)
+                if started:
+                    raise
+                error = exc
+        assert error is not None
+        raise error
+
+    async def _call(self, name: str, messages: list, **kwargs: Any) -> Any:
+        stats = self.stats[name]
+        start = time.perf_counter()
+        try:
+            response = await self._models[name].ainvoke(messages, **kwargs)
+        except asyncio.CancelledError:
+            stats.lost(time.perf_counter() - start)
+            raise
+        except Exception:
+            stats.failure()
+            metrics.incr("llm.router.errors", provider=name)
+            raise
+        elapsed = time.perf_counter() - start
+        stats.success(elapsed)
+        metrics.observe("llm.router.latency_ms", elapsed * 1000, provider=name)
+        return response
+
+    def _publish(self) -> None:
+        for name, stats in self.stats.items():
+            if stats.latency is not None:
+                metrics.gauge("llm.router.latency_ewma_ms", stats.latency * 1000, provider=name)
+            if stats.p95 is not None:
+                metrics.gauge("llm.router.latency_p95_ms", stats.p95 * 1000, provider=name)
+            metrics.gauge("llm.router.error_rate", stats.error_rate, provider=name)
+
+
+@dataclass(frozen=True)
+class LLMTier:
+    name: str
+    models: dict[str, str]
+    temperature: float
+    max_output_tokens: int | None
+
+    @property
+    def key(self) -> str:
+        """Identifies what answers calls on this tier, for cache keys."""
+        return "+".join(f"{p}:{m}" for p, m in sorted(self.models.items()))
+
+
+def resolve_tier(method: str) -> LLMTier:
+    """The tier ``settings.llm_method_tiers`` assigns to an ``LLMService`` method."""
+    name = settings.llm_method_tiers.get(method, settings.llm_default_tier)
+    if name not in settings.llm_tiers:
+        raise ValueError(f"Unknown LLM tier {name!r} for {method or 'default'}")
+    config = settings.llm_tiers[name]
+    return LLMTier(
+        name=name,
+        models={
+            GEMINI: config.get(GEMINI) or settings.llm_model,
+            ANTHROPIC: config.get(ANTHROPIC) or settings.llm_anthropic_model,
+        },
+        temperature=float(config.get("temperature", 0.7)),
+        max_output_tokens=config.get("max_output_tokens") or None,
+    )
+
+
+def chat_model(provider: str, model: str, temperature: float, max_tokens: int | None = None) -> Any:
+    if provider == GEMINI:
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=settings.gemini_api_key,
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+    if provider == ANTHROPIC:
+        extra = {"max_tokens": max_tokens} if max_tokens else {}
+        return ChatAnthropic(model=model, api_key=settings.anthropic_api_key, temperature=temperature, **extra)
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def build_router(
+    temperature: float = 0.7, max_tokens: int | None = None, models: dict[str, str] | None = None
+) -> ProviderRouter:
+    """A router over ``settings.llm_providers`` that have an API key.
+
+    ``models`` maps provider to model name and defaults to ``llm_model`` and
+    ``llm_anthropic_model``. With no keys configured at all Gemini is still
+    used, so the missing key surfaces on the first call as it always has.
+    """
+    models = models or {GEMINI: settings.llm_model, ANTHROPIC: settings.llm_anthropic_model}
+    keys = {GEMINI: settings.gemini_api_key, ANTHROPIC: settings.anthropic_api_key}
+    providers = [p for p in settings.llm_providers if p in models and keys.get(p)] or [GEMINI]
+    return ProviderRouter(
+        {p: chat_model(p, models[p], temperature, max_tokens) for p in providers},
+        hedge_delay=settings.llm_hedge_delay_ms / 1000,
+    )
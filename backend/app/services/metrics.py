@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any
+
+
+def _key(name: str, labels: dict[str, Any]) -> str:
+    if not labels:
+        return name
+    inner = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{inner}}}"
+
+
+class Metrics:
+    """In-process counters, gauges and timing summaries, served at /metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(float)
+        self._gauges: dict[str, float] = {}
+        self._summaries: dict[str, dict[str, float]] = {}
+
+    def incr(self, name: str, value: float = 1, **labels: Any) -> None:
+        with self._lock:
+            self._counters[_key(name, labels)] += value
+
+    def gauge(self, name: str, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            s = self._summaries.get(key)
+            if s is None:
+                self._summaries[key] = {"count": 1, "sum": value, "max": value}
+            else:
+                s["count"] += 1
+                s["sum"] += value
+                s["max"] = max(s["max"], value)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        return self._counters.get(_key(name, labels), 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {k: dict(v) for k, v in self._summaries.items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+metrics = Metrics()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import copy
+import re
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.services.cache import CacheBackend, make_backend
+from app.services.metrics import metrics
+from app.services.singleflight import SingleFlight
+
+
+def rename(value: Any, names: dict[str, str]) -> Any:
+    """Swap whole-word occurrences of each old name for its new one, all at once."""
+    names = {old: new for old, new in names.items() if old and old != new}
+    if not names:
+        return value
+    pattern = re.compile(r"\b(" + "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True)) + r")\b")
+
+    def walk(v: Any) -> Any:
+        if isinstance(v, str):
+            return pattern.sub(lambda m: names[m.group(1)], v)
+        if isinstance(v, list):
+            return [walk(x) for x in v]
+        if isinstance(v, dict):
+            return {k: walk(x) for k, x in v.items()}
+        return v
+
+    return walk(value)
+
+
+class PairCache:
+    """LLM artifacts computed for a pair of dossiers: crossref, venues, coaching.
+
+    Keys start with the two dossier fingerprints in sorted order, so A/B
+    and B/A share entries, and any change to either dossier moves the pair
+    to new keys; the old entries simply age out. Callers add whatever else
+    the artifact depends on (prompt version, location, venue). Concurrent
+    misses for one key share a single computation, and empty results are
+    not stored.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 0.0) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._flights = SingleFlight("pair")
+
+    @staticmethod
+    def key(kind: str, fp_a: str, fp_b: str, *parts: str) -> str:
+        first, second = sorted((fp_a, fp_b))
+        return ":".join(("pair", kind, first, second, *parts))
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        kind = key.split(":", 2)[1]
+        cached = await self._backend.get(key)
+        if cached is not None:
+            metrics.incr("pair_cache.hits", kind=kind)
+            return copy.deepcopy(cached)
+        metrics.incr("pair_cache.misses", kind=kind)
+        return await self._flights.do(key, lambda: self._compute(key, compute))
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        value = await compute()
+        if value:
+            await self._backend.set(key, copy.deepcopy(value), self._ttl or None)
+        return value
+
+
+_cache: PairCache | None = None
+
+
+def get_pair_cache() -> PairCache:
+    global _cache
+    if _cache is None:
+        backend = make_backend(
+            settings.pair_cache_backend,
+            path=settings.pair_cache_dir,
+            max_entries=settings.pair_cache_max_entries,
+            url=settings.redis_url,
+            prefix="pairs",
+        )
+        _cache = PairCache(backend, ttl=settings.pair_cache_ttl)
+    return _cache
+
+
+def set_pair_cache(cache: PairCache | None) -> None:
+    global _cache
+    _cache = cache
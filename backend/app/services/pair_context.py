@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Part of the pair cache key of every result computed from a pair context, so
+# changing what the context carries (or how people are labelled) retires them
+PAIR_CONTEXT_VERSION = "1"
+
+# How the two people are labelled when no names are given; the same words the
+# prompts and pair cache renames use, so a label in a reply can be swapped back
+DEFAULT_LABELS = ("Person A", "Person B")
+
+# What each person contributes to the pair context, from their dossier
+_PUBLIC_FIELDS = ("vibe", "schedule_pattern")
+_PRIVATE_FIELDS = ("summary", "traits", "deep_cuts")
+
+
+def _signals(items: list[dict] | None, with_detail: bool = True) -> list[Any]:
+    """Crossref entries without their source attributions."""
+    out = []
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        if with_detail and item.get("detail"):
+            out.append({"signal": item.get("signal", ""), "detail": item["detail"]})
+        else:
+            out.append(item.get("signal", ""))
+    return out
+
+
+def build_pair_context(dossier_a: dict, dossier_b: dict, name_a: str = "", name_b: str = "") -> dict[str, Any]:
+    """One compact view of both dossiers, built once per pipeline run.
+
+    Tags and interests that appear in both dossiers (ignoring case) are
+    listed once under ``shared``; each person keeps only what is theirs.
+    The per-prompt views below select from this instead of re-sending the
+    full dossiers.
+    """
+    labels = (name_a or DEFAULT_LABELS[0], name_b or DEFAULT_LABELS[1])
+    dossiers = (dossier_a or {}, dossier_b or {})
+
+    def interests(d: dict) -> list[str]:
+        values = [*d.get("private", {}).get("interests", []), *d.get("public", {}).get("tags", [])]
+        unique: dict[str, str] = {}
+        for v in values:
+            if isinstance(v, str) and v:
+                unique.setdefault(v.lower(), v)
+        return list(unique.values())
+
+    lists = [interests(d) for d in dossiers]
+    common = {v.lower() for v in lists[0]} & {v.lower() for v in lists[1]}
+    shared = [v for v in lists[0] if v.lower() in common]
+
+    people: dict[str, dict[str, Any]] = {}
+    for label, d, values in zip(labels, dossiers, lists):
+        public, private = d.get("public", {}), d.get("private", {})
+        person = {f: public[f] for f in _PUBLIC_FIELDS if public.get(f)}
+        person.update({f: private[f] for f in _PRIVATE_FIELDS if private.get(f)})
+        own = [v for v in values if v.lower() not in common]
+        if own:
+            person["interests"] = own
+        if d.get("data_sources"):
+            person["sources"] = d["data_sources"]
+        people[label] = person
+
+    return {"people": people, "shared": shared}
+
+
+def context_mode(context: dict[str, Any] | None) -> str:
+    """Pair cache key part naming what a result was computed from: full dossiers or this context version."""
+    return f"context-v{PAIR_CONTEXT_VERSION}" if context is not None else "dossiers"
+
+
+def with_crossref(context: dict[str, Any], cross_ref: dict) -> dict[str, Any]:
+    """The pair context plus the crossref, minus its citations."""
+    return {
+        **context,
+        "crossref": {
+            "shared": _signals(cross_ref.get("shared")),
+            "complementary": _signals(cross_ref.get("complementary")),
+            "tension_points": _signals(cross_ref.get("tension_points")),
+        },
+    }
+
+
+def crossref_view(context: dict[str, Any]) -> dict[str, Any]:
+    return {"people": context["people"], "shared_interests": context["shared"]}
+
+
+def venue_view(context: dict[str, Any]) -> dict[str, Any]:
+    """Only what picking a place needs: schedules, common ground, complementary tastes."""
+    crossref = context.get("crossref", {})
+    return {
+        "schedules": {label: p.get("schedule_pattern", "mixed") for label, p in context["people"].items()},
+        "shared_interests": context["shared"],
+        "shared": _signals(crossref.get("shared"), with_detail=False),
+        "complementary": _signals(crossref.get("complementary"), with_detail=False),
+    }
+
+
+def coaching_view(context: dict[str, Any], target: str | None = None) -> dict[str, Any]:
+    """Everything but sources; ``target`` names whose briefing it is, None for both."""
+    people = {
+        label: {k: v for k, v in p.items() if k != "sources"} for label, p in context["people"].items()
+    }
+    view: dict[str, Any] = {"people": people, "shared_interests": context["shared"]}
+    if "crossref" in context:
+        view["crossref"] = context["crossref"]
+    if target is not None:
+        view["target"] = target
+    return view
@@ -1,20 +1,78 @@
+import re
+
 import httpx
 from app.config import settings
+from app.services.cache import CacheBackend, make_backend
+from app.services.http_clients import http_client
+from app.services.metrics import metrics
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+_LAT_LNG = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def geohash(lat: float, lng: float, precision: int = 5) -> str:
+    """Standard geohash; 5 characters is a cell of roughly 5 km."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, ch, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        ch <<= 1
+        if value >= mid:
+            ch |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[ch])
+            bits, ch = 0, 0
+    return "".join(chars)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+def location_bucket(location: str | None) -> str:
+    """Cache bucket for a location: a geohash cell for "lat,lng", else the normalized place name."""
+    if not location:
+        return "-"
+    m = _LAT_LNG.match(location)
+    if m:
+        return "gh:" + geohash(float(m.group(1)), float(m.group(2)), settings.places_geohash_precision)
+    return _normalize(location)
+
 
 class PlacesService:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient | None = None, cache: CacheBackend | None = None):
         self.api_key = settings.google_maps_api_key
+        self._client = client
+        self._cache = cache or get_places_cache()
         self.base_url = "https://places.googleapis.com/v1/places:searchText"
 
+    @staticmethod
+    def cache_key(query: str, location: str | None) -> str:
+        return f"{_normalize(query)}|{location_bucket(location)}"
+
     async def search_venue(self, query: str, location: str | None = None) -> list[dict]:
         """
         Search for a venue using Google Places API (New).
-        Requires GOOGLE_MAPS_API_KEY.
+        Requires GOOGLE_MAPS_API_KEY. Successful results are cached per
+        normalized query and location bucket for PLACES_CACHE_TTL seconds.
         """
         if not self.api_key:
             print("⚠️ No GOOGLE_MAPS_API_KEY found. Returning mock data.")
             return [{"name": f"Mock {query}", "address": "123 Discovery Way", "rating": 4.5}]
 
+        key = self.cache_key(query, location)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            metrics.incr("places_cache.hits")
+            return cached
+        metrics.incr("places_cache.misses")
+
         headers = {
             "Content-Type": "application/json",
             "X-Goog-Api-Key": self.api_key,
@@ -25,7 +83,7 @@ class PlacesService:
             "textQuery": f"{query} in {location}" if location else query
         }
 
-        async with httpx.AsyncClient() as client:
+        async with http_client("places", self._client) as client:
             resp = await client.post(self.base_url, json=data, headers=headers)
             
             if resp.status_code != 200:
@@ -45,4 +103,20 @@ class PlacesService:
                     "types": p.get("types", []),
                     "opening_hours": p.get("regularOpeningHours", {}).get("weekdayDescriptions", [])
                 })
+            await self._cache.set(key, formatted, settings.places_cache_ttl or None)
             return formatted
+
+
+_places_cache: CacheBackend | None = None
+
+
+def get_places_cache() -> CacheBackend:
+    global _places_cache
+    if _places_cache is None:
+        _places_cache = make_backend(
+            settings.places_cache_backend,
+            max_entries=settings.places_cache_max_entries,
+            url=settings.redis_url,
+            prefix="places",
+        )
+    return _places_cache
@@ -46,12 +46,20 @@ def linkedin_preview(data: dict) -> str:
     return name or "Profile connected"
 
 
+def books_preview(data: dict) -> str:
+    books = data.get("books", [])
+    if not books:
+        return "Connected (limited data)"
+    return f"{len(books)} books · " + ", ".join(b["title"] for b in books[:2])
+
+
 PREVIEW_GENERATORS: dict[str, callable] = {
     "github": github_preview,
     "letterboxd": letterboxd_preview,
     "spotify": spotify_preview,
     "instagram": instagram_preview,
     "linkedin": linkedin_preview,
+    "books": books_preview,
 }
 
 
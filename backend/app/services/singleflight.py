@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from app.services.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key onto one in-flight task.
+
+    Every caller awaits the shared task through ``asyncio.shield``, so a
+    caller that is cancelled (a client disconnecting, a deadline firing)
+    stops waiting without cancelling the work the others are waiting on.
+    The task runs to completion even if every caller has gone.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+            metrics.incr("singleflight.calls", flight=self.name)
+        else:
+            metrics.incr("singleflight.shared", flight=self.name)
+        return await asyncio.shield(task)
+
+    def tasks(self) -> list[asyncio.Task]:
+        return list(self._inflight.values())
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, so abandoned failures don't log "never retrieved"
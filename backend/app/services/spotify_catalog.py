@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Iterable
+
+import httpx
+
+from app.config import settings
+from app.services.cache import CacheBackend, make_backend
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50  # Spotify's cap for /artists?ids=
+
+
+def compact_artist(a: dict) -> dict[str, Any]:
+    return {
+        "id": a["id"],
+        "name": a["name"],
+        "genres": a.get("genres", []),
+        "popularity": a.get("popularity", 0),
+    }
+
+
+class SpotifyCatalog:
+    """Cross-user store of compact artist records keyed by Spotify ID.
+
+    Track objects only carry ``{id, name}`` for their artists; genres and
+    popularity live on full artist objects. ``artists`` resolves a list of
+    IDs from the store and fills the misses with batched ``/artists?ids=``
+    lookups, so an artist any user has already listened to is never
+    fetched again. Full artists seen in ``/me/top/artists`` are written
+    through with ``remember_in_background`` so a slow backend never holds
+    up the user's request.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float | None = None) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._pending: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    async def remember_artists(self, items: Iterable[dict]) -> list[dict[str, Any]]:
+        records = [compact_artist(a) for a in items if a.get("id")]
+        await asyncio.gather(*(self._backend.set(f"artist:{r['id']}", r, self._ttl) for r in records))
+        return records
+
+    def remember_in_background(self, artists: list[dict]) -> None:
+        """Write ``artists`` through without waiting; failures are logged."""
+        task = asyncio.create_task(self._remember_quietly(artists))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """Wait for background writes started so far."""
+        await asyncio.gather(*self._pending)
+
+    async def artists(
+        self, client: httpx.AsyncClient, ids: list[str], headers: dict[str, str]
+    ) -> list[dict[str, Any]]:
+        """Records for ``ids`` in order, repeats included; IDs Spotify doesn't know are dropped."""
+        unique = list(dict.fromkeys(ids))
+        cached = await asyncio.gather(*(self._backend.get(f"artist:{i}") for i in unique))
+        found = {i: r for i, r in zip(unique, cached) if r is not None}
+        missing = [i for i in unique if i not in found]
+        self._record(hits=len(found), misses=len(missing))
+
+        if missing:
+            batches = [missing[i:i + BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+            results = await asyncio.gather(*(self._fetch_batch(client, b, headers) for b in batches))
+            for items in results:
+                for record in await self.remember_artists(items):
+                    found[record["id"]] = record
+        return [found[i] for i in ids if i in found]
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    # ── internals ─────────────────────────────────────────────────
+
+    async def _remember_quietly(self, artists: list[dict]) -> None:
+        try:
+            await self.remember_artists(artists)
+        except Exception:
+            logger.warning("Writing %d artists to the catalog failed", len(artists), exc_info=True)
+
+    @staticmethod
+    async def _fetch_batch(client: httpx.AsyncClient, ids: list[str], headers: dict[str, str]) -> list[dict]:
+        resp = await client.get("/artists", params={"ids": ",".join(ids)}, headers=headers)
+        if resp.status_code == 401:
+            raise PermissionError("Spotify token expired or invalid")
+        resp.raise_for_status()
+        return [item for item in resp.json().get("artists", []) if item]
+
+    def _record(self, hits: int, misses: int) -> None:
+        self.hits += hits
+        self.misses += misses
+        if hits:
+            metrics.incr("spotify_catalog.hits", hits, kind="artist")
+        if misses:
+            metrics.incr("spotify_catalog.misses", misses, kind="artist")
+
+
+_catalog: SpotifyCatalog | None = None
+
+
+def get_spotify_catalog() -> SpotifyCatalog:
+    global _catalog
+    if _catalog is None:
+        backend = make_backend(
+            settings.spotify_catalog_backend,
+            path=settings.spotify_catalog_dir,
+            max_entries=settings.spotify_catalog_max_entries,
+        )
+        _catalog = SpotifyCatalog(backend, ttl=settings.spotify_catalog_ttl or None)
+    return _catalog
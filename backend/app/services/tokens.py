@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from langchain_core.messages import BaseMessage
+
+# Gemini and Claude both average roughly four characters per token on English and JSON
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(content: str | Iterable[BaseMessage]) -> int:
+    """Cheap token estimate for a prompt, good enough for budgeting without a tokenizer."""
+    if isinstance(content, str):
+        chars = len(content)
+    else:
+        chars = sum(len(m.content) if isinstance(m.content, str) else len(str(m.content)) for m in content)
+    return max(1, -(-chars // CHARS_PER_TOKEN))
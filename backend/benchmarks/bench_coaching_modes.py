@@ -0,0 +1,143 @@
+"""Compare coach_node's coaching modes against a simulated LLM.
+
+The fake model charges a fixed time to first token plus time per input
+and output token, which is roughly how a hosted model's latency scales.
+Reports wall-clock latency and input tokens sent per coach_node run for:
+
+    sequential  two generate_coaching calls, one after the other (previous behaviour)
+    parallel    the same two calls run concurrently (the fallback)
+    dual        both briefings from one call
+
+    cd backend && python -m benchmarks.bench_coaching_modes --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+from app.config import settings
+from app.graph.nodes.coach import coach_node
+from app.services.cache import MemoryBackend
+from app.services.dossier_store import DossierStore
+from app.services.llm import DUAL_COACHING_SYSTEM_PROMPT, LLMService
+from app.services.llm_governor import LLMGovernor
+from app.services.pair_cache import PairCache
+from app.services.tokens import estimate_tokens
+
+FIRST_TOKEN_S = 0.25
+PREFILL_S_PER_TOKEN = 0.00002
+DECODE_S_PER_TOKEN = 0.0005
+
+BRIEFING = {
+    "match_intel": "You both keep late hours and care about craft; lead with that. " * 2,
+    "conversation_playbook": [
+        "Ask which Kubrick film they'd show someone first and why.",
+        "Trade the weirdest bug you've chased at 3am.",
+        "What's a place in the city that only makes sense after midnight?",
+    ],
+    "minefield_map": ["Don't turn film talk into a ranking contest.", "Skip the early-morning gym plans."],
+    "venue_cheat_sheet": "A late repertory screening gives you a shared thing to react to.",
+    "vibe_calibration": "Chill and observant",
+}
+
+
+def _dossier(name: str, interests: list[str]) -> dict:
+    return {
+        "public": {"vibe": f"{name} is a night-owl maker", "tags": interests[:6], "schedule_pattern": "night_owl"},
+        "private": {
+            "summary": f"{name} builds and watches things late into the night. " * 3,
+            "traits": ["deep-focus builder", "curious", "dry humour", "night owl"],
+            "interests": interests,
+            "deep_cuts": [f"{name} once rewatched a film frame by frame", f"{name} keeps a bug diary"],
+        },
+        "data_sources": ["github", "letterboxd", "spotify"],
+    }
+
+
+DOSSIER_A = _dossier("Ada", ["Python", "Rust", "Kubrick", "synthwave", "bouldering", "ramen", "Tarkovsky", "Go"])
+DOSSIER_B = _dossier("Grace", ["Kubrick", "jazz", "film photography", "TypeScript", "noir", "espresso", "Wong Kar-wai"])
+CROSSREF = {
+    "shared": [{"signal": "Kubrick", "detail": "Both rate Kubrick highly", "source": "letterboxd"}] * 3,
+    "complementary": [{"signal": "code vs film", "detail": "Ada builds, Grace frames", "source": "both"}] * 2,
+    "tension_points": [{"signal": "pace", "detail": "Ada binges, Grace savours", "source": "letterboxd"}],
+    "citations": ["Ada: 3am commits", "Grace: 40 Kubrick logs", "Both: night_owl"],
+}
+STATE = {
+    "user_a": {"dossier": DOSSIER_A},
+    "user_b": {"dossier": DOSSIER_B},
+    "cross_ref": CROSSREF,
+    "venues": [{"name": "Film Forum", "address": "209 W Houston St", "reason": "Late repertory screenings"}],
+}
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.input_tokens = 0
+
+    async def ainvoke(self, messages):
+        tokens_in = estimate_tokens(messages)
+        self.input_tokens += tokens_in
+        if messages[0].content == DUAL_COACHING_SYSTEM_PROMPT:
+            reply = json.dumps({"user_a": BRIEFING, "user_b": BRIEFING})
+        else:
+            reply = json.dumps(BRIEFING)
+        tokens_out = estimate_tokens(reply)
+        await asyncio.sleep(FIRST_TOKEN_S + tokens_in * PREFILL_S_PER_TOKEN + tokens_out * DECODE_S_PER_TOKEN)
+        return MagicMock(content=reply, usage_metadata=None)
+
+
+async def _sequential(llm: LLMService) -> None:
+    venue = STATE["venues"][0]
+    await llm.generate_coaching(DOSSIER_A, DOSSIER_B, CROSSREF, venue)
+    await llm.generate_coaching(DOSSIER_B, DOSSIER_A, CROSSREF, venue)
+
+
+def uncached_service(model, governor: LLMGovernor) -> LLMService:
+    """An LLMService answering every tier from ``model``, with empty caches."""
+    return LLMService(
+        governor=governor,
+        dossiers=DossierStore(MemoryBackend()),
+        pairs=PairCache(MemoryBackend()),
+        clients={tier: model for tier in settings.llm_tiers},
+    )
+
+
+async def _run(mode: str, runs: int) -> None:
+    model = _FakeModel()
+    governor = LLMGovernor(max_concurrency=8)
+
+    latencies: list[float] = []
+    with patch("app.graph.nodes.coach.settings.coaching_mode", mode):
+        for _ in range(runs):
+            # A fresh service per run, so every run calls the model rather than the pair cache
+            llm = uncached_service(model, governor)
+            with patch("app.graph.nodes.coach.get_llm_service", return_value=llm):
+                start = time.perf_counter()
+                if mode == "sequential":
+                    await _sequential(llm)
+                else:
+                    await coach_node(STATE)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    p95 = sorted(latencies)[math.ceil(len(latencies) * 0.95) - 1]
+    print(
+        f"{mode:<11} mean {statistics.mean(latencies):7.1f} ms   p95 {p95:7.1f} ms   "
+        f"input tokens/run {model.input_tokens / runs:7.0f}"
+    )
+
+
+async def main(runs: int) -> None:
+    for mode in ("sequential", "parallel", "dual"):
+        await _run(mode, runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    asyncio.run(main(parser.parse_args().runs))
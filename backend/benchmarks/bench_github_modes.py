@@ -0,0 +1,90 @@
+"""Compare GitHubConnector's REST and GraphQL modes against a local stub.
+
+Runs tests/github_stub.py behind a real HTTP server on localhost and
+reports latency, request count and response bytes for each mode.
+
+    cd backend && python -m benchmarks.bench_github_modes --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from app.connectors.github import GitHubConnector
+from app.services.cache import MemoryBackend
+from app.services.etag_cache import ETagCache
+from tests.github_stub import GitHubStub
+
+
+def _serve(stub: GitHubStub) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://stub{self.path}",
+                headers=dict(self.headers),
+                content=self.rfile.read(length) if length else b"",
+            )
+            resp = stub.handler(request)
+            self.send_response(resp.status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(resp.content)))
+            self.end_headers()
+            self.wfile.write(resp.content)
+
+        do_GET = do_POST = _dispatch
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(mode: str, runs: int) -> None:
+    stub = GitHubStub()
+    server = _serve(stub)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    latencies: list[float] = []
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            connector = GitHubConnector(
+                client=client, etag_cache=ETagCache(MemoryBackend()), mode=mode, token="stub-token"
+            )
+            await connector.fetch(stub.login)  # warm-up
+            stub.requests = stub.bytes_sent = 0
+            for _ in range(runs):
+                start = time.perf_counter()
+                await connector.fetch(stub.login)
+                latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        server.shutdown()
+
+    p95 = sorted(latencies)[math.ceil(len(latencies) * 0.95) - 1]
+    print(
+        f"{mode:<8} mean {statistics.mean(latencies):7.1f} ms   p95 {p95:7.1f} ms   "
+        f"requests/fetch {stub.requests / runs:4.1f}   bytes/fetch {stub.bytes_sent / runs / 1024:8.1f} KiB"
+    )
+
+
+async def main(runs: int) -> None:
+    for mode in ("rest", "graphql"):
+        await _run(mode, runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    asyncio.run(main(parser.parse_args().runs))
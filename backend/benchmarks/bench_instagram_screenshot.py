@@ -0,0 +1,100 @@
+"""Per-request memory of InstagramConnector's screenshot handling.
+
+Drives the browser tier against a fake page that returns a viewport-sized
+PNG and compares, per fetch, peak Python allocations and the size of the
+JSON result for:
+
+    legacy    capture every time and inline it as base64 (previous behaviour)
+    default   no screenshot (what ingest and /api/connect do unless asked)
+    opt-in    capture and write to the blob store, return a hash reference
+
+    cd backend && python -m benchmarks.bench_instagram_screenshot --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import statistics
+import tempfile
+import tracemalloc
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+from app.connectors.instagram import InstagramConnector
+from app.services.blobs import BlobStore
+
+# A 1280x720 viewport PNG of a profile page is typically a few hundred KiB
+PNG = b"\x89PNG\r\n\x1a\n" + os.urandom(400 * 1024)
+
+
+class _FakePage:
+    url = "https://www.instagram.com/bench/"
+
+    async def goto(self, *args, **kwargs):
+        pass
+
+    async def title(self):
+        return "bench on Instagram"
+
+    async def wait_for_selector(self, *args, **kwargs):
+        return None
+
+    async def query_selector(self, *args, **kwargs):
+        return None
+
+    async def screenshot(self, **kwargs):
+        return memoryview(PNG).tobytes()  # a fresh buffer, like Playwright hands back
+
+
+class _FakePool:
+    @asynccontextmanager
+    async def page(self, user_agent):
+        yield _FakePage()
+
+
+class _OfflineInstagram(InstagramConnector):
+    async def _fetch_profile_http(self, username):
+        return {}
+
+
+class _LegacyInstagram(_OfflineInstagram):
+    async def fetch(self, identifier, *, screenshot=False):
+        raw = await self._fetch_profile_browser(identifier, screenshot=True)
+        profile = self._extract_profile_data(raw)
+        profile["screenshot_b64"] = base64.b64encode(raw["screenshot_bytes"]).decode("utf-8")
+        return profile
+
+
+async def _measure(connector: InstagramConnector, screenshot: bool, runs: int) -> tuple[float, float]:
+    peaks, sizes = [], []
+    for _ in range(runs):
+        tracemalloc.start()
+        result = await connector.fetch("bench", screenshot=screenshot)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+        sizes.append(len(json.dumps(result)) / 1024)
+    return statistics.mean(peaks), statistics.mean(sizes)
+
+
+async def main(runs: int) -> None:
+    with tempfile.TemporaryDirectory() as root, \
+         patch("app.connectors.instagram.asyncio.sleep", AsyncMock()):
+        store = BlobStore(root)
+        modes = [
+            ("legacy", _LegacyInstagram(_FakePool(), store), True),
+            ("default", _OfflineInstagram(_FakePool(), store), False),
+            ("opt-in", _OfflineInstagram(_FakePool(), store), True),
+        ]
+        for name, connector, screenshot in modes:
+            peak, size = await _measure(connector, screenshot, runs)
+            print(f"{name:<8} peak alloc {peak:8.1f} KiB/request   result {size:8.2f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    asyncio.run(main(parser.parse_args().runs))
@@ -0,0 +1,90 @@
+"""Compare feedparser against the streaming Letterboxd feed parser.
+
+Generates RSS feeds of increasing size shaped like Letterboxd's (namespaced
+film metadata, CDATA review bodies) and times both parsers producing the
+first 20 films, plus peak Python memory for each.
+
+    cd backend && python -m benchmarks.bench_letterboxd_feed --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import time
+import tracemalloc
+
+import feedparser
+
+from app.connectors.letterboxd import FeedStreamParser, LetterboxdConnector
+
+CHUNK = 16 * 1024
+
+
+def make_feed(items: int) -> bytes:
+    body = "<p>" + "A long review paragraph about framing and score. " * 20 + "</p>"
+    parts = [
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss version="2.0" xmlns:letterboxd="https://letterboxd.com" '
+        'xmlns:tmdb="https://themoviedb.org" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        "<channel><title>Letterboxd - bench</title><link>https://letterboxd.com/bench/</link>"
+    ]
+    for i in range(items):
+        parts.append(
+            f"<item><title>Film {i}, 2024 - ★★★½</title>"
+            f"<link>https://letterboxd.com/bench/film/film-{i}/</link>"
+            f'<guid isPermaLink="false">letterboxd-review-{i}</guid>'
+            "<pubDate>Sun, 1 Dec 2024 10:00:00 +1300</pubDate>"
+            "<letterboxd:watchedDate>2024-11-30</letterboxd:watchedDate>"
+            f"<letterboxd:filmTitle>Film {i}</letterboxd:filmTitle>"
+            "<letterboxd:filmYear>2024</letterboxd:filmYear>"
+            "<letterboxd:memberRating>3.5</letterboxd:memberRating>"
+            f"<tmdb:movieId>{1000 + i}</tmdb:movieId>"
+            f"<description><![CDATA[{body}]]></description>"
+            "<dc:creator>bench</dc:creator></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode()
+
+
+def run_feedparser(data: bytes) -> list[dict]:
+    return LetterboxdConnector._extract_films(feedparser.parse(data.decode()))
+
+
+def run_stream(data: bytes) -> list[dict]:
+    parser = FeedStreamParser()
+    for i in range(0, len(data), CHUNK):
+        if parser.feed(data[i:i + CHUNK]):
+            break
+    return LetterboxdConnector._extract_films({"entries": parser.entries})
+
+
+def _measure(fn, data: bytes, runs: int) -> tuple[float, float, float]:
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(data)
+        latencies.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    fn(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    p95 = sorted(latencies)[math.ceil(len(latencies) * 0.95) - 1]
+    return statistics.mean(latencies), p95, peak / 1024
+
+
+def main(runs: int) -> None:
+    for items in (50, 500, 5000):
+        data = make_feed(items)
+        assert run_feedparser(data) == run_stream(data)
+        print(f"{items} items ({len(data) / 1024:.0f} KiB)")
+        for name, fn in (("feedparser", run_feedparser), ("stream", run_stream)):
+            mean, p95, peak = _measure(fn, data, runs)
+            print(f"  {name:<10} mean {mean:8.2f} ms   p95 {p95:8.2f} ms   peak {peak:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    main(parser.parse_args().runs)
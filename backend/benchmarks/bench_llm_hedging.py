@@ -0,0 +1,85 @@
+"""Tail latency of LLM calls with and without hedging across two providers.
+
+Each fake provider usually answers in about BASE_S, but a fraction of
+calls hit a slow path that takes SLOW_S, which is what drives our p99.
+Reports p50/p95/p99 and how many extra calls hedging cost for:
+
+    single   every call to the first provider (previous behaviour)
+    hedged   ProviderRouter hedging at the primary's observed p95
+             (HEDGE_DELAY_S until it has enough samples)
+
+Times are scaled down ten-fold from production so the run is quick.
+
+    cd backend && python -m benchmarks.bench_llm_hedging --runs 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+
+from app.services.llm_router import ANTHROPIC, GEMINI, ProviderRouter
+
+BASE_S = 0.08
+JITTER_S = 0.02
+SLOW_S = 0.8
+SLOW_FRACTION = 0.05
+HEDGE_DELAY_S = 0.15
+CONCURRENCY = 16
+
+
+class _FakeProvider:
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        slow = self._rng.random() < SLOW_FRACTION
+        await asyncio.sleep(SLOW_S if slow else BASE_S + self._rng.uniform(-JITTER_S, JITTER_S))
+        return messages
+
+
+def _pct(latencies: list[float], q: float) -> float:
+    return sorted(latencies)[math.ceil(len(latencies) * q) - 1]
+
+
+async def _run(mode: str, runs: int) -> None:
+    rng = random.Random(7)
+    providers = {GEMINI: _FakeProvider(rng), ANTHROPIC: _FakeProvider(rng)}
+    if mode == "single":
+        router = ProviderRouter({GEMINI: providers[GEMINI]})
+    else:
+        router = ProviderRouter(providers, hedge_delay=HEDGE_DELAY_S)
+
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(CONCURRENCY)
+
+    async def one() -> None:
+        async with sem:
+            start = time.perf_counter()
+            await router.ainvoke([])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(runs)))
+    calls = sum(p.calls for p in providers.values())
+    print(
+        f"{mode:<7} p50 {_pct(latencies, 0.5):6.1f} ms   p95 {_pct(latencies, 0.95):6.1f} ms   "
+        f"p99 {_pct(latencies, 0.99):6.1f} ms   mean {statistics.mean(latencies):6.1f} ms   "
+        f"extra calls {calls / runs - 1:5.1%}"
+    )
+
+
+async def main(runs: int) -> None:
+    for mode in ("single", "hedged"):
+        await _run(mode, runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=400)
+    asyncio.run(main(parser.parse_args().runs))
@@ -0,0 +1,91 @@
+"""Input tokens per LLM method for the crossref → venue → coach stages.
+
+Runs the three nodes against a stub model and stub Places search, once
+sending full dossiers to every prompt (previous behaviour) and once with
+the pair context crossref_node builds, and prints the ``llm.input_tokens``
+counters per method.
+
+    cd backend && python -m benchmarks.bench_pair_context --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.nodes.coach import coach_node
+from app.graph.nodes.crossref import crossref_node
+from app.graph.nodes.venue import venue_node
+from app.services.llm import LLMService
+from app.services.llm_governor import LLMGovernor
+from app.services.metrics import metrics
+from app.services.pair_cache import set_pair_cache
+from benchmarks.bench_coaching_modes import BRIEFING, CROSSREF, DOSSIER_A, DOSSIER_B, uncached_service
+
+METHODS = ("cross_reference", "brainstorm_venue_queries", "rank_venues", "generate_dual_coaching")
+CANDIDATES = [
+    {"name": f"Venue {i}", "address": f"{i} Main St", "rating": 4.5, "opening_hours": ["Mon-Sun 18:00-02:00"]}
+    for i in range(5)
+]
+
+
+def _reply(messages) -> str:
+    human = messages[-1].content
+    if human.startswith("BRAINSTORM"):
+        return json.dumps({"queries": [{"name": "cinema", "search_query": "late cinema"}]})
+    if human.startswith("RANK"):
+        return json.dumps({"venues": CANDIDATES[:3]})
+    if "both users" in human:
+        return json.dumps({"user_a": BRIEFING, "user_b": BRIEFING})
+    if "target user" in human:
+        return json.dumps(BRIEFING)
+    return json.dumps({**CROSSREF, "venue_appropriate": True})
+
+
+async def _pipeline(llm: LLMService, use_context: bool) -> None:
+    set_pair_cache(None)  # venue_node's cache; measure every call, not cache hits
+    state: dict = {"user_a": {"dossier": DOSSIER_A}, "user_b": {"dossier": DOSSIER_B}}
+    update = await crossref_node(state)
+    if not use_context:
+        update.pop("pair_context")
+    state.update(update)
+    state.update(await venue_node(state))
+    await coach_node(state)
+
+
+async def _run(use_context: bool, runs: int) -> dict[str, float]:
+    model = MagicMock()
+    model.ainvoke = AsyncMock(side_effect=lambda messages: MagicMock(content=_reply(messages), usage_metadata=None))
+    governor = LLMGovernor()
+
+    metrics.reset()
+    with patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+        MockPlaces.return_value.search_venue = AsyncMock(return_value=CANDIDATES)
+        for _ in range(runs):
+            # A fresh service per run, so every call is measured rather than a cache hit
+            llm = uncached_service(model, governor)
+            if not use_context:
+                cross_reference = llm.cross_reference
+                llm.cross_reference = lambda a, b, context=None, _call=cross_reference: _call(a, b)
+            with patch("app.graph.nodes.crossref.get_llm_service", return_value=llm), \
+                 patch("app.graph.nodes.venue.get_llm_service", return_value=llm), \
+                 patch("app.graph.nodes.coach.get_llm_service", return_value=llm):
+                await _pipeline(llm, use_context)
+    return {m: metrics.counter("llm.input_tokens", method=m) / runs for m in METHODS}
+
+
+async def main(runs: int) -> None:
+    before = await _run(False, runs)
+    after = await _run(True, runs)
+    print(f"{'method':<26} {'dossiers':>9} {'context':>9}")
+    for m in METHODS:
+        print(f"{m:<26} {before[m]:9.0f} {after[m]:9.0f}")
+    print(f"{'total':<26} {sum(before.values()):9.0f} {sum(after.values()):9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    asyncio.run(main(parser.parse_args().runs))
@@ -0,0 +1,135 @@
+"""Prompt size and latency of profile analysis with and without compaction.
+
+Builds connector bundles from the GitHub stub and synthetic Spotify,
+Letterboxd and book data at the connectors' maximum sizes, then runs
+LLMService.profile_analysis against a simulated model (fixed time to
+first token plus time per prompt token) in two modes:
+
+    raw        the filtered bundle as indented JSON (previous behaviour)
+    compact    compact_raw_data under PROFILE_TOKEN_BUDGET, compact JSON
+
+    cd backend && python -m benchmarks.bench_profile_compaction --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+from app.config import settings
+from app.connectors.github import GitHubConnector
+from app.services.llm_governor import LLMGovernor
+from app.services.tokens import estimate_tokens
+from benchmarks.bench_coaching_modes import uncached_service
+from tests.github_stub import GitHubStub
+
+FIRST_TOKEN_S = 0.25
+PREFILL_S_PER_TOKEN = 0.00002
+DOSSIER = json.dumps({"public": {"vibe": "x", "tags": []}, "private": {"summary": "x"}})
+
+GENRES = ["indie rock", "art pop", "dream pop", "shoegaze", "neo soul", "alt r&b", "jazz rap", "post-punk"]
+
+
+def _github() -> dict:
+    stub = GitHubStub()
+    return {
+        "languages": GitHubConnector._extract_languages(stub.repos),
+        "repos": GitHubConnector._extract_repos(stub.repos),
+        "commit_hours": GitHubConnector._extract_commit_hours(stub.events),
+        "starred_topics": [f"{t}-{i}" for i, t in enumerate(GitHubConnector._extract_starred_topics(stub.starred) * 17)][:100],
+    }
+
+
+def _spotify() -> dict:
+    return {
+        "top_artists": [
+            {"name": f"Artist {i}", "genres": GENRES[i % 5: i % 5 + 3], "popularity": 40 + i % 50} for i in range(50)
+        ],
+        "top_genres": GENRES,
+        "top_tracks": [{"name": f"Track number {i}", "artist": f"Artist {i % 12}"} for i in range(50)],
+        "listening_hours": [(i * 7) % 24 for i in range(50)],
+    }
+
+
+def _letterboxd() -> dict:
+    return {"recent_films": [
+        {"title": f"Film {i}", "rating": (i % 10) / 2 or None, "link": f"https://letterboxd.com/user/film/film-{i}/"}
+        for i in range(20)
+    ]}
+
+
+def _books() -> dict:
+    return {
+        "books": [
+            {"title": f"Book {i}", "authors": [f"Author {i % 7}"], "year": 1950 + i,
+             "subjects": ["Fiction", "Science fiction", f"Subject {i}", "Philosophy"]}
+            for i in range(20)
+        ],
+        "unresolved": [],
+    }
+
+
+BUNDLES = {
+    "github": {"github": _github()},
+    "full": {"github": _github(), "spotify": _spotify(), "letterboxd": _letterboxd(), "books": _books()},
+}
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.tokens = 0
+
+    async def ainvoke(self, messages):
+        tokens = estimate_tokens(messages)
+        self.tokens += tokens
+        await asyncio.sleep(FIRST_TOKEN_S + tokens * PREFILL_S_PER_TOKEN)
+        return MagicMock(content=DOSSIER, usage_metadata=None)
+
+
+async def _run(bundle_name: str, mode: str, runs: int) -> None:
+    model = _FakeModel()
+    governor = LLMGovernor(max_concurrency=8)
+
+    patches = []
+    if mode == "raw":
+        patches = [
+            patch("app.services.llm.compact_raw_data", lambda data, budget: data),
+            patch("app.services.llm.compact_json", lambda value: json.dumps(value, indent=2, default=str)),
+        ]
+    for p in patches:
+        p.start()
+    latencies: list[float] = []
+    try:
+        for _ in range(runs):
+            # A fresh service per run, so every run calls the model rather than the dossier store
+            llm = uncached_service(model, governor)
+            start = time.perf_counter()
+            await llm.profile_analysis(BUNDLES[bundle_name])
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        for p in patches:
+            p.stop()
+
+    p95 = sorted(latencies)[math.ceil(len(latencies) * 0.95) - 1]
+    print(
+        f"{bundle_name:<7} {mode:<8} prompt tokens {model.tokens / runs:7.0f}   "
+        f"mean {statistics.mean(latencies):7.1f} ms   p95 {p95:7.1f} ms"
+    )
+
+
+async def main(runs: int) -> None:
+    print(f"budget {settings.profile_token_budget} tokens")
+    for bundle_name in BUNDLES:
+        for mode in ("raw", "compact"):
+            await _run(bundle_name, mode, runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    asyncio.run(main(parser.parse_args().runs))
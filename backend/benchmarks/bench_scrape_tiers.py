@@ -0,0 +1,112 @@
+"""Compare the HTTP-first scrape tier against the headless-browser tier.
+
+Serves the HTML fixtures in tests/fixtures from a local HTTP server and runs
+both tiers of the Instagram and LinkedIn connectors against it, reporting
+latency and memory for each.
+
+    cd backend && python -m benchmarks.bench_scrape_tiers --runs 10
+
+The browser tier needs Chromium (``playwright install chromium``); it is
+skipped with a note when no browser is available.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import math
+import statistics
+import threading
+import time
+import tracemalloc
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from app.connectors import instagram, linkedin
+from app.services.browser_pool import BrowserPool, _process_tree_rss_mb
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+ROUTES = {
+    "/instagram/archdigest/": "instagram_profile.html",
+    "/linkedin/janedoe/": "linkedin_profile.html",
+}
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        name = ROUTES.get(self.path)
+        if not name:
+            self.send_error(404)
+            return
+        body = (FIXTURES / name).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve() -> tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def _measure(label: str, fn, runs: int) -> None:
+    await fn()  # warm-up
+    latencies: list[float] = []
+    rss_before = _process_tree_rss_mb()
+    tracemalloc.start()
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _process_tree_rss_mb()
+    p95 = sorted(latencies)[math.ceil(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<28} mean {statistics.mean(latencies):8.1f} ms   p95 {p95:8.1f} ms   "
+        f"py-peak {peak / 1024:8.1f} KiB   tree-rss {rss_after:7.1f} MiB ({rss_after - rss_before:+.1f})"
+    )
+
+
+async def main(runs: int) -> None:
+    server, base = _serve()
+    instagram.PROFILE_URL = base + "/instagram/{username}/"
+    linkedin.PROFILE_URL = base + "/linkedin/{username}/"
+
+    ig = instagram.InstagramConnector()
+    li = linkedin.LinkedInConnector()
+
+    print(f"HTTP tier ({runs} runs)")
+    await _measure("instagram http", functools.partial(ig._fetch_profile_http, "archdigest"), runs)
+    await _measure("linkedin http", functools.partial(li._fetch_profile_http, "janedoe"), runs)
+
+    pool = BrowserPool(size=1, max_concurrency=1, health_interval=0)
+    try:
+        await pool.start()
+        ig_browser = instagram.InstagramConnector(browser_pool=pool)
+        li_browser = linkedin.LinkedInConnector(browser_pool=pool)
+        if pool.stats()["browsers"] == 0:
+            raise RuntimeError("no browser launched")
+    except Exception as exc:
+        print(f"\nBrowser tier skipped: {exc}")
+    else:
+        print(f"\nBrowser tier, warm pool ({runs} runs)")
+        await _measure("instagram browser", functools.partial(ig_browser._fetch_profile_browser, "archdigest"), runs)
+        await _measure("linkedin browser", functools.partial(li_browser._fetch_profile_browser, "janedoe"), runs)
+    finally:
+        await pool.stop()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    asyncio.run(main(parser.parse_args().runs))
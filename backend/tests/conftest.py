@@ -0,0 +1,31 @@
+import pytest
+
+from app.services.connector_cache import set_connector_cache
+from app.services.etag_cache import set_github_etag_cache, set_letterboxd_feed_cache
+from app.services.pair_cache import set_pair_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_connector_cache():
+    """Connector results are cached process-wide; don't let them leak between tests."""
+    set_connector_cache(None)
+    yield
+    set_connector_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pair_cache():
+    """Same for crossref/venue/coaching results cached per pair."""
+    set_pair_cache(None)
+    yield
+    set_pair_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_etag_caches():
+    """And for GitHub responses and Letterboxd feeds, which are kept even without validators."""
+    set_github_etag_cache(None)
+    set_letterboxd_feed_cache(None)
+    yield
+    set_github_etag_cache(None)
+    set_letterboxd_feed_cache(None)
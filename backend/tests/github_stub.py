@@ -0,0 +1,131 @@
+"""A local stand-in for the GitHub REST and GraphQL APIs.
+
+Serves the same synthetic profile through both APIs, with REST repo
+objects padded to the size of real ones, so the two fetch modes can be
+compared for output equality and bytes transferred.
+"""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+
+LANGUAGES = ["Python", "TypeScript", "Go", None, "Rust"]
+TOPICS = ["rust", "cli", "machine-learning", "web", "react", "systems-programming"]
+
+
+def _rest_repo(i: int, login: str) -> dict:
+    name = f"project-{i}"
+    url = f"https://api.github.com/repos/{login}/{name}"
+    repo = {
+        "id": 100000 + i,
+        "node_id": f"R_kgDO{i:08d}",
+        "name": name,
+        "full_name": f"{login}/{name}",
+        "private": False,
+        "owner": {
+            "login": login,
+            "id": 1,
+            "avatar_url": "https://avatars.githubusercontent.com/u/1?v=4",
+            "url": f"https://api.github.com/users/{login}",
+            "html_url": f"https://github.com/{login}",
+            "type": "User",
+            "site_admin": False,
+        },
+        "html_url": f"https://github.com/{login}/{name}",
+        "description": f"Project number {i}" if i % 3 else None,
+        "fork": False,
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2025-12-01T00:00:00Z",
+        "pushed_at": "2025-12-01T00:00:00Z",
+        "size": 1234,
+        "stargazers_count": i * 7 % 50,
+        "watchers_count": i * 7 % 50,
+        "language": LANGUAGES[i % len(LANGUAGES)],
+        "forks_count": i % 4,
+        "open_issues_count": i % 5,
+        "default_branch": "main",
+        "topics": TOPICS[: i % 4],
+        "visibility": "public",
+    }
+    # Real repo objects carry ~40 hypermedia URLs
+    for rel in ("forks", "keys", "collaborators", "teams", "hooks", "issue_events", "events",
+                "assignees", "branches", "tags", "blobs", "git_tags", "git_refs", "trees",
+                "statuses", "languages", "stargazers", "contributors", "subscribers",
+                "subscription", "commits", "git_commits", "comments", "issue_comment",
+                "contents", "compare", "merges", "archive", "downloads", "issues", "pulls",
+                "milestones", "notifications", "labels", "releases", "deployments"):
+        repo[f"{rel}_url"] = f"{url}/{rel}"
+    return repo
+
+
+def _starred_repo(i: int) -> dict:
+    repo = _rest_repo(500 + i, f"someone{i}")
+    repo["topics"] = [TOPICS[(i + k) % len(TOPICS)] for k in range(3)]
+    return repo
+
+
+def _events(n: int) -> list[dict]:
+    return [
+        {
+            "id": str(i),
+            "type": "PushEvent" if i % 3 else "WatchEvent",
+            "created_at": f"2025-12-{1 + i % 28:02d}T{i % 24:02d}:15:00Z",
+            "payload": {"size": 1},
+        }
+        for i in range(n)
+    ]
+
+
+class GitHubStub:
+    def __init__(self, login: str = "octocat", repos: int = 100, starred: int = 100, events: int = 60) -> None:
+        self.login = login
+        self.repos = [_rest_repo(i, login) for i in range(repos)]
+        self.starred = [_starred_repo(i) for i in range(starred)]
+        self.events = _events(events)
+        self.bytes_sent = 0
+        self.requests = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        path = request.url.path
+        if path == "/graphql":
+            body = self._graphql(json.loads(request.content))
+        elif path == f"/users/{self.login}/repos":
+            body = self.repos
+        elif path == f"/users/{self.login}/events/public":
+            body = self.events
+        elif path == f"/users/{self.login}/starred":
+            body = self.starred
+        else:
+            return httpx.Response(404, json={"message": "Not Found"})
+        content = json.dumps(body).encode()
+        self.bytes_sent += len(content)
+        return httpx.Response(200, content=content, headers={"Content-Type": "application/json"})
+
+    def _graphql(self, payload: dict) -> dict:
+        if payload["variables"]["login"] != self.login:
+            return {
+                "data": {"user": None},
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a User"}],
+            }
+        return {
+            "data": {
+                "user": {
+                    "repositories": {"nodes": [
+                        {
+                            "name": r["name"],
+                            "description": r["description"],
+                            "stargazerCount": r["stargazers_count"],
+                            "primaryLanguage": {"name": r["language"]} if r["language"] else None,
+                        }
+                        for r in self.repos
+                    ]},
+                    "starredRepositories": {"nodes": [
+                        {"repositoryTopics": {"nodes": [{"topic": {"name": t}} for t in r["topics"]]}}
+                        for r in self.starred
+                    ]},
+                }
+            }
+        }
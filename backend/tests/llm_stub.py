@@ -0,0 +1,36 @@
+"""Build an LLMService around a local stand-in model, for unit tests.
+
+Every tier is served by the same model, an ``AsyncMock`` unless one is
+passed in. The governor and the dossier and pair stores are fresh, so
+nothing is shared with other tests or with the process-wide instances.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+from app.config import settings
+from app.services.cache import MemoryBackend
+from app.services.dossier_store import DossierStore
+from app.services.llm import LLMService
+from app.services.llm_governor import LLMGovernor
+from app.services.pair_cache import PairCache
+
+
+def make_llm_service(
+    model: Any = None,
+    *,
+    governor: LLMGovernor | None = None,
+    dossiers: DossierStore | None = None,
+    pairs: PairCache | None = None,
+) -> tuple[LLMService, Any]:
+    """Returns the service and the model behind it."""
+    model = model or AsyncMock()
+    svc = LLMService(
+        governor=governor or LLMGovernor(),
+        dossiers=dossiers or DossierStore(MemoryBackend()),
+        pairs=pairs or PairCache(MemoryBackend()),
+        clients={tier: model for tier in settings.llm_tiers},
+    )
+    return svc, model
@@ -11,6 +11,7 @@ import pytest
 
 from app.services.llm import LLMService, _empty_dossier
 from app.graph.nodes.analyze import analyze_node
+from tests.llm_stub import make_llm_service
 
 
 # ── sample data ──────────────────────────────────────────────────
@@ -94,11 +95,8 @@ class TestEmptyDossier:
 # ── unit: connector data filtering ──────────────────────────────
 
 def _make_llm_service():
-    """Create an LLMService with the Gemini client init bypassed (for unit tests)."""
-    with patch.object(LLMService, "__init__", lambda self: None):
-        svc = LLMService()
-        svc._llm = AsyncMock()
-    return svc
+    """An LLMService backed by an AsyncMock model (for unit tests)."""
+    return make_llm_service()
 
 
 FAKE_GEMINI_RESPONSE = json.dumps({
@@ -120,37 +118,37 @@ class TestDataFiltering:
     @pytest.mark.asyncio
     async def test_all_empty_returns_placeholder(self):
         """When all connector data is empty, return placeholder without calling Gemini."""
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         result = await svc.profile_analysis({"github": {}, "spotify": {}})
-        svc._llm.ainvoke.assert_not_called()
+        llm.ainvoke.assert_not_called()
         assert result == _empty_dossier()
 
     @pytest.mark.asyncio
     async def test_empty_dict_returns_placeholder(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         result = await svc.profile_analysis({})
-        svc._llm.ainvoke.assert_not_called()
+        llm.ainvoke.assert_not_called()
         assert result == _empty_dossier()
 
     @pytest.mark.asyncio
     async def test_none_values_filtered_out(self):
         """None values should be treated as empty."""
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         result = await svc.profile_analysis({"github": None, "spotify": None})
-        svc._llm.ainvoke.assert_not_called()
+        llm.ainvoke.assert_not_called()
         assert result == _empty_dossier()
 
     @pytest.mark.asyncio
     async def test_partial_data_only_sends_populated(self):
         """Only populated connectors should be sent to Gemini."""
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
         fake_response.content = FAKE_GEMINI_RESPONSE
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         result = await svc.profile_analysis({"github": SAMPLE_GITHUB, "spotify": {}})
 
-        call_args = svc._llm.ainvoke.call_args[0][0]
+        call_args = llm.ainvoke.call_args[0][0]
         human_msg_content = call_args[1].content
         parsed = json.loads(human_msg_content)
         assert "github" in parsed
@@ -160,10 +158,10 @@ class TestDataFiltering:
     @pytest.mark.asyncio
     async def test_three_sources_all_sent(self):
         """All three connectors should be sent when populated."""
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
         fake_response.content = FAKE_GEMINI_RESPONSE
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         result = await svc.profile_analysis({
             "github": SAMPLE_GITHUB,
@@ -171,7 +169,7 @@ class TestDataFiltering:
             "letterboxd": SAMPLE_LETTERBOXD,
         })
 
-        call_args = svc._llm.ainvoke.call_args[0][0]
+        call_args = llm.ainvoke.call_args[0][0]
         human_msg_content = call_args[1].content
         parsed = json.loads(human_msg_content)
         assert "github" in parsed
@@ -187,7 +185,7 @@ class TestAnalyzeNodeUnit:
     async def test_both_users_get_dossiers(self):
         fake_dossier = _empty_dossier()
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.profile_analysis = AsyncMock(return_value=fake_dossier)
 
@@ -204,7 +202,7 @@ class TestAnalyzeNodeUnit:
     async def test_preserves_original_user_data(self):
         fake_dossier = _empty_dossier()
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.profile_analysis = AsyncMock(return_value=fake_dossier)
 
@@ -223,7 +221,7 @@ class TestAnalyzeNodeUnit:
     async def test_calls_profile_analysis_for_each_user(self):
         fake_dossier = _empty_dossier()
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.profile_analysis = AsyncMock(return_value=fake_dossier)
 
@@ -241,7 +239,7 @@ class TestAnalyzeNodeUnit:
     async def test_handles_empty_state(self):
         fake_dossier = _empty_dossier()
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.profile_analysis = AsyncMock(return_value=fake_dossier)
 
@@ -254,7 +252,7 @@ class TestAnalyzeNodeUnit:
     async def test_handles_missing_raw_data(self):
         fake_dossier = _empty_dossier()
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.profile_analysis = AsyncMock(return_value=fake_dossier)
 
@@ -274,26 +272,98 @@ class TestJSONParsing:
     @pytest.mark.asyncio
     async def test_handles_markdown_wrapped_json(self):
         """Gemini sometimes wraps JSON in ```json ... ``` fences."""
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         wrapped = '```json\n' + FAKE_GEMINI_RESPONSE + '\n```'
         fake_response = AsyncMock()
         fake_response.content = wrapped
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         result = await svc.profile_analysis({"github": SAMPLE_GITHUB})
         assert result["public"]["vibe"] == "Chill coder"
         assert result["data_sources"] == ["github"]
 
     @pytest.mark.asyncio
-    async def test_raises_on_invalid_json(self):
-        """Malformed JSON should raise, not silently fail."""
-        svc = _make_llm_service()
+    async def test_prose_reply_falls_back_to_empty_dossier(self):
+        """A reply with no JSON at all gives the empty dossier instead of failing the run."""
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
-        fake_response.content = "This is not JSON at all"
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        fake_response.content = "Sorry, I cannot analyze this profile."
+        llm.ainvoke = AsyncMock(return_value=fake_response)
+
+        result = await svc.profile_analysis({"github": SAMPLE_GITHUB})
+        assert result == {**_empty_dossier(), "data_sources": ["github"]}
+
+    @pytest.mark.asyncio
+    async def test_repairs_truncated_reply(self):
+        svc, llm = _make_llm_service()
+        fake_response = AsyncMock()
+        fake_response.content = FAKE_GEMINI_RESPONSE[:-60]
+        llm.ainvoke = AsyncMock(return_value=fake_response)
+
+        result = await svc.profile_analysis({"github": SAMPLE_GITHUB})
+        assert result["public"]["vibe"] == "Chill coder"
+        assert result["private"]["summary"] == "A coder who builds things"
+        assert isinstance(result["private"]["deep_cuts"], list)
+
+    @pytest.mark.asyncio
+    async def test_resets_fields_that_break_the_schema(self):
+        svc, llm = _make_llm_service()
+        reply = json.loads(FAKE_GEMINI_RESPONSE)
+        reply["public"]["schedule_pattern"] = "vampire"
+        reply["private"]["traits"] = "builder"
+        fake_response = AsyncMock()
+        fake_response.content = json.dumps(reply)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
+
+        result = await svc.profile_analysis({"github": SAMPLE_GITHUB})
+        assert result["public"]["schedule_pattern"] == "mixed"
+        assert result["private"]["traits"] == []
+        assert result["public"]["tags"] == ["web dev", "ML"]
+
+
+# ── unit: stream_profile_analysis ───────────────────────────────
+
+class TestStreamProfileAnalysis:
+    @pytest.mark.asyncio
+    async def test_yields_partials_then_final(self):
+        svc, llm = _make_llm_service()
+
+        async def astream(messages):
+            for i in range(0, len(FAKE_GEMINI_RESPONSE), 40):
+                chunk = AsyncMock()
+                chunk.content = FAKE_GEMINI_RESPONSE[i:i + 40]
+                chunk.usage_metadata = None
+                yield chunk
+
+        llm.astream = astream
+        dossiers = [d async for d in svc.stream_profile_analysis({"github": SAMPLE_GITHUB})]
 
-        with pytest.raises(json.JSONDecodeError):
-            await svc.profile_analysis({"github": SAMPLE_GITHUB})
+        assert len(dossiers) > 2
+        assert dossiers[0]["data_sources"] == ["github"]
+        assert set(dossiers[0]["public"]) == {"vibe", "tags", "schedule_pattern"}
+        assert dossiers[-1]["private"]["deep_cuts"] == ["Starred rust repos despite coding in Python"]
+
+    @pytest.mark.asyncio
+    async def test_prose_stream_ends_with_empty_dossier(self):
+        svc, llm = _make_llm_service()
+
+        async def astream(messages):
+            for text in ("Sorry, I cannot ", "analyze this profile."):
+                chunk = AsyncMock()
+                chunk.content = text
+                chunk.usage_metadata = None
+                yield chunk
+
+        llm.astream = astream
+        dossiers = [d async for d in svc.stream_profile_analysis({"github": SAMPLE_GITHUB})]
+        assert dossiers == [{**_empty_dossier(), "data_sources": ["github"]}]
+
+    @pytest.mark.asyncio
+    async def test_empty_data_yields_placeholder(self):
+        svc, llm = _make_llm_service()
+        dossiers = [d async for d in svc.stream_profile_analysis({"github": None})]
+        assert dossiers == [_empty_dossier()]
+        llm.astream.assert_not_called()
 
 
 # ── integration: real Gemini calls ──────────────────────────────
@@ -1,5 +1,9 @@
 """Tests for the new frontend-facing API endpoints and helper services."""
 
+import asyncio
+import json
+import time
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -14,7 +18,9 @@ from app.services.preview import (
     linkedin_preview,
     generate_preview,
 )
+from app.services.blobs import BlobStore
 from app.services.findings import generate_findings
+from app.graph.nodes import ingest
 from app.graph.nodes.ingest import _fetch_user_data
 
 
@@ -48,7 +54,7 @@ FAKE_SPOTIFY_DATA = {
 
 FAKE_INSTAGRAM_DATA = {
     "bio": "Photographer | NYC based | archdigest.com",
-    "screenshot_b64": "",
+    "screenshot_ref": "",
     "login_wall": False,
 }
 
@@ -213,6 +219,63 @@ class TestIngestNode:
         assert result == {}
 
 
+def _slow_connector_cls(delay, return_value):
+    calls = []
+
+    class SlowConnector:
+        async def fetch(self, identifier):
+            calls.append(identifier)
+            await asyncio.sleep(delay)
+            return return_value
+
+    return SlowConnector, calls
+
+
+class TestIngestDeadlines:
+    @pytest.fixture(autouse=True)
+    def _short_budgets(self, monkeypatch):
+        monkeypatch.setattr(ingest.settings, "ingest_deadline", 0.3)
+        monkeypatch.setattr(ingest.settings, "connector_timeouts", {"instagram": 0.05})
+
+    async def test_slow_service_dropped_at_its_own_budget(self):
+        GHCls, _ = _make_connector_cls(return_value=FAKE_GITHUB_DATA)
+        IGCls, _ = _slow_connector_cls(0.2, FAKE_INSTAGRAM_DATA)
+        mock_map = {"github": GHCls, "instagram": IGCls}
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", mock_map, clear=True):
+            start = time.monotonic()
+            result = await _fetch_user_data({"github": "u", "instagram": "u"})
+        assert time.monotonic() - start < 0.15
+        assert list(result) == ["github"]
+
+    async def test_overall_deadline_returns_partial_bundle(self):
+        GHCls, _ = _make_connector_cls(return_value=FAKE_GITHUB_DATA)
+        LBCls, _ = _slow_connector_cls(5, FAKE_LETTERBOXD_DATA)
+        mock_map = {"github": GHCls, "letterboxd": LBCls}
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", mock_map, clear=True):
+            start = time.monotonic()
+            result = await _fetch_user_data({"github": "u", "letterboxd": "u"})
+        assert time.monotonic() - start < 1
+        assert list(result) == ["github"]
+        for task in ingest._flights.tasks():
+            task.cancel()
+
+    async def test_late_result_backfills_next_request(self):
+        IGCls, calls = _slow_connector_cls(0.1, FAKE_INSTAGRAM_DATA)
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", {"instagram": IGCls}, clear=True):
+            assert await _fetch_user_data({"instagram": "someone"}) == {}
+            await asyncio.gather(*ingest._flights.tasks())
+            result = await _fetch_user_data({"instagram": "@Someone"})
+        assert result["instagram"]["bio"] == FAKE_INSTAGRAM_DATA["bio"]
+        assert calls == ["someone"]
+
+    async def test_failures_are_not_cached(self):
+        GHCls, mock = _make_connector_cls(side_effect=Exception("API error"))
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", {"github": GHCls}, clear=True):
+            await _fetch_user_data({"github": "u"})
+            await _fetch_user_data({"github": "u"})
+        assert mock.await_count == 2
+
+
 # ── API endpoint tests ───────────────────────────────────────────
 
 @pytest.fixture
@@ -257,11 +320,60 @@ class TestConnectEndpoint:
         assert data["success"] is True
         assert "limited" in data["preview"].lower()
 
+    async def test_connect_instagram_with_screenshot(self, async_client):
+        fetch = AsyncMock(return_value={**FAKE_INSTAGRAM_DATA, "screenshot_ref": "ab" * 32})
+
+        class FakeInstagram:
+            async def fetch(self, identifier, **kwargs):
+                return await fetch(identifier, **kwargs)
+
+        with patch.dict("app.main.CONNECTOR_MAP", {"instagram": FakeInstagram}):
+            resp = await async_client.post("/api/connect", json={
+                "service": "instagram",
+                "username": "testuser",
+                "screenshot": True,
+            })
+
+        fetch.assert_awaited_once_with("testuser", screenshot=True)
+        assert resp.json()["screenshot_ref"] == "ab" * 32
+
+
+class TestConnectThenAnalyze:
+    async def test_analyze_reuses_connect_results(self, async_client):
+        GHCls, mock = _make_connector_cls(return_value=FAKE_GITHUB_DATA)
+        with patch.dict("app.main.CONNECTOR_MAP", {"github": GHCls}), \
+             patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", {"github": GHCls}, clear=True), \
+             patch("app.main.get_llm_service") as MockLLM:
+            MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
+            await async_client.post("/api/connect", json={"service": "github", "username": "TestUser"})
+            resp = await async_client.post("/api/analyze", json={"identifiers": {"github": "testuser"}})
+
+        assert resp.status_code == 200
+        mock.assert_awaited_once_with("TestUser")
+        assert MockLLM.return_value.profile_analysis.await_args.args[0] == {"github": FAKE_GITHUB_DATA}
+
+
+class TestScreenshotEndpoint:
+    async def test_streams_stored_png(self, async_client, tmp_path):
+        store = BlobStore(tmp_path)
+        digest = await store.put(b"\x89PNG fake")
+        with patch("app.main.get_blob_store", return_value=store):
+            resp = await async_client.get(f"/api/screenshots/{digest}")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/png"
+        assert resp.content == b"\x89PNG fake"
+
+    @pytest.mark.parametrize("digest", ["0" * 64, "../../etc/passwd", "xyz"])
+    async def test_unknown_or_malformed_digest_404s(self, async_client, tmp_path, digest):
+        with patch("app.main.get_blob_store", return_value=BlobStore(tmp_path)):
+            resp = await async_client.get(f"/api/screenshots/{digest}")
+        assert resp.status_code == 404
+
 
 class TestAnalyzeEndpoint:
     async def test_analyze_user(self, async_client):
         with patch("app.main._fetch_user_data", new_callable=AsyncMock) as mock_fetch, \
-             patch("app.main.LLMService") as MockLLM:
+             patch("app.main.get_llm_service") as MockLLM:
             mock_fetch.return_value = {"github": FAKE_GITHUB_DATA}
             MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
 
@@ -277,6 +389,70 @@ class TestAnalyzeEndpoint:
         assert len(data["findings"]) > 0
 
 
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.replace("\r\n", "\n").strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestAnalyzeStreamEndpoint:
+    async def test_events_in_completion_order_then_dossier(self, async_client):
+        GHCls, _ = _slow_connector_cls(0.05, FAKE_GITHUB_DATA)
+        LBCls, _ = _make_connector_cls(return_value=FAKE_LETTERBOXD_DATA)
+        IGCls, _ = _make_connector_cls(side_effect=Exception("blocked"))
+        mock_map = {"github": GHCls, "letterboxd": LBCls, "instagram": IGCls}
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", mock_map, clear=True), \
+             patch("app.main.get_llm_service") as MockLLM:
+            seen = []
+
+            async def fake_stream(raw_data, name=""):
+                seen.append(raw_data)
+                yield FAKE_DOSSIER
+
+            MockLLM.return_value.stream_profile_analysis = fake_stream
+            resp = await async_client.post("/api/analyze/stream", json={
+                "identifiers": {"github": "u", "letterboxd": "u", "instagram": "u", "linkedin": None},
+            })
+
+        events = _sse_events(resp.text)
+        assert [e for e, _ in events] == ["connector", "connector", "connector", "dossier", "done"]
+        connectors = [d for e, d in events if e == "connector"]
+        assert connectors[-1]["service"] == "github"
+        letterboxd = next(d for d in connectors if d["service"] == "letterboxd")
+        assert letterboxd["success"] is True
+        assert "2 films" in letterboxd["preview"]
+        assert letterboxd["findings"][0]["label"] == "Film"
+        instagram = next(d for d in connectors if d["service"] == "instagram")
+        assert instagram["success"] is False
+        assert instagram["findings"] == []
+
+        dossier = events[3][1]
+        assert dossier["bio"] == "Curious night-owl engineer"
+        assert list(seen[0]) == ["github", "letterboxd"]
+
+    async def test_partial_dossiers_before_final(self, async_client):
+        LBCls, _ = _make_connector_cls(return_value=FAKE_LETTERBOXD_DATA)
+        partial = {"public": {"vibe": "Curious", "tags": [], "schedule_pattern": "mixed"}}
+
+        async def fake_stream(raw_data, name=""):
+            yield partial
+            yield FAKE_DOSSIER
+
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", {"letterboxd": LBCls}, clear=True), \
+             patch("app.main.get_llm_service") as MockLLM:
+            MockLLM.return_value.stream_profile_analysis = fake_stream
+            resp = await async_client.post("/api/analyze/stream", json={
+                "identifiers": {"letterboxd": "u"},
+            })
+
+        events = _sse_events(resp.text)
+        assert [e for e, _ in events] == ["connector", "dossier_partial", "dossier", "done"]
+        assert events[1][1]["bio"] == "Curious"
+        assert events[2][1]["bio"] == "Curious night-owl engineer"
+
+
 class TestMatchEndpoint:
     async def test_match_users(self, async_client):
         fake_crossref = {
@@ -287,7 +463,7 @@ class TestMatchEndpoint:
         }
 
         with patch("app.main._fetch_user_data", new_callable=AsyncMock) as mock_fetch, \
-             patch("app.main.LLMService") as MockLLM:
+             patch("app.main.get_llm_service") as MockLLM:
             mock_fetch.return_value = {"github": FAKE_GITHUB_DATA}
             MockLLM.return_value.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
             MockLLM.return_value.cross_reference = AsyncMock(
@@ -0,0 +1,69 @@
+"""Tests for the content-addressed blob store."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+from app.services.blobs import BlobStore
+
+
+def _age(store: BlobStore, digest: str, seconds_ago: float) -> None:
+    path = store.path(digest)
+    then = path.stat().st_mtime - seconds_ago
+    os.utime(path, (then, then))
+
+
+# ── unit: put and path ────────────────────────────────────────────
+
+class TestBlobStore:
+    async def test_put_is_content_addressed(self, tmp_path):
+        store = BlobStore(tmp_path)
+        digest = await store.put(b"png bytes")
+        assert digest == await store.put(b"png bytes")
+        assert store.path(digest).read_bytes() == b"png bytes"
+        assert store.path("../etc/passwd") is None
+
+    async def test_concurrent_puts_use_separate_temp_files(self, tmp_path):
+        store = BlobStore(tmp_path)
+        temp_names = []
+        replace = os.replace
+
+        def record(src, dst):
+            temp_names.append(src)
+            replace(src, dst)
+
+        with patch("app.services.blobs.os.replace", side_effect=record):
+            await asyncio.gather(*(asyncio.to_thread(store._write, store._path("a" * 64), b"x") for _ in range(4)))
+        assert len(set(temp_names)) == 4
+        assert sorted(p.name for p in tmp_path.rglob("*")) == ["aa", "a" * 64]
+
+
+# ── unit: eviction ────────────────────────────────────────────────
+
+class TestEviction:
+    async def test_oldest_blobs_evicted_past_the_cap(self, tmp_path):
+        store = BlobStore(tmp_path, max_bytes=250)
+        old = await store.put(b"o" * 100)
+        _age(store, old, 60)
+        recent = await store.put(b"r" * 100)
+        _age(store, recent, 30)
+        newest = await store.put(b"n" * 100)
+        assert store.path(old) is None
+        assert store.path(recent) is not None
+        assert store.path(newest) is not None
+
+    async def test_put_again_refreshes(self, tmp_path):
+        store = BlobStore(tmp_path, max_bytes=250)
+        first = await store.put(b"f" * 100)
+        _age(store, first, 60)
+        second = await store.put(b"s" * 100)
+        _age(store, second, 30)
+        await store.put(b"f" * 100)
+        await store.put(b"t" * 100)
+        assert store.path(first) is not None
+        assert store.path(second) is None
+
+    async def test_new_blob_kept_even_if_over_the_cap(self, tmp_path):
+        store = BlobStore(tmp_path, max_bytes=10)
+        digest = await store.put(b"x" * 100)
+        assert store.path(digest) is not None
@@ -0,0 +1,158 @@
+"""Tests for the book resolver, its local index and upstreams."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.connectors.books import BooksConnector, titles_identifier
+from app.graph.nodes.ingest import ingest_node
+from app.services.books import (
+    BookIndex,
+    BookResolver,
+    OpenLibraryUpstream,
+    StaticUpstream,
+    normalize_title,
+)
+from app.services.findings import source_findings
+from app.services.preview import generate_preview
+
+CATALOG = Path(__file__).parent / "fixtures" / "books_catalog.json"
+
+
+@pytest.fixture
+def upstream():
+    stub = StaticUpstream.from_file(CATALOG)
+    stub.lookup = AsyncMock(side_effect=stub.lookup)
+    return stub
+
+
+@pytest.fixture
+def resolver(upstream):
+    return BookResolver(BookIndex(":memory:"), upstream)
+
+
+# ── unit: normalize_title ─────────────────────────────────────────
+
+class TestNormalizeTitle:
+    @pytest.mark.parametrize("raw", [
+        "The Left Hand of Darkness",
+        "  left hand of darkness ",
+        "The Left Hand of Darkness: A Novel",
+        "The Left Hand of Darkness (Ace Science Fiction)",
+        "LEFT HAND OF DARKNESS!",
+    ])
+    def test_variants_collapse(self, raw):
+        assert normalize_title(raw) == "left hand of darkness"
+
+    def test_accents_and_ampersands(self):
+        assert normalize_title("Cien Años de Soledad") == "cien anos de soledad"
+        assert normalize_title("Pride & Prejudice") == "pride and prejudice"
+
+    def test_keeps_article_inside_title(self):
+        assert normalize_title("A Wizard of Earthsea") == "wizard of earthsea"
+
+
+# ── unit: resolver ────────────────────────────────────────────────
+
+class TestResolver:
+    async def test_resolves_in_input_order(self, resolver):
+        result = await resolver.resolve(["piranesi", "Dune", "The Book Nobody Wrote"])
+        assert [b["title"] for b in result["books"]] == ["Piranesi", "Dune"]
+        assert result["books"][1]["authors"] == ["Frank Herbert"]
+        assert result["unresolved"] == ["The Book Nobody Wrote"]
+
+    async def test_one_upstream_batch_for_all_misses(self, resolver, upstream):
+        await resolver.resolve(["Dune", "Piranesi", "dune", "Sapiens"])
+        upstream.lookup.assert_awaited_once()
+        assert set(upstream.lookup.await_args.args[0]) == {"dune", "piranesi", "sapiens"}
+
+    async def test_repeat_titles_served_from_index(self, resolver, upstream):
+        await resolver.resolve(["Dune", "Piranesi"])
+        result = await resolver.resolve(["DUNE", "Piranesi: a novel"])
+        assert upstream.lookup.await_count == 1
+        assert len(result["books"]) == 2
+
+    async def test_only_misses_go_upstream(self, resolver, upstream):
+        await resolver.resolve(["Dune"])
+        await resolver.resolve(["Dune", "Piranesi"])
+        assert set(upstream.lookup.await_args.args[0]) == {"piranesi"}
+
+    async def test_unknown_titles_remembered(self, resolver, upstream):
+        await resolver.resolve(["Nonexistent Book"])
+        result = await resolver.resolve(["Nonexistent Book"])
+        assert upstream.lookup.await_count == 1
+        assert result["unresolved"] == ["Nonexistent Book"]
+
+    async def test_empty_list(self, resolver, upstream):
+        assert await resolver.resolve(["", "  "]) == {"books": [], "unresolved": []}
+        upstream.lookup.assert_not_called()
+
+    async def test_index_persists_on_disk(self, tmp_path, upstream):
+        path = tmp_path / "books.sqlite3"
+        await BookResolver(BookIndex(path), upstream).resolve(["Dune"])
+        result = await BookResolver(BookIndex(path), upstream).resolve(["Dune"])
+        assert upstream.lookup.await_count == 1
+        assert result["books"][0]["year"] == 1965
+
+
+# ── unit: Open Library upstream ───────────────────────────────────
+
+class TestOpenLibraryUpstream:
+    async def test_single_or_query_matched_back_by_title(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"docs": [
+                {"title": "Dune Messiah", "author_name": ["Frank Herbert"]},
+                {"title": "Dune", "author_name": ["Frank Herbert"], "first_publish_year": 1965, "subject": ["Sci-fi"]},
+                {"title": "Dune", "author_name": ["Someone Else"]},
+                {"title": "Piranesi", "author_name": ["Susanna Clarke"], "first_publish_year": 2020},
+            ]})
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            found = await OpenLibraryUpstream(client=client).lookup(
+                {"dune": "Dune", "piranesi": "Piranesi", "missing": "Missing"}
+            )
+
+        assert len(seen) == 1
+        assert seen[0].url.params["q"] == 'title:"Dune" OR title:"Piranesi" OR title:"Missing"'
+        assert found["dune"]["authors"] == ["Frank Herbert"]
+        assert found["piranesi"]["year"] == 2020
+        assert "missing" not in found
+
+
+# ── unit: connector, ingest, preview ──────────────────────────────
+
+class TestBooksConnector:
+    async def test_fetch_splits_identifier_lines(self, resolver):
+        data = await BooksConnector(resolver).fetch(titles_identifier(["Dune", " ", "Piranesi"]))
+        assert [b["title"] for b in data["books"]] == ["Dune", "Piranesi"]
+
+    def test_titles_identifier_empty(self):
+        assert titles_identifier(None) is None
+        assert titles_identifier(["", " "]) is None
+
+    async def test_ingest_node_resolves_book_titles(self, resolver):
+        class Books(BooksConnector):
+            def __init__(self):
+                super().__init__(resolver)
+
+        state = {
+            "user_a": {"identifiers": {}, "book_titles": ["Dune"]},
+            "user_b": {"identifiers": {}},
+        }
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", {"books": Books}, clear=True):
+            result = await ingest_node(state)
+        assert result["user_a"]["raw_data"]["books"]["books"][0]["title"] == "Dune"
+        assert result["user_b"]["raw_data"] == {}
+
+    async def test_preview_and_findings(self, resolver):
+        data = await resolver.resolve(["Dune", "The Left Hand of Darkness", "Piranesi"])
+        assert generate_preview("books", data) == "3 books · Dune, The Left Hand of Darkness"
+        assert source_findings("books", data) == [
+            {"label": "Reading", "value": "3 books", "detail": "Into: Science fiction"},
+        ]
@@ -0,0 +1,174 @@
+"""Tests for the shared Chromium pool.
+
+Unit tests drive the pool with fake browser objects so no Chromium is needed.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from app.services.browser_pool import BrowserPool
+
+
+# ── fakes ─────────────────────────────────────────────────────────
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        return {"browser": self.browser}
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, n):
+        self.n = n
+        self.connected = True
+        self.closed = False
+        self.contexts = 0
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, user_agent=None):
+        if not self.is_connected():
+            raise RuntimeError("browser has been closed")
+        self.contexts += 1
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+def _make_pool(**kwargs):
+    launched: list[FakeBrowser] = []
+
+    async def launcher():
+        b = FakeBrowser(len(launched))
+        launched.append(b)
+        return b
+
+    kwargs.setdefault("health_interval", 0)
+    return BrowserPool(launcher=launcher, **kwargs), launched
+
+
+# ── unit: warm start and reuse ────────────────────────────────────
+
+class TestWarmPool:
+    async def test_start_warms_every_slot(self):
+        pool, launched = _make_pool(size=3)
+        await pool.start()
+        assert len(launched) == 3
+        await pool.stop()
+
+    async def test_pages_reuse_warm_browsers(self):
+        pool, launched = _make_pool(size=2, max_pages=100)
+        await pool.start()
+        for _ in range(10):
+            async with pool.page("ua") as page:
+                assert page["browser"] in launched
+        assert len(launched) == 2
+        await pool.stop()
+
+    async def test_stop_closes_browsers(self):
+        pool, launched = _make_pool(size=2)
+        await pool.start()
+        await pool.stop()
+        assert all(b.closed for b in launched)
+
+
+# ── unit: recycling and health ────────────────────────────────────
+
+class TestRecycling:
+    async def test_recycles_after_max_pages(self):
+        pool, launched = _make_pool(size=1, max_pages=3)
+        await pool.start()
+        for _ in range(4):
+            async with pool.page("ua"):
+                pass
+        await asyncio.sleep(0)
+        assert len(launched) == 2
+        assert launched[0].closed
+        await pool.stop()
+
+    async def test_retired_browser_closed_after_last_page(self):
+        pool, launched = _make_pool(size=1, max_pages=1, max_concurrency=2)
+        await pool.start()
+        async with pool.page("ua") as first:
+            assert first["browser"] is launched[0]
+            pool._slots[0].recycle = True
+            async with pool.page("ua") as second:
+                assert second["browser"] is launched[1]
+            assert not launched[0].closed
+        assert launched[0].closed
+        await pool.stop()
+
+    async def test_dead_browser_replaced_transparently(self):
+        pool, launched = _make_pool(size=1)
+        await pool.start()
+        launched[0].connected = False
+        async with pool.page("ua") as page:
+            assert page["browser"] is launched[1]
+        await pool.stop()
+
+    async def test_retire_keeps_close_task_until_done(self):
+        pool, launched = _make_pool(size=1, max_pages=1)
+        await pool.start()
+        async with pool.page("ua"):
+            pass
+        async with pool.page("ua"):
+            assert len(pool._closing) == 1
+        await asyncio.sleep(0.01)
+        assert launched[0].closed
+        assert not pool._closing
+        await pool.stop()
+
+    async def test_rss_checked_every_n_releases(self):
+        pool, launched = _make_pool(size=1, max_pages=0, max_rss_mb=100, rss_check_every=5)
+        await pool.start()
+        with patch("app.services.browser_pool._process_tree_rss_mb", return_value=50.0) as rss:
+            for _ in range(12):
+                async with pool.page("ua"):
+                    pass
+        assert rss.call_count == 2
+
+        with patch("app.services.browser_pool._process_tree_rss_mb", return_value=500.0):
+            for _ in range(3):
+                async with pool.page("ua"):
+                    pass
+        assert pool._slots[0].recycle
+        await pool.stop()
+
+    async def test_health_loop_replaces_dead_browser(self):
+        pool, launched = _make_pool(size=1, health_interval=0.01)
+        await pool.start()
+        launched[0].connected = False
+        await asyncio.sleep(0.05)
+        assert len(launched) == 2
+        assert pool._slots[0].browser is launched[1]
+        await pool.stop()
+
+
+# ── unit: concurrency cap ─────────────────────────────────────────
+
+class TestConcurrencyCap:
+    async def test_caps_concurrent_pages(self):
+        pool, _ = _make_pool(size=2, max_concurrency=2)
+        await pool.start()
+        live = 0
+        peak = 0
+
+        async def borrow():
+            nonlocal live, peak
+            async with pool.page("ua"):
+                live += 1
+                peak = max(peak, live)
+                await asyncio.sleep(0.01)
+                live -= 1
+
+        await asyncio.gather(*(borrow() for _ in range(8)))
+        assert peak == 2
+        await pool.stop()
@@ -0,0 +1,117 @@
+"""Tests for the shared cache backends."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import cache as cache_module
+from app.services.cache import EXPIRED, FRESH, STALE, DiskBackend, MemoryBackend, freshness, make_backend
+
+
+class TestMemoryBackend:
+    async def test_roundtrip(self):
+        backend = MemoryBackend()
+        await backend.set("k", {"a": 1})
+        assert await backend.get("k") == {"a": 1}
+
+    async def test_missing_key(self):
+        assert await MemoryBackend().get("nope") is None
+
+    async def test_evicts_least_recently_used(self):
+        backend = MemoryBackend(max_entries=2)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")
+        await backend.set("c", 3)
+        assert await backend.get("a") == 1
+        assert await backend.get("b") is None
+        assert len(backend) == 2
+
+    async def test_evicts_by_total_size(self):
+        backend = MemoryBackend(max_entries=100, max_bytes=50)
+        await backend.set("a", "x" * 20)
+        await backend.set("b", "y" * 20)
+        await backend.set("c", "z" * 20)
+        assert await backend.get("a") is None
+        assert await backend.get("c") == "z" * 20
+        assert backend.bytes == 44
+
+    async def test_overwrite_updates_size(self):
+        backend = MemoryBackend(max_bytes=1000)
+        await backend.set("a", "x" * 100)
+        await backend.set("a", "x")
+        await backend.delete("missing")
+        assert backend.bytes == 3
+
+    async def test_expires(self, monkeypatch):
+        backend = MemoryBackend()
+        await backend.set("k", 1, ttl=10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert await backend.get("k") is None
+
+    async def test_delete_and_clear(self):
+        backend = MemoryBackend()
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.delete("a")
+        assert await backend.get("a") is None
+        await backend.clear()
+        assert await backend.get("b") is None
+
+
+class TestDiskBackend:
+    async def test_survives_new_instance(self, tmp_path):
+        await DiskBackend(tmp_path).set("k", {"etag": "x", "body": [1, 2]})
+        assert await DiskBackend(tmp_path).get("k") == {"etag": "x", "body": [1, 2]}
+
+    async def test_expires(self, tmp_path, monkeypatch):
+        backend = DiskBackend(tmp_path)
+        await backend.set("k", 1, ttl=10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert await backend.get("k") is None
+
+    async def test_concurrent_writes_to_one_key(self, tmp_path):
+        backend = DiskBackend(tmp_path)
+        for _ in range(5):
+            await asyncio.gather(*(backend.set("k", i) for i in range(8)))
+        assert await backend.get("k") in range(8)
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    async def test_delete_and_clear(self, tmp_path):
+        backend = DiskBackend(tmp_path)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.delete("a")
+        assert await backend.get("a") is None
+        await backend.clear()
+        assert await backend.get("b") is None
+
+
+class TestMakeBackend:
+    def test_kinds(self, tmp_path):
+        assert isinstance(make_backend("memory"), MemoryBackend)
+        assert isinstance(make_backend("disk", path=str(tmp_path)), DiskBackend)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            make_backend("memcached")
+
+    def test_redis_falls_back_to_memory_without_package(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "aioredis", None)
+        assert isinstance(make_backend("redis", url="redis://localhost:6379"), MemoryBackend)
+
+
+class TestFreshness:
+    def test_states(self):
+        assert freshness(100.0, ttl=10, stale_while_revalidate=50, now=105) == FRESH
+        assert freshness(100.0, ttl=10, stale_while_revalidate=50, now=130) == STALE
+        assert freshness(100.0, ttl=10, stale_while_revalidate=50, now=161) == EXPIRED
+
+    def test_no_timestamp_is_expired(self):
+        assert freshness(None, ttl=10) == EXPIRED
+
+    def test_zero_ttl_always_revalidates(self):
+        assert freshness(100.0, ttl=0, now=100) == EXPIRED
@@ -0,0 +1,123 @@
+"""Tests for coach_node and dual-perspective coaching."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.nodes.coach import coach_node
+from app.services.cache import MemoryBackend
+from app.services.pair_cache import PairCache
+from tests.llm_stub import make_llm_service
+
+
+def _briefing(who: str) -> dict:
+    return {
+        "match_intel": f"Why {who} should go",
+        "conversation_playbook": ["films?", "side projects?", "favourite night spot?"],
+        "minefield_map": ["early mornings", "spoilers"],
+        "venue_cheat_sheet": "Dim lights, good sound.",
+        "vibe_calibration": "Chill and observant",
+    }
+
+
+DOSSIER_A = {"public": {"vibe": "Builder"}, "private": {"summary": "Codes at night"}}
+DOSSIER_B = {"public": {"vibe": "Cinephile"}, "private": {"summary": "Watches Kubrick"}}
+STATE = {
+    "user_a": {"dossier": DOSSIER_A},
+    "user_b": {"dossier": DOSSIER_B},
+    "cross_ref": {"shared": []},
+    "venues": [{"name": "Film Forum"}, {"name": "Second"}],
+}
+
+
+def _service(content: str, pairs=None):
+    svc, llm = make_llm_service(pairs=pairs)
+    llm.ainvoke.return_value = MagicMock(content=content)
+    return svc, llm
+
+
+# ── unit: generate_dual_coaching ──────────────────────────────────
+
+class TestDualCoaching:
+    async def test_one_call_returns_both_briefings(self):
+        reply = json.dumps({"user_a": _briefing("A"), "user_b": _briefing("B")})
+        svc, llm = _service(f"```json\n{reply}\n```")
+        briefing_a, briefing_b = await svc.generate_dual_coaching(DOSSIER_A, DOSSIER_B, {}, None)
+        llm.ainvoke.assert_awaited_once()
+        assert briefing_a["match_intel"] == "Why A should go"
+        assert briefing_b["match_intel"] == "Why B should go"
+
+    async def test_dossiers_sent_once(self):
+        reply = json.dumps({"user_a": _briefing("A"), "user_b": _briefing("B")})
+        svc, llm = _service(reply)
+        await svc.generate_dual_coaching(DOSSIER_A, DOSSIER_B, {}, None)
+        human = llm.ainvoke.await_args.args[0][1].content
+        assert human.count("Codes at night") == 1
+        assert human.count("Watches Kubrick") == 1
+
+    async def test_invalid_shapes_return_none(self):
+        missing = {k: v for k, v in _briefing("B").items() if k != "minefield_map"}
+        wrong_type = {**_briefing("B"), "conversation_playbook": "just one"}
+        for reply in (
+            "not json",
+            json.dumps([_briefing("A"), _briefing("B")]),
+            json.dumps({"user_a": _briefing("A")}),
+            json.dumps({"user_a": _briefing("A"), "user_b": missing}),
+            json.dumps({"user_a": _briefing("A"), "user_b": wrong_type}),
+        ):
+            assert await _service(reply)[0].generate_dual_coaching(DOSSIER_A, DOSSIER_B, {}, None) is None
+
+    async def test_swapped_pair_reuses_cached_reply(self):
+        reply = json.dumps({"user_a": _briefing("A"), "user_b": _briefing("B")})
+        svc, llm = _service(reply, pairs=PairCache(MemoryBackend()))
+        await svc.generate_dual_coaching(DOSSIER_A, DOSSIER_B, {}, None)
+        briefing_b, briefing_a = await svc.generate_dual_coaching(DOSSIER_B, DOSSIER_A, {}, None)
+        llm.ainvoke.assert_awaited_once()
+        assert briefing_a["match_intel"] == "Why A should go"
+        assert briefing_b["match_intel"] == "Why B should go"
+
+
+# ── unit: coach_node ──────────────────────────────────────────────
+
+class TestCoachNode:
+    async def test_dual_mode(self):
+        with patch("app.graph.nodes.coach.get_llm_service") as MockLLM:
+            llm = MockLLM.return_value
+            llm.generate_dual_coaching = AsyncMock(return_value=(_briefing("A"), _briefing("B")))
+            llm.generate_coaching = AsyncMock()
+            result = await coach_node(STATE)
+
+        assert result == {"coaching_a": _briefing("A"), "coaching_b": _briefing("B")}
+        llm.generate_coaching.assert_not_called()
+        assert llm.generate_dual_coaching.await_args.args[3] == {"name": "Film Forum"}
+
+    async def test_falls_back_to_concurrent_per_user_calls(self):
+        in_flight = peak = 0
+
+        async def generate_coaching(target_user, other_user, cross_ref, venue, context=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _briefing("A" if target_user is DOSSIER_A else "B")
+
+        with patch("app.graph.nodes.coach.get_llm_service") as MockLLM:
+            llm = MockLLM.return_value
+            llm.generate_dual_coaching = AsyncMock(return_value=None)
+            llm.generate_coaching = generate_coaching
+            result = await coach_node(STATE)
+
+        assert peak == 2
+        assert result == {"coaching_a": _briefing("A"), "coaching_b": _briefing("B")}
+
+    async def test_parallel_mode_skips_dual(self):
+        with patch("app.graph.nodes.coach.get_llm_service") as MockLLM, \
+             patch("app.graph.nodes.coach.settings.coaching_mode", "parallel"):
+            llm = MockLLM.return_value
+            llm.generate_dual_coaching = AsyncMock()
+            llm.generate_coaching = AsyncMock(return_value=_briefing("X"))
+            await coach_node(STATE)
+
+        llm.generate_dual_coaching.assert_not_called()
+        assert llm.generate_coaching.await_count == 2
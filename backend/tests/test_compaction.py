@@ -0,0 +1,107 @@
+"""Tests for raw-data compaction ahead of profile analysis."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from app.services.compaction import MIN_ITEMS, compact_json, compact_raw_data, hour_histogram
+from app.services.tokens import estimate_tokens
+from tests.llm_stub import make_llm_service
+
+
+def _github(repos: int = 100, topics: int = 100) -> dict:
+    return {
+        "languages": ["Python", "Go", "Rust"],
+        "repos": [
+            {"name": f"repo-{i}", "description": "word " * 60 if i % 2 else "", "stars": i, "language": "Python"}
+            for i in range(repos)
+        ],
+        "commit_hours": [i % 24 for i in range(60)],
+        "starred_topics": [f"topic-{i}" for i in range(topics)],
+    }
+
+
+def _spotify() -> dict:
+    return {
+        "top_artists": [{"name": f"Artist {i}", "genres": ["indie", "art rock", "dream pop"], "popularity": 50} for i in range(50)],
+        "top_genres": ["indie", "art rock", "dream pop"],
+        "top_tracks": [{"name": f"Track {i}", "artist": f"Artist {i % 5}"} for i in range(50)],
+        "listening_hours": [23, 23, 0, 1, 9],
+    }
+
+
+BUNDLE = {
+    "github": _github(),
+    "spotify": _spotify(),
+    "letterboxd": {"recent_films": [{"title": "Anora", "rating": 4.5, "link": "https://letterboxd.com/x/film/anora/"},
+                                    {"title": "Nosferatu", "rating": None, "link": "https://letterboxd.com/x/film/n/"}]},
+    "books": {"books": [{"title": "Dune", "authors": ["Frank Herbert"], "year": 1965, "subjects": ["Science fiction", "Ecology"]},
+                        {"title": "Piranesi", "authors": ["Susanna Clarke"], "year": 2020, "subjects": ["Fantasy", "Science fiction"]}],
+              "unresolved": []},
+    "instagram": {"bio": "  photographer\n\n  NYC ", "screenshot_ref": "ab" * 32, "login_wall": False},
+}
+
+
+# ── unit: per-source compaction ───────────────────────────────────
+
+class TestCompaction:
+    def test_hour_histogram(self):
+        assert hour_histogram([0, 23, 23, 5, 99]) == [1, 0, 0, 0, 0, 1] + [0] * 17 + [2]
+
+    def test_github_ranked_truncated_and_histogrammed(self):
+        out = compact_raw_data({"github": _github()})["github"]
+        assert [r["name"] for r in out["repos"][:3]] == ["repo-99", "repo-98", "repo-97"]
+        assert len(out["repos"]) == 15
+        assert all(len(r.get("description", "")) <= 140 for r in out["repos"])
+        assert "description" not in out["repos"][1]
+        assert len(out["commit_hours"]) == 24 and sum(out["commit_hours"]) == 60
+        assert len(out["starred_topics"]) == 25
+
+    def test_spotify_collapses_repeats(self):
+        out = compact_raw_data({"spotify": _spotify()})["spotify"]
+        assert out["top_artists"][:2] == ["Artist 0", "Artist 1"]
+        assert out["top_genres"] == ["indie", "art rock", "dream pop"]
+        assert out["top_tracks"]["Artist 0"] == ["Track 0", "Track 5", "Track 10"]
+        assert out["listening_hours"][23] == 2
+
+    def test_films_books_and_pages(self):
+        out = compact_raw_data(BUNDLE)
+        assert out["letterboxd"]["recent_films"] == ["Anora (4.5/5)", "Nosferatu"]
+        assert out["books"]["books"][0] == "Dune — Frank Herbert — 1965"
+        assert out["books"]["subjects"][0] == "Science fiction"
+        assert "unresolved" not in out["books"]
+        assert out["instagram"] == {"bio": "photographer NYC"}
+
+    def test_unknown_shapes_pass_through(self):
+        data = {"spotify": {"top_artists": ["Frank Ocean"], "listening_hours": {"late_night": 45}}}
+        assert compact_raw_data(data) == data
+
+    def test_compact_is_much_smaller(self):
+        before = estimate_tokens(json.dumps(BUNDLE, indent=2))
+        after = estimate_tokens(compact_json(compact_raw_data(BUNDLE)))
+        assert after < before / 3
+
+
+# ── unit: token budget ────────────────────────────────────────────
+
+class TestBudget:
+    def test_scales_down_to_fit(self):
+        unbounded = estimate_tokens(compact_json(compact_raw_data(BUNDLE)))
+        out = compact_raw_data(BUNDLE, max_tokens=unbounded // 2)
+        assert estimate_tokens(compact_json(out)) <= unbounded // 2
+        assert len(out["github"]["repos"]) < 15
+
+    def test_floor_when_budget_unreachable(self):
+        out = compact_raw_data(BUNDLE, max_tokens=10)
+        assert len(out["github"]["repos"]) == MIN_ITEMS
+        assert len(out["github"]["starred_topics"]) == MIN_ITEMS
+
+    async def test_profile_analysis_sends_compacted_bundle(self):
+        svc, llm = make_llm_service()
+        llm.ainvoke.return_value = MagicMock(content=json.dumps({"public": {}, "private": {}}))
+        with patch("app.services.llm.settings.profile_token_budget", 400):
+            result = await svc.profile_analysis(BUNDLE)
+
+        human = llm.ainvoke.await_args.args[0][1].content
+        assert "\n" not in human
+        assert estimate_tokens(human) <= 400
+        assert result["data_sources"] == list(BUNDLE)
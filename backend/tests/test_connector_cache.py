@@ -0,0 +1,99 @@
+"""Tests for the shared connector-result cache."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from app.services.cache import MemoryBackend
+from app.services.connector_cache import ConnectorCache
+from app.services.metrics import metrics
+
+DATA = {"recent_films": [{"title": "Anora", "rating": 4.5, "link": "x"}]}
+
+
+def _cache(**kwargs):
+    return ConnectorCache(MemoryBackend(), **{"ttl": 60.0, **kwargs})
+
+
+def _age(monkeypatch, seconds):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + seconds)
+
+
+class TestReadThrough:
+    async def test_miss_then_hit(self):
+        cache = _cache()
+        fetch = AsyncMock(return_value=DATA)
+        assert await cache.fetch("letterboxd", "dave", fetch) == DATA
+        assert await cache.fetch("letterboxd", " @Dave", fetch) == DATA
+        fetch.assert_awaited_once()
+
+    async def test_services_do_not_collide(self):
+        cache = _cache()
+        await cache.set("github", "dave", {"repos": []})
+        assert await cache.get("letterboxd", "dave") is None
+
+    async def test_empty_result_not_cached(self):
+        cache = _cache()
+        fetch = AsyncMock(return_value={})
+        await cache.fetch("github", "dave", fetch)
+        await cache.fetch("github", "dave", fetch)
+        assert fetch.await_count == 2
+
+    async def test_per_service_ttl(self, monkeypatch):
+        cache = _cache(ttls={"letterboxd": 10.0})
+        await cache.set("letterboxd", "dave", DATA)
+        await cache.set("github", "dave", DATA)
+        _age(monkeypatch, 30)
+        assert await cache.get("letterboxd", "dave") is None
+        assert await cache.get("github", "dave") == DATA
+
+    async def test_expired_entry_refetched(self, monkeypatch):
+        cache = _cache(stale_ttl=0.0)
+        await cache.set("github", "dave", {"repos": ["old"]})
+        _age(monkeypatch, 61)
+        fetch = AsyncMock(return_value={"repos": ["new"]})
+        assert await cache.fetch("github", "dave", fetch) == {"repos": ["new"]}
+
+
+class TestStaleWhileRevalidate:
+    async def test_stale_served_and_refreshed_once(self, monkeypatch):
+        cache = _cache(stale_ttl=600.0)
+        await cache.set("github", "dave", {"repos": ["old"]})
+        _age(monkeypatch, 120)
+
+        started = asyncio.Event()
+
+        async def slow_fetch():
+            started.set()
+            await asyncio.sleep(0.01)
+            return {"repos": ["new"]}
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        first = await cache.fetch("github", "dave", fetch)
+        second = await cache.fetch("github", "dave", fetch)
+        assert first == second == {"repos": ["old"]}
+        await asyncio.gather(*cache._refreshing.values())
+        fetch.assert_awaited_once()
+        assert await cache.get("github", "dave") == {"repos": ["new"]}
+
+    async def test_failed_refresh_keeps_stale_entry(self, monkeypatch):
+        cache = _cache(stale_ttl=600.0)
+        await cache.set("github", "dave", {"repos": ["old"]})
+        _age(monkeypatch, 120)
+        await cache.fetch("github", "dave", AsyncMock(side_effect=RuntimeError("down")))
+        await asyncio.gather(*cache._refreshing.values())
+        assert await cache.fetch("github", "dave", AsyncMock()) == {"repos": ["old"]}
+
+
+class TestMetrics:
+    async def test_hits_and_misses_by_service(self):
+        cache = ConnectorCache(MemoryBackend(max_bytes=1 << 20), ttl=60.0)
+        before_hits = metrics.counter("connector_cache.hits", service="linkedin")
+        before_misses = metrics.counter("connector_cache.misses", service="linkedin")
+        fetch = AsyncMock(return_value={"name": "Jane"})
+        await cache.fetch("linkedin", "jane", fetch)
+        await cache.fetch("linkedin", "jane", fetch)
+        assert metrics.counter("connector_cache.hits", service="linkedin") == before_hits + 1
+        assert metrics.counter("connector_cache.misses", service="linkedin") == before_misses + 1
+        assert metrics.snapshot()["gauges"]["connector_cache.bytes"] > 0
@@ -11,6 +11,7 @@ import pytest
 
 from app.services.llm import LLMService, _empty_crossref
 from app.graph.nodes.crossref import crossref_node
+from tests.llm_stub import make_llm_service
 
 
 # ── sample data ──────────────────────────────────────────────────
@@ -119,47 +120,44 @@ class TestEmptyCrossref:
 # ── unit: cross_reference with mocked Gemini ─────────────────────
 
 def _make_llm_service():
-    """Create an LLMService with the Gemini client init bypassed (for unit tests)."""
-    with patch.object(LLMService, "__init__", lambda self: None):
-        svc = LLMService()
-        svc._llm = AsyncMock()
-    return svc
+    """An LLMService backed by an AsyncMock model (for unit tests)."""
+    return make_llm_service()
 
 
 class TestCrossReferenceUnit:
     @pytest.mark.asyncio
     async def test_both_empty_returns_placeholder_no_api_call(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         result, venue = await svc.cross_reference({}, {})
-        svc._llm.ainvoke.assert_not_called()
+        llm.ainvoke.assert_not_called()
         assert result == _empty_crossref()
         assert venue is False
 
     @pytest.mark.asyncio
     async def test_one_empty_returns_placeholder(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         result, venue = await svc.cross_reference(DOSSIER_A, {})
-        svc._llm.ainvoke.assert_not_called()
+        llm.ainvoke.assert_not_called()
         assert result == _empty_crossref()
         assert venue is False
 
     @pytest.mark.asyncio
     async def test_none_dossier_returns_placeholder(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         result, venue = await svc.cross_reference(None, DOSSIER_B)
-        svc._llm.ainvoke.assert_not_called()
+        llm.ainvoke.assert_not_called()
         assert result == _empty_crossref()
 
     @pytest.mark.asyncio
     async def test_valid_dossiers_calls_gemini(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
         fake_response.content = FAKE_CROSSREF_RESPONSE
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         result, venue = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
 
-        svc._llm.ainvoke.assert_called_once()
+        llm.ainvoke.assert_called_once()
         assert isinstance(result["shared"], list)
         assert len(result["shared"]) == 1
         assert result["shared"][0]["signal"] == "Both are tech enthusiasts"
@@ -167,50 +165,55 @@ class TestCrossReferenceUnit:
 
     @pytest.mark.asyncio
     async def test_venue_appropriate_popped_from_result(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
         fake_response.content = FAKE_CROSSREF_RESPONSE
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         result, _ = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
         assert "venue_appropriate" not in result
 
     @pytest.mark.asyncio
     async def test_sends_both_dossiers_to_gemini(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
         fake_response.content = FAKE_CROSSREF_RESPONSE
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         await svc.cross_reference(DOSSIER_A, DOSSIER_B)
 
-        call_args = svc._llm.ainvoke.call_args[0][0]
+        call_args = llm.ainvoke.call_args[0][0]
         human_msg_content = call_args[1].content
         parsed = json.loads(human_msg_content)
-        assert "person_a" in parsed
-        assert "person_b" in parsed
+        assert "Person A" in parsed
+        assert "Person B" in parsed
 
     @pytest.mark.asyncio
     async def test_handles_markdown_wrapped_json(self):
-        svc = _make_llm_service()
+        svc, llm = _make_llm_service()
         wrapped = "```json\n" + FAKE_CROSSREF_RESPONSE + "\n```"
         fake_response = AsyncMock()
         fake_response.content = wrapped
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
         result, venue = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
         assert isinstance(result["shared"], list)
         assert venue is True
 
     @pytest.mark.asyncio
-    async def test_raises_on_invalid_json(self):
-        svc = _make_llm_service()
+    async def test_prose_reply_falls_back_to_empty(self):
+        svc, llm = _make_llm_service()
         fake_response = AsyncMock()
-        fake_response.content = "Not valid JSON"
-        svc._llm.ainvoke = AsyncMock(return_value=fake_response)
+        fake_response.content = "Sorry, I cannot compare these profiles."
+        llm.ainvoke = AsyncMock(return_value=fake_response)
 
-        with pytest.raises(json.JSONDecodeError):
-            await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        result, venue = await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        assert result == {"shared": [], "complementary": [], "tension_points": [], "citations": []}
+        assert venue is False
+
+        # Not cached, so the next request asks again
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        assert llm.ainvoke.await_count == 2
 
 
 # ── unit: crossref_node with mocked LLMService ──────────────────
@@ -225,7 +228,7 @@ class TestCrossrefNodeUnit:
             "citations": ["c1"],
         }
 
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(fake_crossref, True))
 
@@ -240,7 +243,7 @@ class TestCrossrefNodeUnit:
 
     @pytest.mark.asyncio
     async def test_empty_dossiers_no_gemini_call(self):
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(_empty_crossref(), False))
 
@@ -255,7 +258,7 @@ class TestCrossrefNodeUnit:
 
     @pytest.mark.asyncio
     async def test_handles_missing_dossiers(self):
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(_empty_crossref(), False))
 
@@ -270,7 +273,7 @@ class TestCrossrefNodeUnit:
 
     @pytest.mark.asyncio
     async def test_handles_empty_state(self):
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
             instance = MockLLM.return_value
             instance.cross_reference = AsyncMock(return_value=(_empty_crossref(), False))
 
@@ -0,0 +1,129 @@
+"""Tests for the fingerprinted dossier store."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+from app.services.cache import MemoryBackend
+from app.services.dossier_store import DossierStore, fingerprint
+from app.services.llm import PROFILE_PROMPT_VERSION
+from tests.llm_stub import make_llm_service
+
+RAW = {"github": {"languages": {"Python": 3}, "repos": ["a", "b"]}, "letterboxd": {"films": ["Anora"]}}
+DOSSIER = {"public": {"vibe": "Builder", "tags": ["python"]}, "private": {"summary": "Builds things"}}
+
+
+def _service(store):
+    svc, llm = make_llm_service(dossiers=store)
+    llm.ainvoke.return_value = MagicMock(content=json.dumps(DOSSIER))
+    return svc, llm
+
+
+# ── unit: fingerprint and key ─────────────────────────────────────
+
+class TestFingerprint:
+    def test_key_order_does_not_matter(self):
+        reordered = {"letterboxd": {"films": ["Anora"]}, "github": {"repos": ["a", "b"], "languages": {"Python": 3}}}
+        assert fingerprint(RAW) == fingerprint(reordered)
+
+    def test_content_changes_do(self):
+        changed = {**RAW, "letterboxd": {"films": ["Anora", "Nosferatu"]}}
+        assert fingerprint(RAW) != fingerprint(changed)
+
+    def test_key_covers_model_prompt_and_name(self):
+        base = DossierStore.key(RAW, "Ada", model="m1", prompt_version="v1")
+        assert base == DossierStore.key(dict(reversed(RAW.items())), "Ada", model="m1", prompt_version="v1")
+        assert base != DossierStore.key(RAW, "Ada", model="m2", prompt_version="v1")
+        assert base != DossierStore.key(RAW, "Ada", model="m1", prompt_version="v2")
+        assert base != DossierStore.key(RAW, "Grace", model="m1", prompt_version="v1")
+
+
+# ── unit: store ───────────────────────────────────────────────────
+
+class TestDossierStore:
+    async def test_repeat_analysis_served_from_store(self):
+        svc, llm = _service(DossierStore(MemoryBackend()))
+        first = await svc.profile_analysis(RAW)
+        second = await svc.profile_analysis(dict(reversed(RAW.items())))
+        llm.ainvoke.assert_awaited_once()
+        assert first == second
+        assert second["data_sources"] == ["github", "letterboxd"]
+
+    async def test_changed_data_reanalyzed(self):
+        svc, llm = _service(DossierStore(MemoryBackend()))
+        await svc.profile_analysis(RAW)
+        await svc.profile_analysis({**RAW, "spotify": {"top_artists": ["Drake"]}})
+        assert llm.ainvoke.await_count == 2
+
+    async def test_prompt_version_is_part_of_the_key(self):
+        store = DossierStore(MemoryBackend())
+        svc, llm = _service(store)
+        await svc.profile_analysis(RAW)
+        with patch("app.services.llm.PROFILE_PROMPT_VERSION", PROFILE_PROMPT_VERSION + "x"):
+            await svc.profile_analysis(RAW)
+        assert llm.ainvoke.await_count == 2
+
+    async def test_concurrent_identical_analyses_share_one_call(self):
+        svc, llm = _service(DossierStore(MemoryBackend()))
+
+        async def slow(_messages):
+            await asyncio.sleep(0.02)
+            return MagicMock(content=json.dumps(DOSSIER))
+
+        llm.ainvoke.side_effect = slow
+        results = await asyncio.gather(*(svc.profile_analysis(RAW) for _ in range(5)))
+        llm.ainvoke.assert_awaited_once()
+        assert all(r == results[0] for r in results)
+
+    async def test_hits_are_copies(self):
+        svc, llm = _service(DossierStore(MemoryBackend()))
+        (await svc.profile_analysis(RAW))["public"]["tags"].append("mutated")
+        assert (await svc.profile_analysis(RAW))["public"]["tags"] == ["python"]
+
+    async def test_failed_analysis_not_stored(self):
+        svc, llm = _service(DossierStore(MemoryBackend()))
+        llm.ainvoke.side_effect = RuntimeError("provider down")
+        for _ in range(2):
+            try:
+                await svc.profile_analysis(RAW)
+            except RuntimeError:
+                pass
+        assert llm.ainvoke.await_count == 2
+
+    async def test_prose_reply_not_stored(self):
+        backend = MemoryBackend()
+        svc, llm = _service(DossierStore(backend))
+        llm.ainvoke.return_value = MagicMock(content="Sorry, I cannot analyze this profile.")
+        await svc.profile_analysis(RAW)
+        await svc.profile_analysis(RAW)
+        assert llm.ainvoke.await_count == 2
+        assert len(backend) == 0
+
+    async def test_blank_reply_not_stored(self):
+        backend = MemoryBackend()
+        svc, llm = _service(DossierStore(backend))
+        # Decodes, but nothing in it fits the schema, so it conforms to the empty dossier
+        llm.ainvoke.return_value = MagicMock(content='["not", "a", "dossier"]')
+        first = await svc.profile_analysis(RAW)
+        await svc.profile_analysis(RAW)
+        assert first["public"]["vibe"] == ""
+        assert llm.ainvoke.await_count == 2
+        assert len(backend) == 0
+
+    async def test_blank_streamed_reply_not_stored(self):
+        backend = MemoryBackend()
+        svc, llm = _service(DossierStore(backend))
+
+        async def astream(_messages):
+            yield MagicMock(content='{"public": {"tags": "oops"}}', usage_metadata=None)
+
+        llm.astream = astream
+        dossiers = [d async for d in svc.stream_profile_analysis(RAW)]
+        assert dossiers[-1]["public"]["tags"] == []
+        assert len(backend) == 0
+
+    async def test_empty_data_skips_store(self):
+        backend = MemoryBackend()
+        svc, llm = _service(DossierStore(backend))
+        await svc.profile_analysis({"github": {}})
+        assert len(backend) == 0
@@ -4,9 +4,13 @@ Unit tests exercise extraction logic with fake data.
 Integration tests hit the real GitHub API (marked with @pytest.mark.integration).
 """
 
+import httpx
 import pytest
 
 from app.connectors.github import GitHubConnector
+from app.services.cache import DiskBackend, MemoryBackend
+from app.services.etag_cache import ETagCache
+from tests.github_stub import GitHubStub
 
 
 # ── fixtures ──────────────────────────────────────────────────────
@@ -155,6 +159,122 @@ class TestExtractStarredTopics:
         assert connector._extract_starred_topics([{"topics": []}, {"topics": []}]) == []
 
 
+# ── unit: fetch with injected client ─────────────────────────────
+
+def _github_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.endswith("/repos"):
+        return httpx.Response(200, json=FAKE_REPOS)
+    if path.endswith("/events/public"):
+        return httpx.Response(200, json=FAKE_EVENTS)
+    if path.endswith("/starred"):
+        return httpx.Response(200, json=FAKE_STARRED)
+    return httpx.Response(404)
+
+
+class TestFetchWithInjectedClient:
+    async def test_full_output(self):
+        transport = httpx.MockTransport(_github_handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as client:
+            result = await GitHubConnector(client=client).fetch("@octocat")
+
+        assert result["languages"] == ["Python", "TypeScript"]
+        assert len(result["repos"]) == 4
+        assert result["commit_hours"] == [14, 3, 22]
+        assert "rust" in result["starred_topics"]
+
+    async def test_unknown_user_returns_empty(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as client:
+            result = await GitHubConnector(client=client).fetch("ghost")
+
+        assert result == {"languages": [], "repos": [], "commit_hours": [], "starred_topics": []}
+
+
+# ── unit: ETag conditional requests ──────────────────────────────
+
+def _etag_stub():
+    """Stub GitHub that honours If-None-Match and records what it served."""
+    served = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = _github_handler(request)
+        etag = f'"{request.url.path}"'
+        if request.headers.get("If-None-Match") == etag:
+            served.append(304)
+            return httpx.Response(304, headers={"ETag": etag})
+        served.append(200)
+        return httpx.Response(200, content=body.content, headers={"ETag": etag})
+
+    return handler, served
+
+
+class TestETagCache:
+    async def _fetch(self, handler, cache):
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as client:
+            return await GitHubConnector(client=client, etag_cache=cache).fetch("octocat")
+
+    async def test_refetch_uses_304(self):
+        cache = ETagCache(MemoryBackend())
+        handler, served = _etag_stub()
+
+        first = await self._fetch(handler, cache)
+        second = await self._fetch(handler, cache)
+
+        assert served == [200, 200, 200, 304, 304, 304]
+        assert first == second
+        assert cache.stats() == {"hits": 3, "misses": 3}
+
+    async def test_disk_backend_persists_across_instances(self, tmp_path):
+        handler, served = _etag_stub()
+        await self._fetch(handler, ETagCache(DiskBackend(tmp_path)))
+        result = await self._fetch(handler, ETagCache(DiskBackend(tmp_path)))
+
+        assert served[3:] == [304, 304, 304]
+        assert result["languages"] == ["Python", "TypeScript"]
+
+    async def test_no_etag_not_cached(self):
+        cache = ETagCache(MemoryBackend())
+        await self._fetch(_github_handler, cache)
+        await self._fetch(_github_handler, cache)
+        assert cache.stats() == {"hits": 0, "misses": 6}
+
+
+# ── unit: GraphQL mode against the local stub ────────────────────
+
+class TestGraphQLMode:
+    async def _fetch(self, stub, mode, username="octocat", token="stub-token"):
+        transport = httpx.MockTransport(stub.handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as client:
+            connector = GitHubConnector(
+                client=client, etag_cache=ETagCache(MemoryBackend()), mode=mode, token=token
+            )
+            return await connector.fetch(username)
+
+    async def test_same_output_as_rest(self):
+        rest = await self._fetch(GitHubStub(), "rest")
+        graphql = await self._fetch(GitHubStub(), "graphql")
+        assert graphql == rest
+        assert rest["repos"] and rest["starred_topics"] and rest["commit_hours"]
+
+    async def test_fewer_requests_and_bytes(self):
+        rest_stub, graphql_stub = GitHubStub(), GitHubStub()
+        await self._fetch(rest_stub, "rest")
+        await self._fetch(graphql_stub, "graphql")
+        assert graphql_stub.requests == 2  # GraphQL + the REST-only events feed
+        assert graphql_stub.bytes_sent < rest_stub.bytes_sent / 5
+
+    async def test_unknown_user_returns_empty(self):
+        result = await self._fetch(GitHubStub(), "graphql", username="ghost")
+        assert result == {"languages": [], "repos": [], "commit_hours": [], "starred_topics": []}
+
+    async def test_without_token_falls_back_to_rest(self):
+        stub = GitHubStub()
+        await self._fetch(stub, "graphql", token="")
+        assert stub.requests == 3
+
+
 # ── integration: real API calls ───────────────────────────────────
 
 @pytest.mark.integration
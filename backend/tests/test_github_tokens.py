@@ -0,0 +1,110 @@
+"""Tests for the GitHub token pool and rate-limit scheduling."""
+
+import time
+
+import httpx
+import pytest
+
+from app.connectors.github import GitHubConnector
+from app.services.cache import MemoryBackend
+from app.services.etag_cache import ETagCache
+from app.services.github_tokens import GitHubTokenPool, RateLimitExhausted
+from app.services.metrics import metrics
+
+
+def _headers(remaining, limit=5000, reset=None):
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Reset": str(int(reset or time.time() + 3600)),
+    }
+
+
+# ── unit: pool bookkeeping ────────────────────────────────────────
+
+class TestTokenPool:
+    def test_no_tokens_is_anonymous(self):
+        pool = GitHubTokenPool([])
+        assert not pool.authenticated
+        assert pool.stats()[0]["limit"] == 60
+
+    def test_deduplicates_tokens(self):
+        assert len(GitHubTokenPool(["a", "b", "a", ""])) == 2
+
+    async def test_picks_token_with_most_budget(self):
+        pool = GitHubTokenPool(["tok-a", "tok-b"])
+        a = await pool.acquire()
+        pool.release(a, 200, _headers(10))
+        chosen = await pool.acquire()
+        assert chosen.token == "tok-b"
+
+    async def test_in_flight_counts_against_budget(self):
+        pool = GitHubTokenPool(["tok-a", "tok-b"])
+        first = await pool.acquire()
+        pool.release(first, 200, _headers(1))
+        pool.release(await pool.acquire(), 200, _headers(1))
+        held = await pool.acquire()
+        other = await pool.acquire()
+        assert held is not other
+
+    async def test_fails_fast_when_exhausted(self):
+        pool = GitHubTokenPool(["tok-a"], max_wait=0)
+        state = await pool.acquire()
+        pool.release(state, 200, _headers(0, reset=time.time() + 600))
+        with pytest.raises(RateLimitExhausted, match="resets in"):
+            await pool.acquire()
+
+    async def test_queues_until_reset_within_max_wait(self):
+        pool = GitHubTokenPool(["tok-a"], resource="queue-test", max_wait=5)
+        state = await pool.acquire()
+        pool.release(state, 200, _headers(0, reset=int(time.time()) + 1))
+        again = await pool.acquire()
+        assert again.token == "tok-a"
+        assert metrics.counter("github.rate_limit.queued", resource="queue-test") >= 1
+
+    async def test_secondary_limit_backs_off(self):
+        pool = GitHubTokenPool(["tok-a"])
+        state = await pool.acquire()
+        pool.release(state, 403, {"Retry-After": "30"})
+        assert pool.stats()[0]["remaining"] == 0
+        with pytest.raises(RateLimitExhausted):
+            await pool.acquire()
+
+    async def test_publishes_utilization(self):
+        pool = GitHubTokenPool(["secret-token-1234"], resource="core")
+        state = await pool.acquire()
+        pool.release(state, 200, _headers(4000))
+        gauges = metrics.snapshot()["gauges"]
+        assert gauges["github.token.utilization{resource=core,token=…1234}"] == 0.2
+
+
+# ── unit: connector integration ───────────────────────────────────
+
+class TestConnectorScheduling:
+    async def test_rotates_to_next_token_on_403(self):
+        seen = []
+
+        def handler(request):
+            auth = request.headers.get("Authorization")
+            seen.append(auth)
+            if auth == "Bearer tok-a":
+                return httpx.Response(403, headers=_headers(0))
+            return httpx.Response(200, json=[], headers=_headers(4999))
+
+        pool = GitHubTokenPool(["tok-a", "tok-b"])
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as client:
+            connector = GitHubConnector(client=client, etag_cache=ETagCache(MemoryBackend()), token="x")
+            connector._core_pool = pool
+            repos = await connector._fetch_repos(client, "octocat")
+
+        assert repos == []
+        assert "Bearer tok-a" in seen and "Bearer tok-b" in seen
+        assert {s["token"]: s["remaining"] for s in pool.stats()} == {"…ok-a": 0, "…ok-b": 4999}
+
+    async def test_raises_clear_error_when_all_exhausted(self):
+        transport = httpx.MockTransport(lambda r: httpx.Response(403, headers=_headers(0)))
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.github.com") as client:
+            connector = GitHubConnector(client=client, etag_cache=ETagCache(MemoryBackend()), token="tok-a")
+            with pytest.raises(RateLimitExhausted):
+                await connector.fetch("octocat")
@@ -0,0 +1,81 @@
+"""Tests for the shared httpx client registry."""
+
+import httpx
+import pytest
+
+from app.services.http_clients import (
+    HostConfig,
+    HTTPClientRegistry,
+    build_client,
+    get_http_registry,
+    host_config,
+    http_client,
+    set_http_registry,
+)
+
+
+@pytest.fixture
+def registry():
+    reg = HTTPClientRegistry()
+    set_http_registry(reg)
+    yield reg
+    set_http_registry(None)
+
+
+class TestRegistry:
+    async def test_same_client_per_host(self, registry):
+        assert registry.get("github") is registry.get("github")
+        assert registry.get("github") is not registry.get("letterboxd")
+        await registry.aclose()
+
+    async def test_host_config_applied(self, registry):
+        client = registry.get("github")
+        assert str(client.base_url) == "https://api.github.com"
+        assert client.headers["Accept"] == "application/vnd.github+json"
+        await registry.aclose()
+
+    async def test_aclose_closes_clients(self, registry):
+        client = registry.get("places")
+        await registry.aclose()
+        assert client.is_closed
+
+    async def test_closed_client_is_rebuilt(self, registry):
+        client = registry.get("places")
+        await client.aclose()
+        assert registry.get("places") is not client
+        await registry.aclose()
+
+    async def test_scraping_clients_drop_cookies(self):
+        request = httpx.Request("GET", "https://www.instagram.com/someone/")
+        response = httpx.Response(200, headers={"Set-Cookie": "csrftoken=abc; Path=/"}, request=request)
+        async with build_client(host_config("instagram")) as scraper, build_client(host_config("github")) as api:
+            scraper.cookies.extract_cookies(response)
+            api.cookies.extract_cookies(response)
+            assert not scraper.cookies
+            assert api.cookies["csrftoken"] == "abc"
+
+    def test_settings_override_timeout(self, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "http_host_timeouts", {"github": 3.0})
+        assert host_config("github").timeout == 3.0
+        assert host_config("letterboxd").timeout == HostConfig().timeout
+
+
+class TestHttpClientContext:
+    async def test_prefers_injected_client(self, registry):
+        async with httpx.AsyncClient() as injected:
+            async with http_client("github", injected) as client:
+                assert client is injected
+
+    async def test_uses_shared_client_when_registered(self, registry):
+        async with http_client("github") as client:
+            assert client is registry.get("github")
+        assert not client.is_closed
+        await registry.aclose()
+
+    async def test_throwaway_client_without_registry(self):
+        assert get_http_registry() is None
+        async with http_client("github") as client:
+            assert str(client.base_url) == "https://api.github.com"
+        assert client.is_closed
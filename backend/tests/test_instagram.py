@@ -4,18 +4,22 @@ Unit tests exercise extraction logic with fake page data.
 Integration tests hit real Instagram (marked with @pytest.mark.integration).
 """
 
-import base64
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.connectors.instagram import InstagramConnector
+from app.services.blobs import BlobStore
+
+FIXTURES = Path(__file__).parent / "fixtures"
 
 
 # ── fixtures ──────────────────────────────────────────────────────
 
 @pytest.fixture
-def connector():
-    return InstagramConnector()
+def connector(tmp_path):
+    return InstagramConnector(blob_store=BlobStore(tmp_path))
 
 
 FAKE_SCREENSHOT = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100  # fake PNG bytes
@@ -67,49 +71,66 @@ class TestExtractProfileData:
     def test_full_profile(self, connector):
         result = connector._extract_profile_data(FAKE_PROFILE_FULL)
         assert "Architectural Digest" in result["bio"]
-        assert len(result["screenshot_b64"]) > 0
+        assert result["screenshot_ref"] == ""  # filled in by fetch() once stored
         assert result["login_wall"] is False
 
     def test_login_wall_detected(self, connector):
         result = connector._extract_profile_data(FAKE_PROFILE_LOGIN_WALL)
         assert result["login_wall"] is True
         assert result["bio"] == ""  # meta has "log in" so gets filtered
-        assert result["screenshot_b64"] == ""  # screenshot dropped on login wall
+        assert result["screenshot_ref"] == ""
 
     def test_partial_data(self, connector):
         result = connector._extract_profile_data(FAKE_PROFILE_PARTIAL)
         assert result["bio"] == ""
-        assert len(result["screenshot_b64"]) > 0
         assert result["login_wall"] is False
 
     def test_empty_profile(self, connector):
         result = connector._extract_profile_data(FAKE_PROFILE_EMPTY)
         assert result["bio"] == ""
-        assert result["screenshot_b64"] == ""
+        assert result["screenshot_ref"] == ""
         assert result["login_wall"] is False
 
     def test_empty_dict(self, connector):
         result = connector._extract_profile_data({})
         assert result["bio"] == ""
-        assert result["screenshot_b64"] == ""
+        assert result["screenshot_ref"] == ""
 
 
-# ── unit: screenshot encoding ────────────────────────────────────
+# ── unit: screenshot capture ─────────────────────────────────────
 
-class TestScreenshotEncoding:
-    def test_screenshot_roundtrips(self, connector):
-        result = connector._extract_profile_data(FAKE_PROFILE_FULL)
-        decoded = base64.b64decode(result["screenshot_b64"])
-        assert decoded == FAKE_SCREENSHOT
+class TestScreenshotCapture:
+    async def test_stored_and_referenced(self, connector, tmp_path):
+        with patch.object(connector, "_fetch_profile", AsyncMock(return_value=FAKE_PROFILE_FULL)):
+            result = await connector.fetch("archdigest", screenshot=True)
+        path = BlobStore(tmp_path).path(result["screenshot_ref"])
+        assert path.read_bytes() == FAKE_SCREENSHOT
+        assert "screenshot_b64" not in result
 
-    def test_empty_screenshot_stays_empty(self, connector):
-        result = connector._extract_profile_data(FAKE_PROFILE_LOGIN_WALL)
-        assert result["screenshot_b64"] == ""
+    async def test_same_bytes_same_ref(self, connector):
+        with patch.object(connector, "_fetch_profile", AsyncMock(return_value=FAKE_PROFILE_FULL)):
+            first = await connector.fetch("archdigest", screenshot=True)
+            second = await connector.fetch("archdigest", screenshot=True)
+        assert first["screenshot_ref"] == second["screenshot_ref"]
 
-    def test_none_screenshot_bytes(self, connector):
-        raw = {"title": "", "bio_text": "", "screenshot_bytes": None, "final_url": "", "meta_description": ""}
-        result = connector._extract_profile_data(raw)
-        assert result["screenshot_b64"] == ""
+    async def test_login_wall_screenshot_not_stored(self, connector, tmp_path):
+        with patch.object(connector, "_fetch_profile", AsyncMock(return_value=FAKE_PROFILE_LOGIN_WALL)):
+            result = await connector.fetch("someone", screenshot=True)
+        assert result["screenshot_ref"] == ""
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_off_by_default(self, connector):
+        with patch.object(connector, "_fetch_profile", AsyncMock(return_value=FAKE_PROFILE_EMPTY)) as fetch:
+            result = await connector.fetch("archdigest")
+        fetch.assert_awaited_once_with("archdigest", screenshot=False)
+        assert result["screenshot_ref"] == ""
+
+    async def test_screenshot_goes_straight_to_browser(self, connector):
+        with patch.object(connector, "_fetch_profile_http", AsyncMock()) as http, \
+             patch.object(connector, "_fetch_profile_browser", AsyncMock(return_value=FAKE_PROFILE_FULL)) as browser:
+            await connector._fetch_profile("archdigest", screenshot=True)
+        http.assert_not_called()
+        browser.assert_awaited_once_with("archdigest", screenshot=True)
 
 
 # ── unit: output shape ───────────────────────────────────────────
@@ -118,20 +139,20 @@ class TestOutputShape:
     def test_all_keys_present(self, connector):
         result = connector._extract_profile_data(FAKE_PROFILE_FULL)
         assert "bio" in result
-        assert "screenshot_b64" in result
+        assert "screenshot_ref" in result
         assert "login_wall" in result
 
     def test_all_values_correct_type(self, connector):
         result = connector._extract_profile_data(FAKE_PROFILE_FULL)
         assert isinstance(result["bio"], str)
-        assert isinstance(result["screenshot_b64"], str)
+        assert isinstance(result["screenshot_ref"], str)
         assert isinstance(result["login_wall"], bool)
 
     def test_login_wall_values_are_strings(self, connector):
         """Even on login wall, string fields should be strings not None."""
         result = connector._extract_profile_data(FAKE_PROFILE_LOGIN_WALL)
         assert isinstance(result["bio"], str)
-        assert isinstance(result["screenshot_b64"], str)
+        assert isinstance(result["screenshot_ref"], str)
 
 
 # ── unit: login wall detection ───────────────────────────────────
@@ -158,7 +179,62 @@ class TestLoginWallDetection:
     def test_login_wall_screenshot_dropped(self, connector):
         """Screenshot should be empty string on login wall (it's just the login page)."""
         result = connector._extract_profile_data(FAKE_PROFILE_LOGIN_WALL)
-        assert result["screenshot_b64"] == ""
+        assert result["screenshot_ref"] == ""
+
+
+# ── unit: HTTP-first tier ────────────────────────────────────────
+
+def _fixture_html(name):
+    return (FIXTURES / name).read_text()
+
+
+class TestStaticTier:
+    def test_parses_profile_meta(self, connector):
+        raw = connector._parse_profile_html(
+            _fixture_html("instagram_profile.html"), "https://www.instagram.com/archdigest/"
+        )
+        assert "Architectural Digest" in raw["title"]
+        assert "4M Followers" in raw["meta_description"]
+        assert raw["screenshot_bytes"] == b""
+        assert connector._needs_browser(raw) is False
+
+    def test_static_raw_feeds_extractor(self, connector):
+        raw = connector._parse_profile_html(
+            _fixture_html("instagram_profile.html"), "https://www.instagram.com/archdigest/"
+        )
+        result = connector._extract_profile_data(raw)
+        assert "4M Followers" in result["bio"]
+        assert result["login_wall"] is False
+
+    def test_login_wall_needs_browser(self, connector):
+        raw = connector._parse_profile_html(
+            _fixture_html("instagram_login_wall.html"), "https://www.instagram.com/accounts/login/"
+        )
+        assert connector._needs_browser(raw) is True
+
+    def test_empty_page_needs_browser(self, connector):
+        raw = connector._parse_profile_html("<html><head></head></html>", "https://www.instagram.com/x/")
+        assert connector._needs_browser(raw) is True
+
+    async def test_skips_browser_when_static_succeeds(self, connector):
+        static = connector._parse_profile_html(
+            _fixture_html("instagram_profile.html"), "https://www.instagram.com/archdigest/"
+        )
+        with patch.object(connector, "_fetch_profile_http", AsyncMock(return_value=static)), \
+             patch.object(connector, "_fetch_profile_browser", AsyncMock()) as browser:
+            raw = await connector._fetch_profile("archdigest")
+        browser.assert_not_called()
+        assert raw == static
+
+    async def test_falls_back_to_browser_on_login_wall(self, connector):
+        wall = connector._parse_profile_html(
+            _fixture_html("instagram_login_wall.html"), "https://www.instagram.com/accounts/login/"
+        )
+        with patch.object(connector, "_fetch_profile_http", AsyncMock(return_value=wall)), \
+             patch.object(connector, "_fetch_profile_browser", AsyncMock(return_value=FAKE_PROFILE_FULL)) as browser:
+            raw = await connector._fetch_profile("archdigest")
+        browser.assert_awaited_once_with("archdigest", screenshot=False)
+        assert raw == FAKE_PROFILE_FULL
 
 
 # ── integration: real Instagram ──────────────────────────────────
@@ -177,7 +253,7 @@ class TestInstagramIntegration:
         result = await connector.fetch("archdigest")
 
         assert isinstance(result["bio"], str)
-        assert isinstance(result["screenshot_b64"], str)
+        assert isinstance(result["screenshot_ref"], str)
         assert isinstance(result["login_wall"], bool)
 
     @pytest.mark.asyncio
@@ -4,9 +4,19 @@ Unit tests exercise extraction logic with fake RSS data.
 Integration tests hit the real Letterboxd RSS feed (marked with @pytest.mark.integration).
 """
 
+from pathlib import Path
+
+from unittest.mock import patch
+
+import httpx
 import pytest
 
-from app.connectors.letterboxd import LetterboxdConnector
+from app.connectors import letterboxd
+from app.connectors.letterboxd import FeedStreamParser, LetterboxdConnector
+from app.services.cache import MemoryBackend
+from app.services.etag_cache import ETagCache
+
+FIXTURES = Path(__file__).parent / "fixtures"
 
 
 # ── fixtures ──────────────────────────────────────────────────────
@@ -159,6 +169,171 @@ class TestFullExtraction:
         assert films[2]["rating"] == 1.5  # ★½
 
 
+# ── unit: streaming feed parser ──────────────────────────────────
+
+def _big_feed(n: int) -> bytes:
+    items = "".join(
+        f"<item><title>Film {i}, 2024 - ★★★</title><link>https://letterboxd.com/u/film/{i}/</link>"
+        f"<letterboxd:memberRating>3.0</letterboxd:memberRating></item>"
+        for i in range(n)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss version="2.0" xmlns:letterboxd="https://letterboxd.com"><channel>'
+        f"{items}</channel></rss>"
+    ).encode()
+
+
+class TestFeedStreamParser:
+    def test_matches_feedparser_entry_shape(self):
+        parser = FeedStreamParser()
+        parser.feed((FIXTURES / "letterboxd_feed.xml").read_bytes())
+        assert parser.entries[0] == {
+            "title": "The Substance, 2024 - ★★★★",
+            "link": "https://letterboxd.com/dave/film/the-substance-2024/",
+            "letterboxd_memberrating": "4.0",
+        }
+        assert "letterboxd_memberrating" not in parser.entries[2]
+
+    def test_extract_films_output_unchanged(self, connector):
+        parser = FeedStreamParser()
+        parser.feed((FIXTURES / "letterboxd_feed.xml").read_bytes())
+        films = connector._extract_films({"entries": parser.entries})
+        assert films == [
+            {"title": "The Substance, 2024", "rating": 4.0,
+             "link": "https://letterboxd.com/dave/film/the-substance-2024/"},
+            {"title": "Anora, 2024", "rating": 4.5,
+             "link": "https://letterboxd.com/dave/film/anora-2024/"},
+            {"title": "Past Lives, 2023", "rating": None,
+             "link": "https://letterboxd.com/dave/film/past-lives/"},
+        ]
+
+    def test_handles_arbitrary_chunk_boundaries(self):
+        data = (FIXTURES / "letterboxd_feed.xml").read_bytes()
+        parser = FeedStreamParser()
+        for i in range(0, len(data), 7):
+            parser.feed(data[i:i + 7])
+        assert [e["title"] for e in parser.entries][1] == "Anora, 2024 - ★★★★½"
+
+    def test_stops_after_max_items(self):
+        parser = FeedStreamParser(max_items=5)
+        assert parser.feed(_big_feed(50)) is True
+        assert len(parser.entries) == 5
+
+
+class TestFetchFeed:
+    async def test_stops_reading_after_twenty_items(self):
+        body = _big_feed(2000)
+        sent = []
+
+        async def stream():
+            for i in range(0, len(body), 4096):
+                sent.append(i)
+                yield body[i:i + 4096]
+
+        transport = httpx.MockTransport(lambda r: httpx.Response(200, content=stream()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await LetterboxdConnector(client=client).fetch("u")
+
+        assert len(result["recent_films"]) == 20
+        assert result["recent_films"][19] == {
+            "title": "Film 19, 2024", "rating": 3.0, "link": "https://letterboxd.com/u/film/19/",
+        }
+        assert len(sent) * 4096 < len(body)
+
+    async def test_missing_user_returns_empty(self):
+        transport = httpx.MockTransport(lambda r: httpx.Response(404))
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await LetterboxdConnector(client=client).fetch("nobody")
+        assert result["recent_films"] == []
+
+    async def test_malformed_feed_keeps_parsed_items(self):
+        body = _big_feed(3).removesuffix(b"</channel></rss>") + b"<item><title>broken</ttle></item>"
+        transport = httpx.MockTransport(lambda r: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await LetterboxdConnector(client=client).fetch("u")
+        assert len(result["recent_films"]) == 3
+
+
+# ── unit: feed cache ─────────────────────────────────────────────
+
+def _feed_server(feed: bytes):
+    """Serves ``feed`` with an ETag, answering matching conditional GETs with 304."""
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, content=feed, headers={
+            "ETag": '"v1"', "Last-Modified": "Sun, 01 Dec 2024 10:00:00 GMT",
+        })
+
+    return handler, seen
+
+
+class TestFeedCache:
+    async def _fetch(self, handler, cache, username="dave"):
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await LetterboxdConnector(client=client, feed_cache=cache).fetch(username)
+
+    async def test_fresh_entry_skips_network(self):
+        cache = ETagCache(MemoryBackend())
+        handler, seen = _feed_server((FIXTURES / "letterboxd_feed.xml").read_bytes())
+        first = await self._fetch(handler, cache)
+        second = await self._fetch(handler, cache, "@Dave ")
+        assert first == second
+        assert len(seen) == 1
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+    async def test_expired_entry_revalidates_with_304(self, monkeypatch):
+        monkeypatch.setattr(letterboxd.settings, "letterboxd_feed_ttl", 0.0)
+        monkeypatch.setattr(letterboxd.settings, "letterboxd_feed_stale_ttl", 0.0)
+        cache = ETagCache(MemoryBackend())
+        handler, seen = _feed_server((FIXTURES / "letterboxd_feed.xml").read_bytes())
+        first = await self._fetch(handler, cache)
+        with patch.object(FeedStreamParser, "feed", side_effect=AssertionError("parsed on 304")):
+            second = await self._fetch(handler, cache)
+        assert second == first
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        assert seen[1].headers["If-Modified-Since"] == "Sun, 01 Dec 2024 10:00:00 GMT"
+
+    async def test_stale_entry_served_then_refreshed(self, monkeypatch):
+        monkeypatch.setattr(letterboxd.settings, "letterboxd_feed_ttl", 0.0)
+        monkeypatch.setattr(letterboxd.settings, "letterboxd_feed_stale_ttl", 3600.0)
+        cache = ETagCache(MemoryBackend())
+        handler, seen = _feed_server((FIXTURES / "letterboxd_feed.xml").read_bytes())
+        first = await self._fetch(handler, cache)
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            second = await LetterboxdConnector(client=client, feed_cache=cache).fetch("dave")
+            assert second == first
+            await letterboxd._revalidating["dave"]
+        assert len(seen) == 2
+        assert "dave" not in letterboxd._revalidating
+
+    async def test_feed_without_validators_still_cached(self):
+        cache = ETagCache(MemoryBackend())
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, content=(FIXTURES / "letterboxd_feed.xml").read_bytes())
+
+        first = await self._fetch(handler, cache)
+        second = await self._fetch(handler, cache)
+        assert second == first
+        assert len(seen) == 1
+        assert cache.validators(await cache.lookup("dave")) == {}
+
+    async def test_missing_user_not_cached(self):
+        cache = ETagCache(MemoryBackend())
+        handler = lambda r: httpx.Response(404)
+        assert (await self._fetch(handler, cache, "nobody"))["recent_films"] == []
+        assert await cache.lookup("nobody") is None
+
+
 # ── integration: real RSS feed ───────────────────────────────────
 
 @pytest.mark.integration
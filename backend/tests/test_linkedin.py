@@ -4,10 +4,15 @@ Unit tests exercise extraction logic with fake page data.
 Integration tests hit real LinkedIn (marked with @pytest.mark.integration).
 """
 
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from app.connectors.linkedin import LinkedInConnector
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
 
 # ── fixtures ──────────────────────────────────────────────────────
 
@@ -165,6 +170,55 @@ class TestAuthWallDetection:
         assert connector._extract_profile_data(FAKE_PROFILE_FULL)["login_wall"] is False
 
 
+# ── unit: HTTP-first tier ────────────────────────────────────────
+
+def _fixture_html(name):
+    return (FIXTURES / name).read_text()
+
+
+class TestStaticTier:
+    def test_parses_profile_fields(self, connector):
+        raw = connector._parse_profile_html(
+            _fixture_html("linkedin_profile.html"), "https://www.linkedin.com/in/janedoe/"
+        )
+        assert raw["name_text"] == "Jane Doe"
+        assert raw["headline_text"] == "Senior Engineer at BigCo"
+        assert "distributed systems" in raw["meta_description"]
+        assert connector._needs_browser(raw) is False
+
+    def test_static_raw_feeds_extractor(self, connector):
+        raw = connector._parse_profile_html(
+            _fixture_html("linkedin_profile.html"), "https://www.linkedin.com/in/janedoe/"
+        )
+        result = connector._extract_profile_data(raw)
+        assert result["name"] == "Jane Doe"
+        assert result["headline"] == "Senior Engineer at BigCo"
+        assert result["login_wall"] is False
+
+    def test_authwall_needs_browser(self, connector):
+        raw = connector._parse_profile_html(
+            _fixture_html("linkedin_authwall.html"), "https://www.linkedin.com/authwall?trk=x"
+        )
+        assert connector._needs_browser(raw) is True
+
+    async def test_skips_browser_when_static_succeeds(self, connector):
+        static = connector._parse_profile_html(
+            _fixture_html("linkedin_profile.html"), "https://www.linkedin.com/in/janedoe/"
+        )
+        with patch.object(connector, "_fetch_profile_http", AsyncMock(return_value=static)), \
+             patch.object(connector, "_fetch_profile_browser", AsyncMock()) as browser:
+            raw = await connector._fetch_profile("janedoe")
+        browser.assert_not_called()
+        assert raw == static
+
+    async def test_falls_back_to_browser_when_http_fails(self, connector):
+        with patch.object(connector, "_fetch_profile_http", AsyncMock(return_value={})), \
+             patch.object(connector, "_fetch_profile_browser", AsyncMock(return_value={"name_text": "X"})) as browser:
+            raw = await connector._fetch_profile("janedoe")
+        browser.assert_awaited_once_with("janedoe")
+        assert raw == {"name_text": "X"}
+
+
 # ── integration: real LinkedIn ───────────────────────────────────
 
 @pytest.mark.integration
@@ -0,0 +1,154 @@
+"""Tests for the process-wide LLM governor and the shared LLMService."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import llm as llm_module
+from app.services.llm import get_llm_service, set_llm_service
+from app.services.llm_governor import BACKGROUND, INTERACTIVE, LLMGovernor
+from app.services.tokens import estimate_tokens
+from tests.llm_stub import make_llm_service
+
+
+async def _hold(governor, lane, release, order, name, tokens=0):
+    async with governor.slot(lane, tokens):
+        order.append(name)
+        await release.wait()
+
+
+async def _enter(governor, tokens):
+    async with governor.slot(BACKGROUND, tokens):
+        pass
+
+
+# ── unit: concurrency and lanes ───────────────────────────────────
+
+class TestConcurrency:
+    async def test_caps_in_flight_calls(self):
+        governor = LLMGovernor(max_concurrency=3, reserved_interactive=0)
+        release, order = asyncio.Event(), []
+        tasks = [asyncio.create_task(_hold(governor, BACKGROUND, release, order, i)) for i in range(5)]
+        await asyncio.sleep(0)
+        assert governor.in_flight == 3
+        assert governor.queued(BACKGROUND) == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert governor.in_flight == 0
+        assert sorted(order) == [0, 1, 2, 3, 4]
+
+    async def test_interactive_jumps_the_background_queue(self):
+        governor = LLMGovernor(max_concurrency=1, reserved_interactive=0)
+        release, order = asyncio.Event(), []
+        first = asyncio.create_task(_hold(governor, BACKGROUND, release, order, "bg-1"))
+        await asyncio.sleep(0)
+        queued = [asyncio.create_task(_hold(governor, BACKGROUND, release, order, f"bg-{i}")) for i in (2, 3)]
+        await asyncio.sleep(0)
+        chat = asyncio.create_task(_hold(governor, INTERACTIVE, release, order, "chat"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, chat, *queued)
+        assert order == ["bg-1", "chat", "bg-2", "bg-3"]
+
+    async def test_reserved_slot_keeps_chat_unblocked(self):
+        governor = LLMGovernor(max_concurrency=2, reserved_interactive=1)
+        release, order = asyncio.Event(), []
+        background = [asyncio.create_task(_hold(governor, BACKGROUND, release, order, i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert order == [0]
+
+        async with governor.slot(INTERACTIVE):
+            assert governor.in_flight == 2
+        release.set()
+        await asyncio.gather(*background)
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        governor = LLMGovernor(max_concurrency=1, reserved_interactive=0)
+        release, order = asyncio.Event(), []
+        holder = asyncio.create_task(_hold(governor, BACKGROUND, release, order, "a"))
+        waiter = asyncio.create_task(_hold(governor, BACKGROUND, release, order, "b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert governor.in_flight == 0
+        assert order == ["a"]
+
+    async def test_unknown_lane(self):
+        with pytest.raises(ValueError):
+            async with LLMGovernor().slot("batch"):
+                pass
+
+
+# ── unit: tokens per minute ───────────────────────────────────────
+
+class TestTokenBudget:
+    async def test_waits_for_the_window_to_roll_over(self):
+        governor = LLMGovernor(tokens_per_minute=1000)
+        async with governor.slot(BACKGROUND, 800):
+            pass
+        with patch("app.services.llm_governor.WINDOW", 0.1):
+            start = asyncio.get_running_loop().time()
+            async with governor.slot(BACKGROUND, 500):
+                waited = asyncio.get_running_loop().time() - start
+        assert waited >= 0.05
+        assert governor.window_tokens == 500
+
+    async def test_oversized_call_admitted_on_empty_window(self):
+        governor = LLMGovernor(tokens_per_minute=100)
+        await asyncio.wait_for(_enter(governor, 5000), 1)
+
+    async def test_settle_replaces_the_estimate(self):
+        governor = LLMGovernor(tokens_per_minute=1000)
+        async with governor.slot(BACKGROUND, 900) as ticket:
+            ticket.settle(200)
+        assert governor.window_tokens == 200
+        await asyncio.wait_for(_enter(governor, 700), 1)
+
+
+# ── unit: LLMService wiring ───────────────────────────────────────
+
+def _service(governor):
+    return make_llm_service(governor=governor)
+
+
+class TestLLMService:
+    async def test_calls_are_charged_and_settled(self):
+        governor = LLMGovernor(tokens_per_minute=100_000)
+        svc, llm = _service(governor)
+        llm.ainvoke.return_value = MagicMock(content="{}", usage_metadata={"total_tokens": 321})
+        await svc.generate_coaching({}, {}, {}, None)
+        assert governor.window_tokens == 321
+
+    async def test_coach_chat_uses_interactive_lane(self):
+        governor = LLMGovernor()
+        svc, llm = _service(governor)
+        llm.ainvoke.return_value = MagicMock(content=" hi ")
+        lanes = []
+        real_slot = governor.slot
+
+        def spy(lane, tokens):
+            lanes.append(lane)
+            return real_slot(lane, tokens)
+
+        with patch.object(governor, "slot", side_effect=spy):
+            assert await svc.coach_chat({}, {}, {}, "help", []) == "hi"
+            await svc.brainstorm_venue_queries({})
+        assert lanes == [INTERACTIVE, BACKGROUND]
+
+    def test_shared_instance(self):
+        set_llm_service(None)
+        try:
+            with patch.object(llm_module, "LLMService") as MockLLM:
+                assert get_llm_service() is get_llm_service()
+            MockLLM.assert_called_once_with()
+        finally:
+            set_llm_service(None)
+
+    def test_estimate_tokens(self):
+        from langchain_core.messages import HumanMessage, SystemMessage
+        assert estimate_tokens("x" * 10) == 3
+        assert estimate_tokens([SystemMessage(content="a" * 8), HumanMessage(content="b" * 4)]) == 3
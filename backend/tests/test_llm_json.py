@@ -0,0 +1,124 @@
+"""Tests for decoding, repairing and conforming LLM JSON replies."""
+
+import json
+
+import pytest
+
+from app.services.llm import _empty_crossref, _empty_dossier
+from app.services.llm_json import IncrementalDecoder, conform, decode, is_valid
+
+
+BRIEFING = {
+    "match_intel": "Both are night owls.",
+    "conversation_playbook": ["Ask about films"],
+    "minefield_map": ["Avoid tabs vs spaces"],
+    "venue_cheat_sheet": "Open late.",
+    "vibe_calibration": "Chill",
+}
+
+
+# ── decode ──────────────────────────────────────────────────────
+
+class TestDecode:
+    def test_plain_json(self):
+        assert decode('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_code_fence(self):
+        assert decode('```json\n{"a": 1}\n```') == {"a": 1}
+
+    def test_prose_around_json(self):
+        assert decode('Here you go:\n{"a": 1}\nHope that helps!') == {"a": 1}
+
+    def test_trailing_commas(self):
+        assert decode('{"a": [1, 2,], "b": {"c": 3,},}') == {"a": [1, 2], "b": {"c": 3}}
+
+    def test_truncated_array(self):
+        assert decode('{"tags": ["film", "jazz"') == {"tags": ["film", "jazz"]}
+
+    def test_truncated_string_is_closed(self):
+        assert decode('{"vibe": "Night ow') == {"vibe": "Night ow"}
+
+    def test_dangling_key_is_dropped(self):
+        assert decode('{"a": 1, "b":') == {"a": 1}
+        assert decode('{"a": 1, "b"') == {"a": 1}
+
+    def test_truncated_literal_falls_back_to_last_value(self):
+        assert decode('{"a": [1, tru') == {"a": [1]}
+
+    def test_strings_with_brackets_and_escapes(self):
+        text = '{"a": "x, ] } \\" y", "b": [1'
+        assert decode(text) == {"a": 'x, ] } " y', "b": [1]}
+
+    def test_no_json_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            decode("This is not JSON at all")
+
+
+# ── IncrementalDecoder ──────────────────────────────────────────
+
+class TestIncrementalDecoder:
+    def test_partials_grow_to_final(self):
+        text = json.dumps({"public": {"vibe": "Chill", "tags": ["a", "b", "c"]}, "n": 3})
+        decoder = IncrementalDecoder()
+        partials = [decoder.feed(text[i:i + 7]) for i in range(0, len(text), 7)]
+        assert partials[0] == {}
+        assert partials[-1] == json.loads(text)
+        assert decoder.close() == json.loads(text)
+
+    def test_none_before_json_starts(self):
+        decoder = IncrementalDecoder()
+        assert decoder.feed("```json\n") is None
+        assert decoder.feed('{"a": ') == {}
+
+    def test_close_without_json_raises(self):
+        decoder = IncrementalDecoder()
+        decoder.feed("Sorry, I can't help with that.")
+        with pytest.raises(json.JSONDecodeError):
+            decoder.close()
+
+
+# ── conform ─────────────────────────────────────────────────────
+
+class TestConform:
+    def test_fills_missing_fields_from_defaults(self):
+        dossier = conform({"public": {"vibe": "Chill"}}, "dossier", _empty_dossier())
+        assert dossier["public"] == {"vibe": "Chill", "tags": [], "schedule_pattern": "mixed"}
+        assert dossier["private"]["deep_cuts"] == []
+
+    def test_resets_wrong_types_and_keeps_the_rest(self):
+        dossier = conform(
+            {"public": {"vibe": "Chill", "tags": "film", "schedule_pattern": "noon"}, "private": []},
+            "dossier",
+            _empty_dossier(),
+        )
+        assert dossier["public"] == {"vibe": "Chill", "tags": [], "schedule_pattern": "mixed"}
+        assert dossier["private"] == _empty_dossier()["private"]
+
+    def test_drops_bad_list_items(self):
+        crossref = conform(
+            {"shared": [{"signal": "films"}, "oops", {"signal": "jazz"}], "citations": ["a", 3, "b"]},
+            "crossref",
+            _empty_crossref(),
+        )
+        assert crossref["shared"] == [{"signal": "films"}, {"signal": "jazz"}]
+        assert crossref["citations"] == ["a", "b"]
+
+    def test_drops_the_right_items_past_index_nine(self):
+        tags = [f"t{i}" for i in range(12)]
+        tags[9], tags[10] = 9, None
+        dossier = conform({"public": {"tags": tags}}, "dossier", _empty_dossier())
+        assert dossier["public"]["tags"] == [f"t{i}" for i in range(9)] + ["t11"]
+
+    def test_non_dict_gives_defaults(self):
+        assert conform(["nope"], "crossref", _empty_crossref()) == _empty_crossref()
+
+
+class TestIsValid:
+    def test_complete_briefing(self):
+        assert is_valid(BRIEFING, "coaching")
+
+    def test_missing_key(self):
+        assert not is_valid({k: v for k, v in BRIEFING.items() if k != "minefield_map"}, "coaching")
+
+    def test_wrong_type_is_not_coerced(self):
+        assert not is_valid({**BRIEFING, "conversation_playbook": "Ask about films"}, "coaching")
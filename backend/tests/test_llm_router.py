@@ -0,0 +1,290 @@
+"""Tests for hedged, latency-ranked routing across LLM providers."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from anthropic.resources.messages.messages import DEPRECATED_MODELS
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+from app.config import Settings
+from app.services.cache import MemoryBackend
+from app.services.dossier_store import DossierStore
+from app.services.llm import LLMService
+from app.services.llm_governor import LLMGovernor
+from app.services.llm_router import ANTHROPIC, GEMINI, ProviderRouter, build_router, resolve_tier
+from app.services.metrics import metrics
+from app.services.pair_cache import PairCache
+
+MESSAGES = [HumanMessage(content="hi")]
+
+
+class FakeChat:
+    """A local chat model that answers after ``delay`` seconds, or raises."""
+
+    def __init__(self, reply: str, delay: float = 0.0, error: Exception | None = None) -> None:
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return AIMessage(content=self.reply)
+
+    async def astream(self, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        for part in self.reply.split():
+            yield AIMessageChunk(content=part)
+
+
+def _router(primary: FakeChat, secondary: FakeChat, hedge_delay: float = 0.05) -> ProviderRouter:
+    return ProviderRouter({GEMINI: primary, ANTHROPIC: secondary}, hedge_delay=hedge_delay)
+
+
+# ── unit: hedging ─────────────────────────────────────────────────
+
+class TestHedging:
+    async def test_fast_primary_is_not_hedged(self):
+        primary, secondary = FakeChat("gemini", 0.01), FakeChat("anthropic")
+        response = await _router(primary, secondary).ainvoke(MESSAGES)
+        assert response.content == "gemini"
+        assert secondary.calls == 0
+
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        primary, secondary = FakeChat("gemini", 1.0), FakeChat("anthropic", 0.01)
+        before = metrics.counter("llm.router.hedged", provider=ANTHROPIC)
+        start = time.perf_counter()
+        response = await _router(primary, secondary).ainvoke(MESSAGES)
+        assert response.content == "anthropic"
+        assert time.perf_counter() - start < 0.5
+        assert primary.cancelled == 1
+        assert metrics.counter("llm.router.hedged", provider=ANTHROPIC) == before + 1
+
+    async def test_primary_can_still_win_after_hedge(self):
+        primary, secondary = FakeChat("gemini", 0.08), FakeChat("anthropic", 1.0)
+        response = await _router(primary, secondary).ainvoke(MESSAGES)
+        assert response.content == "gemini"
+        assert secondary.calls == 1
+        assert secondary.cancelled == 1
+
+    async def test_zero_delay_disables_hedging(self):
+        primary, secondary = FakeChat("gemini", 0.1), FakeChat("anthropic")
+        response = await _router(primary, secondary, hedge_delay=0).ainvoke(MESSAGES)
+        assert response.content == "gemini"
+        assert secondary.calls == 0
+
+    async def test_waits_for_primary_p95_once_measured(self):
+        primary, secondary = FakeChat("gemini", 0.1), FakeChat("anthropic")
+        router = _router(primary, secondary, hedge_delay=0.01)
+        for _ in range(20):
+            router.stats[GEMINI].success(0.3)
+            router.stats[ANTHROPIC].success(0.5)
+        assert router.hedge_after(GEMINI) == 0.3
+        response = await router.ainvoke(MESSAGES)
+        assert response.content == "gemini"
+        assert secondary.calls == 0
+
+    def test_hedge_delay_until_enough_samples(self):
+        router = _router(FakeChat("a"), FakeChat("b"), hedge_delay=2.0)
+        for _ in range(5):
+            router.stats[GEMINI].success(0.3)
+        assert router.hedge_after(GEMINI) == 2.0
+        assert _router(FakeChat("a"), FakeChat("b"), hedge_delay=0).hedge_after(GEMINI) == 0
+
+    async def test_names_cancelled_calls_on_the_response(self):
+        primary, secondary = FakeChat("gemini", 1.0), FakeChat("anthropic", 0.01)
+        response = await _router(primary, secondary).ainvoke(MESSAGES)
+        assert response.response_metadata["router"] == {"provider": ANTHROPIC, "cancelled": [GEMINI]}
+
+    async def test_caller_cancellation_cancels_both(self):
+        primary, secondary = FakeChat("gemini", 1.0), FakeChat("anthropic", 1.0)
+        task = asyncio.create_task(_router(primary, secondary, hedge_delay=0.01).ainvoke(MESSAGES))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert primary.cancelled == secondary.cancelled == 1
+
+
+# ── unit: failover ────────────────────────────────────────────────
+
+class TestFailover:
+    async def test_error_fails_over_without_waiting_for_hedge(self):
+        primary = FakeChat("gemini", error=RuntimeError("503"))
+        secondary = FakeChat("anthropic", 0.01)
+        start = time.perf_counter()
+        response = await _router(primary, secondary, hedge_delay=1.0).ainvoke(MESSAGES)
+        assert response.content == "anthropic"
+        assert time.perf_counter() - start < 0.5
+
+    async def test_all_failing_raises_last_error(self):
+        router = _router(FakeChat("a", error=RuntimeError("first")), FakeChat("b", error=ValueError("second")))
+        with pytest.raises(ValueError, match="second"):
+            await router.ainvoke(MESSAGES)
+
+    async def test_single_provider_error_propagates(self):
+        router = ProviderRouter({GEMINI: FakeChat("a", error=RuntimeError("down"))}, hedge_delay=0.01)
+        with pytest.raises(RuntimeError):
+            await router.ainvoke(MESSAGES)
+
+    async def test_stream_fails_over_before_first_chunk(self):
+        router = _router(FakeChat("a", error=RuntimeError("down")), FakeChat("hello there"))
+        chunks = [c.content async for c in router.astream(MESSAGES)]
+        assert chunks == ["hello", "there"]
+
+
+# ── unit: ranking ─────────────────────────────────────────────────
+
+class TestRanking:
+    def test_configured_order_until_measured(self):
+        router = _router(FakeChat("a"), FakeChat("b"))
+        assert router.ranked() == [GEMINI, ANTHROPIC]
+
+    async def test_provider_that_keeps_losing_drops_down(self):
+        primary, secondary = FakeChat("gemini", 0.3), FakeChat("anthropic", 0.01)
+        router = _router(primary, secondary, hedge_delay=0.02)
+        await router.ainvoke(MESSAGES)
+        assert router.ranked() == [ANTHROPIC, GEMINI]
+        # Now anthropic goes first and answers before the hedge fires
+        await router.ainvoke(MESSAGES)
+        assert primary.calls == 1
+
+    async def test_errors_push_a_provider_down(self):
+        router = _router(FakeChat("a", error=RuntimeError("down")), FakeChat("b", 0.01))
+        await router.ainvoke(MESSAGES)
+        assert router.stats[GEMINI].error_rate > 0
+        assert router.ranked() == [ANTHROPIC, GEMINI]
+
+
+# ── unit: build_router ───────────────────────────────────────────
+
+def test_default_anthropic_models_are_current():
+    # The SDK warns on these and the API rejects them once retired
+    tiers = Settings.model_fields["llm_tiers"].default
+    models = [Settings.model_fields["llm_anthropic_model"].default]
+    models += [tier[ANTHROPIC] for tier in tiers.values() if ANTHROPIC in tier]
+    for model in models:
+        assert model not in DEPRECATED_MODELS
+        assert "3-5" not in model
+
+
+class TestBuildRouter:
+    def test_skips_providers_without_key(self):
+        with patch("app.services.llm_router.settings") as s:
+            s.gemini_api_key, s.anthropic_api_key = "g", ""
+            s.llm_providers = [GEMINI, ANTHROPIC]
+            s.llm_hedge_delay_ms = 500
+            router = build_router(models={GEMINI: "gemini-2.0-flash", ANTHROPIC: "claude-haiku-4-5"})
+        assert router.providers == [GEMINI]
+        assert router.hedge_delay == 0.5
+
+    def test_both_providers_in_configured_order(self):
+        with patch("app.services.llm_router.settings") as s:
+            s.gemini_api_key, s.anthropic_api_key = "g", "a"
+            s.llm_providers = [ANTHROPIC, GEMINI]
+            s.llm_hedge_delay_ms = 0
+            router = build_router(models={GEMINI: "gemini-2.0-flash", ANTHROPIC: "claude-haiku-4-5"})
+        assert router.providers == [ANTHROPIC, GEMINI]
+
+
+# ── unit: tiers ──────────────────────────────────────────────────
+
+TIERS = {
+    "strong": {"temperature": 0.7, "max_output_tokens": 4096},
+    "fast": {"gemini": "gemini-2.0-flash-lite", "temperature": 0.2, "max_output_tokens": 512},
+}
+
+
+def _tier_settings(s):
+    s.llm_tiers = TIERS
+    s.llm_method_tiers = {"profile_analysis": "strong", "brainstorm_venue_queries": "fast", "coach_chat": "fast"}
+    s.llm_default_tier = "strong"
+    s.llm_model, s.llm_anthropic_model = "gemini-2.0-flash", "claude-haiku-4-5"
+
+
+class TestResolveTier:
+    def test_method_mapping_and_fallback_models(self):
+        with patch("app.services.llm_router.settings") as s:
+            _tier_settings(s)
+            fast = resolve_tier("brainstorm_venue_queries")
+            strong = resolve_tier("profile_analysis")
+        assert fast.name == "fast"
+        assert fast.models == {GEMINI: "gemini-2.0-flash-lite", ANTHROPIC: "claude-haiku-4-5"}
+        assert (fast.temperature, fast.max_output_tokens) == (0.2, 512)
+        assert strong.models[GEMINI] == "gemini-2.0-flash"
+        assert strong.key != fast.key
+
+    def test_unlisted_method_uses_default_tier(self):
+        with patch("app.services.llm_router.settings") as s:
+            _tier_settings(s)
+            assert resolve_tier("rank_venues").name == "strong"
+
+    def test_unknown_tier_raises(self):
+        with patch("app.services.llm_router.settings") as s:
+            _tier_settings(s)
+            s.llm_method_tiers = {"coach_chat": "tiny"}
+            with pytest.raises(ValueError, match="tiny"):
+                resolve_tier("coach_chat")
+
+
+class TestClientForTier:
+    def _service(self, clients=None):
+        return LLMService(
+            governor=LLMGovernor(max_concurrency=4),
+            dossiers=DossierStore(MemoryBackend()),
+            pairs=PairCache(MemoryBackend()),
+            clients=clients,
+        )
+
+    async def test_one_router_per_tier(self):
+        svc = self._service()
+        routers = {"fast": FakeChat("fast"), "strong": FakeChat("strong")}
+        with patch("app.services.llm_router.settings") as s, \
+             patch("app.services.llm.build_router", side_effect=lambda t, m, models: routers[
+                 "fast" if models[GEMINI].endswith("lite") else "strong"
+             ]) as build:
+            _tier_settings(s)
+            fast = await svc._invoke(MESSAGES, method="brainstorm_venue_queries")
+            chat = await svc._invoke(MESSAGES, method="coach_chat")
+            strong = await svc._invoke(MESSAGES, method="profile_analysis")
+        assert (fast.content, chat.content, strong.content) == ("fast", "fast", "strong")
+        assert build.call_count == 2
+        assert build.call_args_list[0].args[:2] == (0.2, 512)
+
+    async def test_injected_clients_are_used_as_is(self):
+        svc = self._service(clients={"fast": FakeChat("injected")})
+        with patch("app.services.llm.build_router") as build:
+            response = await svc._invoke(MESSAGES, method="coach_chat")
+        assert response.content == "injected"
+        build.assert_not_called()
+
+    async def test_records_tier_metrics(self):
+        svc = self._service()
+        before = metrics.counter("llm.tier.calls", tier="fast", method="coach_chat")
+        with patch("app.services.llm_router.settings") as s, \
+             patch("app.services.llm.build_router", return_value=FakeChat("hi")):
+            _tier_settings(s)
+            await svc._invoke(MESSAGES, method="coach_chat")
+        assert metrics.counter("llm.tier.calls", tier="fast", method="coach_chat") == before + 1
+        assert metrics.counter("llm.tier.tokens", tier="fast") > 0
+
+    async def test_cancelled_hedges_are_charged_to_the_governor(self):
+        router = _router(FakeChat("gemini", 1.0), FakeChat("anthropic", 0.01), hedge_delay=0.02)
+        svc = self._service(clients={"strong": router})
+        await svc._invoke(MESSAGES, method="profile_analysis")
+        estimate = svc._estimate(MESSAGES, "profile_analysis")
+        # Winner reported no usage, so it is charged the estimate too
+        assert svc._governor.window_tokens == 2 * estimate
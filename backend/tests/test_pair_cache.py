@@ -0,0 +1,166 @@
+"""Tests for the pair-level crossref/venue/coaching cache."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.nodes.venue import venue_node
+from app.services.cache import MemoryBackend
+from app.services.pair_cache import PairCache, rename, set_pair_cache
+from app.services.pair_context import build_pair_context, with_crossref
+from tests.llm_stub import make_llm_service
+
+DOSSIER_A = {"public": {"vibe": "Builder", "tags": ["python"]}, "private": {"summary": "Codes at night"}}
+DOSSIER_B = {"public": {"vibe": "Cinephile", "tags": ["film"]}, "private": {"summary": "Watches Kubrick"}}
+
+CROSSREF = {
+    "shared": [{"signal": "night owls", "detail": "Ada and Grace are both up late", "source": "both"}],
+    "complementary": [{"signal": "code vs film", "detail": "Ada builds, Grace critiques", "source": "both"}],
+    "tension_points": [],
+    "citations": ["Ada: 3am commits", "Grace: Kubrick marathon", "Adams is not a name here"],
+    "venue_appropriate": True,
+}
+
+
+def _service(pairs, content):
+    svc, llm = make_llm_service(pairs=pairs)
+    llm.ainvoke.return_value = MagicMock(content=json.dumps(content))
+    return svc, llm
+
+
+# ── unit: keys and renaming ───────────────────────────────────────
+
+class TestPairKey:
+    def test_order_independent(self):
+        assert PairCache.key("crossref", "aa", "bb", "v1") == PairCache.key("crossref", "bb", "aa", "v1")
+
+    def test_parts_distinguish(self):
+        assert PairCache.key("venues", "aa", "bb", "nyc") != PairCache.key("venues", "aa", "bb", "sf")
+
+    def test_rename_swaps_simultaneously_on_word_boundaries(self):
+        value = {"x": ["Ada met Grace", "Adams"], "n": 3}
+        assert rename(value, {"Ada": "Grace", "Grace": "Ada"}) == {"x": ["Grace met Ada", "Adams"], "n": 3}
+
+    def test_rename_noop(self):
+        value = {"x": "Ada"}
+        assert rename(value, {"Ada": "Ada"}) is value
+
+
+# ── unit: crossref ────────────────────────────────────────────────
+
+class TestCrossrefCache:
+    async def test_swapped_request_reuses_with_names_swapped(self):
+        svc, llm = _service(PairCache(MemoryBackend()), CROSSREF)
+        first, venue = await svc.cross_reference(DOSSIER_A, DOSSIER_B, "Ada", "Grace")
+        second, venue_again = await svc.cross_reference(DOSSIER_B, DOSSIER_A, "Grace", "Ada")
+        llm.ainvoke.assert_awaited_once()
+        assert second == first
+        assert venue is venue_again is True
+
+    async def test_default_names_follow_the_dossiers(self):
+        crossref = {**CROSSREF, "shared": [{"signal": "s", "detail": "Person A codes, Person B films", "source": "both"}]}
+        svc, llm = _service(PairCache(MemoryBackend()), crossref)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        swapped, _ = await svc.cross_reference(DOSSIER_B, DOSSIER_A)
+        llm.ainvoke.assert_awaited_once()
+        assert swapped["shared"][0]["detail"] == "Person B codes, Person A films"
+
+    async def test_renamed_request_substitutes_names(self):
+        svc, llm = _service(PairCache(MemoryBackend()), CROSSREF)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B, "Ada", "Grace")
+        result, _ = await svc.cross_reference(DOSSIER_A, DOSSIER_B, "Alice", "Grace")
+        assert result["citations"][0] == "Alice: 3am commits"
+        assert result["citations"][2] == "Adams is not a name here"
+
+    async def test_context_labels_are_swapped_back(self):
+        # The reply names people by the context's labels; a swapped pipeline run must see them swapped
+        detail = "Person A codes, Person B films"
+        crossref = {**CROSSREF, "shared": [{"signal": "s", "detail": detail, "source": "both"}]}
+        svc, llm = _service(PairCache(MemoryBackend()), crossref)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B, context=build_pair_context(DOSSIER_A, DOSSIER_B))
+        sent = json.loads(llm.ainvoke.await_args.args[0][1].content)
+        assert list(sent["people"]) == ["Person A", "Person B"]
+        swapped, _ = await svc.cross_reference(DOSSIER_B, DOSSIER_A, context=build_pair_context(DOSSIER_B, DOSSIER_A))
+        llm.ainvoke.assert_awaited_once()
+        assert swapped["shared"][0]["detail"] == "Person B codes, Person A films"
+
+    async def test_context_and_dossier_results_kept_apart(self):
+        svc, llm = _service(PairCache(MemoryBackend()), CROSSREF)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B, context=build_pair_context(DOSSIER_A, DOSSIER_B))
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B, context=build_pair_context(DOSSIER_A, DOSSIER_B))
+        assert llm.ainvoke.await_count == 2
+        with patch("app.services.pair_context.PAIR_CONTEXT_VERSION", "next"):
+            await svc.cross_reference(DOSSIER_A, DOSSIER_B, context=build_pair_context(DOSSIER_A, DOSSIER_B))
+        assert llm.ainvoke.await_count == 3
+
+    async def test_changed_dossier_misses(self):
+        svc, llm = _service(PairCache(MemoryBackend()), CROSSREF)
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B, "Ada", "Grace")
+        changed = {**DOSSIER_B, "public": {**DOSSIER_B["public"], "tags": ["film", "jazz"]}}
+        await svc.cross_reference(DOSSIER_A, changed, "Ada", "Grace")
+        assert llm.ainvoke.await_count == 2
+
+
+# ── unit: coaching ────────────────────────────────────────────────
+
+class TestCoachingCache:
+    async def test_cached_per_target(self):
+        svc, llm = _service(PairCache(MemoryBackend()), {"match_intel": "good"})
+        venue = {"name": "Film Forum"}
+        await svc.generate_coaching(DOSSIER_A, DOSSIER_B, CROSSREF, venue)
+        await svc.generate_coaching(DOSSIER_A, DOSSIER_B, CROSSREF, venue)
+        assert llm.ainvoke.await_count == 1
+        await svc.generate_coaching(DOSSIER_B, DOSSIER_A, CROSSREF, venue)
+        await svc.generate_coaching(DOSSIER_A, DOSSIER_B, CROSSREF, {"name": "Other"})
+        assert llm.ainvoke.await_count == 3
+
+    async def test_empty_briefing_not_stored(self):
+        svc, llm = _service(PairCache(MemoryBackend()), {})
+        llm.ainvoke.return_value = MagicMock(content="not json")
+        await svc.generate_coaching(DOSSIER_A, DOSSIER_B, CROSSREF, None)
+        await svc.generate_coaching(DOSSIER_A, DOSSIER_B, CROSSREF, None)
+        assert llm.ainvoke.await_count == 2
+
+
+# ── unit: venue_node ──────────────────────────────────────────────
+
+class TestVenueCache:
+    async def test_venues_cached_per_pair_and_location(self):
+        set_pair_cache(PairCache(MemoryBackend()))
+
+        def state(a, b, location):
+            return {"cross_ref": {}, "user_a": {"dossier": a}, "user_b": {"dossier": b, "location": location}}
+
+        with patch("app.graph.nodes.venue.get_llm_service") as MockLLM, \
+             patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+            MockLLM.return_value.brainstorm_venue_queries = AsyncMock(return_value=[{"search_query": "jazz"}])
+            MockLLM.return_value.rank_venues = AsyncMock(return_value=[{"name": "Blue Note"}])
+            MockPlaces.return_value.search_venue = AsyncMock(return_value=[{"name": "Blue Note"}])
+            first = await venue_node(state(DOSSIER_A, DOSSIER_B, "New York"))
+            second = await venue_node(state(DOSSIER_B, DOSSIER_A, "new york!"))
+            await venue_node(state(DOSSIER_A, DOSSIER_B, "Chicago"))
+
+        assert first == second == {"venues": [{"name": "Blue Note"}]}
+        assert MockLLM.return_value.rank_venues.await_count == 2
+
+    async def test_new_crossref_or_swapped_view_misses(self):
+        set_pair_cache(PairCache(MemoryBackend()))
+        night = {**DOSSIER_A, "public": {**DOSSIER_A["public"], "schedule_pattern": "night_owl"}}
+
+        def state(a, b, cross_ref):
+            context = with_crossref(build_pair_context(a, b), cross_ref)
+            return {"cross_ref": cross_ref, "pair_context": context, "user_a": {"dossier": a}, "user_b": {"dossier": b}}
+
+        with patch("app.graph.nodes.venue.get_llm_service") as MockLLM, \
+             patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+            MockLLM.return_value.brainstorm_venue_queries = AsyncMock(return_value=[{"search_query": "jazz"}])
+            MockLLM.return_value.rank_venues = AsyncMock(return_value=[{"name": "Blue Note"}])
+            MockPlaces.return_value.search_venue = AsyncMock(return_value=[{"name": "Blue Note"}])
+            await venue_node(state(night, DOSSIER_B, CROSSREF))
+            await venue_node(state(night, DOSSIER_B, CROSSREF))
+            assert MockLLM.return_value.rank_venues.await_count == 1
+            # "Person A" is now the other person, so reasons naming Person A would be wrong
+            await venue_node(state(DOSSIER_B, night, CROSSREF))
+            assert MockLLM.return_value.rank_venues.await_count == 2
+            await venue_node(state(night, DOSSIER_B, {**CROSSREF, "shared": []}))
+            assert MockLLM.return_value.rank_venues.await_count == 3
@@ -0,0 +1,137 @@
+"""Tests for the compact pair context shared by crossref, venue and coach."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph.nodes.coach import coach_node
+from app.graph.nodes.crossref import crossref_node
+from app.graph.nodes.venue import venue_node
+from app.services.metrics import metrics
+from app.services.pair_context import (
+    build_pair_context,
+    coaching_view,
+    crossref_view,
+    venue_view,
+    with_crossref,
+)
+from app.services.tokens import estimate_tokens
+from tests.llm_stub import make_llm_service
+
+DOSSIER_A = {
+    "public": {"vibe": "Night-owl builder", "tags": ["web dev", "Sci-Fi Films", "hip hop"], "schedule_pattern": "night_owl"},
+    "private": {
+        "summary": "Ships side projects at 3am.",
+        "traits": ["deep-focus builder"],
+        "interests": ["Python", "Interstellar", "sci-fi films"],
+        "deep_cuts": ["Keeps a bug diary"],
+    },
+    "data_sources": ["github", "letterboxd"],
+}
+DOSSIER_B = {
+    "public": {"vibe": "Cinephile", "tags": ["sci-fi films", "jazz"], "schedule_pattern": "night_owl"},
+    "private": {
+        "summary": "Logs every film.",
+        "traits": ["curious"],
+        "interests": ["Interstellar", "Kubrick"],
+        "deep_cuts": ["Owns a 16mm camera"],
+    },
+    "data_sources": ["letterboxd"],
+}
+CROSSREF = {
+    "shared": [{"signal": "sci-fi", "detail": "Both love Interstellar", "source": "letterboxd"}],
+    "complementary": [{"signal": "code vs film", "detail": "builder meets critic", "source": "both"}],
+    "tension_points": [{"signal": "pace", "detail": "binge vs savour", "source": "letterboxd"}],
+    "citations": ["A: Interstellar 5★", "B: Interstellar 4.5★", "both night owls"],
+}
+
+
+# ── unit: building and views ──────────────────────────────────────
+
+class TestPairContext:
+    def test_shared_values_listed_once(self):
+        context = build_pair_context(DOSSIER_A, DOSSIER_B)
+        assert context["shared"] == ["Interstellar", "sci-fi films"]
+        assert context["people"]["Person A"]["interests"] == ["Python", "web dev", "hip hop"]
+        assert context["people"]["Person B"]["interests"] == ["Kubrick", "jazz"]
+        assert context["people"]["Person A"]["sources"] == ["github", "letterboxd"]
+
+    def test_names_label_people(self):
+        context = build_pair_context(DOSSIER_A, DOSSIER_B, "Ada", "Grace")
+        assert list(context["people"]) == ["Ada", "Grace"]
+
+    def test_views_keep_only_what_each_prompt_uses(self):
+        context = with_crossref(build_pair_context(DOSSIER_A, DOSSIER_B), CROSSREF)
+        venue = venue_view(context)
+        assert venue["schedules"] == {"Person A": "night_owl", "Person B": "night_owl"}
+        assert venue["shared"] == ["sci-fi"]
+        assert "Ships side projects" not in json.dumps(venue)
+
+        coaching = coaching_view(context, target="Person B")
+        assert coaching["target"] == "Person B"
+        assert coaching["crossref"]["tension_points"] == [{"signal": "pace", "detail": "binge vs savour"}]
+        assert "citations" not in json.dumps(coaching)
+        assert "sources" not in coaching["people"]["Person A"]
+
+        assert "crossref" not in crossref_view(context)
+
+    def test_smaller_than_the_dossiers(self):
+        context = with_crossref(build_pair_context(DOSSIER_A, DOSSIER_B), CROSSREF)
+        before = estimate_tokens(json.dumps({"a": DOSSIER_A, "b": DOSSIER_B, "cross_ref": CROSSREF}, indent=2))
+        assert estimate_tokens(json.dumps(coaching_view(context, "Person A"))) < before * 0.6
+        assert estimate_tokens(json.dumps(venue_view(context))) < before * 0.2
+
+
+# ── unit: nodes ───────────────────────────────────────────────────
+
+class TestNodes:
+    async def test_crossref_node_builds_and_stores_context(self):
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
+            MockLLM.return_value.cross_reference = AsyncMock(return_value=(CROSSREF, True))
+            result = await crossref_node({"user_a": {"dossier": DOSSIER_A}, "user_b": {"dossier": DOSSIER_B}})
+
+        sent = MockLLM.return_value.cross_reference.await_args.kwargs["context"]
+        assert sent == build_pair_context(DOSSIER_A, DOSSIER_B)
+        assert result["pair_context"]["crossref"]["shared"] == [{"signal": "sci-fi", "detail": "Both love Interstellar"}]
+
+    async def test_venue_and_coach_nodes_reuse_it(self):
+        context = with_crossref(build_pair_context(DOSSIER_A, DOSSIER_B), CROSSREF)
+        state = {
+            "user_a": {"dossier": DOSSIER_A},
+            "user_b": {"dossier": DOSSIER_B},
+            "cross_ref": CROSSREF,
+            "pair_context": context,
+        }
+        with patch("app.graph.nodes.venue.get_llm_service") as VenueLLM, \
+             patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+            VenueLLM.return_value.brainstorm_venue_queries = AsyncMock(return_value=[{"search_query": "cinema"}])
+            VenueLLM.return_value.rank_venues = AsyncMock(return_value=[{"name": "IFC"}])
+            MockPlaces.return_value.search_venue = AsyncMock(return_value=[{"name": "IFC"}])
+            await venue_node(state)
+        assert VenueLLM.return_value.brainstorm_venue_queries.await_args.args[0] == venue_view(context)
+        assert VenueLLM.return_value.rank_venues.await_args.args[1] == venue_view(context)
+
+        with patch("app.graph.nodes.coach.get_llm_service") as CoachLLM, \
+             patch("app.graph.nodes.coach.settings.coaching_mode", "parallel"):
+            CoachLLM.return_value.generate_coaching = AsyncMock(return_value={})
+            await coach_node(state)
+        targets = [c.kwargs["context"]["target"] for c in CoachLLM.return_value.generate_coaching.await_args_list]
+        assert targets == ["Person A", "Person B"]
+
+
+# ── unit: LLMService payloads and metrics ─────────────────────────
+
+class TestPayloads:
+    async def test_context_replaces_dossiers_and_is_counted(self):
+        svc, llm = make_llm_service()
+        llm.ainvoke.return_value = MagicMock(content=json.dumps(CROSSREF))
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B)
+        full = llm.ainvoke.await_args.args[0][1].content
+
+        llm.ainvoke.return_value = MagicMock(content=json.dumps(CROSSREF))
+        before = metrics.counter("llm.input_tokens", method="cross_reference")
+        await svc.cross_reference(DOSSIER_A, DOSSIER_B, context=build_pair_context(DOSSIER_A, DOSSIER_B))
+        compact = llm.ainvoke.await_args.args[0][1].content
+
+        assert json.loads(compact) == crossref_view(build_pair_context(DOSSIER_A, DOSSIER_B))
+        assert len(compact) < len(full)
+        assert metrics.counter("llm.input_tokens", method="cross_reference") > before
@@ -62,7 +62,7 @@ FAKE_LINKEDIN_DATA = {
 
 FAKE_INSTAGRAM_DATA = {
     "bio": "Photographer | NYC\narchdigest.com",
-    "screenshot_b64": "iVBORw0KGgo=",  # tiny fake b64
+    "screenshot_ref": "",
     "login_wall": False,
 }
 
@@ -176,7 +176,7 @@ class TestConnectorExtraction:
         })
         assert result["bio"] == "Test bio"
         assert result["login_wall"] is False
-        assert len(result["screenshot_b64"]) > 0
+        assert result["screenshot_ref"] == ""
 
 
 # ── Step 2: build UserDataBundle from fake connector outputs ─────
@@ -223,7 +223,7 @@ class TestAnalyzeNodeWithFakeData:
         )
         state = _build_pipeline_state(bundle_a, bundle_b)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
 
@@ -241,7 +241,7 @@ class TestAnalyzeNodeWithFakeData:
         bundle = _build_bundle(github=FAKE_GITHUB_DATA)
         state = _build_pipeline_state(bundle, bundle)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
 
@@ -270,7 +270,7 @@ class TestCrossrefNodeWithFakeData:
         # cross_reference returns (result_dict, venue_appropriate_bool)
         fake_crossref_no_venue = {k: v for k, v in FAKE_CROSSREF.items() if k != "venue_appropriate"}
 
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.cross_reference = AsyncMock(
                 return_value=(fake_crossref_no_venue, True)
@@ -383,7 +383,7 @@ class TestFullPipelineFakeData:
         # Step 3: Analyze
         state = _build_pipeline_state(bundle_a, bundle_b)
 
-        with patch("app.graph.nodes.analyze.LLMService") as MockLLM:
+        with patch("app.graph.nodes.analyze.get_llm_service") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.profile_analysis = AsyncMock(return_value=FAKE_DOSSIER)
             analyzed = await analyze_node(state)
@@ -406,7 +406,7 @@ class TestFullPipelineFakeData:
             "citations": ["Both code late at night"],
         }
 
-        with patch("app.graph.nodes.crossref.LLMService") as MockLLM:
+        with patch("app.graph.nodes.crossref.get_llm_service") as MockLLM:
             mock_instance = MockLLM.return_value
             mock_instance.cross_reference = AsyncMock(
                 return_value=(fake_crossref_result, True)
@@ -440,13 +440,13 @@ class TestFullPipelineIntegration:
             github=gh_a,
             letterboxd=lb_a,
             linkedin={"name": "", "headline": "", "about": "", "login_wall": False},
-            instagram={"bio": "", "screenshot_b64": "", "login_wall": False},
+            instagram={"bio": "", "screenshot_ref": "", "login_wall": False},
         )
         bundle_b = _build_bundle(
             github=gh_b,
             letterboxd=lb_b,
             linkedin={"name": "", "headline": "", "about": "", "login_wall": False},
-            instagram={"bio": "", "screenshot_b64": "", "login_wall": False},
+            instagram={"bio": "", "screenshot_ref": "", "login_wall": False},
         )
 
         _validate_bundle_shape(bundle_a)
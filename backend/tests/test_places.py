@@ -0,0 +1,116 @@
+"""Tests for Places lookups: caching, location bucketing and venue_node fan-out."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.graph.nodes.venue import venue_node
+from app.services import places as places_module
+from app.services.cache import MemoryBackend
+from app.services.places import PlacesService, geohash, location_bucket
+
+
+@pytest.fixture(autouse=True)
+def _api_key(monkeypatch):
+    monkeypatch.setattr(places_module.settings, "google_maps_api_key", "test-key")
+
+
+def _places_server():
+    seen = []
+
+    def handler(request):
+        query = json.loads(request.content)["textQuery"]
+        seen.append(query)
+        return httpx.Response(200, json={"places": [
+            {"displayName": {"text": f"Spot for {query}"}, "formattedAddress": "1 Main St", "rating": 4.4},
+        ]})
+
+    return handler, seen
+
+
+async def _search(handler, cache, query, location=None):
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await PlacesService(client=client, cache=cache).search_venue(query, location=location)
+
+
+# ── unit: location buckets ────────────────────────────────────────
+
+class TestLocationBucket:
+    def test_known_geohash(self):
+        assert geohash(57.64911, 10.40744, precision=11) == "u4pruydqqvj"
+
+    def test_nearby_coordinates_share_a_bucket(self):
+        assert location_bucket("40.7411,-73.9897") == location_bucket("40.7420, -73.9880")
+
+    def test_distant_coordinates_differ(self):
+        assert location_bucket("40.7411,-73.9897") != location_bucket("34.0522,-118.2437")
+
+    def test_place_names_are_normalized(self):
+        assert location_bucket("  Brooklyn,  NY ") == location_bucket("brooklyn ny")
+
+    def test_no_location(self):
+        assert location_bucket(None) == "-"
+
+
+# ── unit: search_venue caching ────────────────────────────────────
+
+class TestSearchCache:
+    async def test_repeat_query_served_from_cache(self):
+        cache = MemoryBackend()
+        handler, seen = _places_server()
+        first = await _search(handler, cache, "Jazz bar", "Brooklyn, NY")
+        second = await _search(handler, cache, "  jazz BAR ", "brooklyn ny")
+        assert first == second
+        assert len(seen) == 1
+
+    async def test_different_area_is_a_miss(self):
+        cache = MemoryBackend()
+        handler, seen = _places_server()
+        await _search(handler, cache, "jazz bar", "Brooklyn")
+        await _search(handler, cache, "jazz bar", "Oakland")
+        assert len(seen) == 2
+
+    async def test_errors_not_cached(self):
+        cache = MemoryBackend()
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, text="boom")
+
+        assert await _search(handler, cache, "jazz bar") == []
+        assert await _search(handler, cache, "jazz bar") == []
+        assert len(calls) == 2
+
+
+# ── unit: venue_node fan-out ──────────────────────────────────────
+
+class TestVenueNodeConcurrency:
+    async def test_searches_run_concurrently_and_keep_order(self, monkeypatch):
+        monkeypatch.setattr("app.graph.nodes.venue.settings.places_max_concurrency", 2)
+        in_flight = peak = 0
+
+        async def search_venue(query, location=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"name": f"{query} {i}"} for i in range(7)]
+
+        queries = [{"search_query": "a"}, {"name": "b"}, {"search_query": "c"}, {}]
+        with patch("app.graph.nodes.venue.get_llm_service") as MockLLM, \
+             patch("app.graph.nodes.venue.PlacesService") as MockPlaces:
+            MockLLM.return_value.brainstorm_venue_queries = AsyncMock(return_value=queries)
+            MockLLM.return_value.rank_venues = AsyncMock(return_value=[{"name": "a 0"}])
+            MockPlaces.return_value.search_venue = search_venue
+            result = await venue_node({"cross_ref": {}, "user_a": {"location": "NYC"}})
+
+        candidates = MockLLM.return_value.rank_venues.await_args.args[0]
+        assert [c["name"] for c in candidates] == [f"{q} {i}" for q in "abc" for i in range(5)]
+        assert peak == 2
+        assert result == {"venues": [{"name": "a 0"}]}
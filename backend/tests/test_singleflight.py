@@ -0,0 +1,96 @@
+"""Tests for single-flight deduplication."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.graph.nodes.ingest import _fetch_user_data
+from app.services.singleflight import SingleFlight
+
+
+def _counting(result="ok", delay=0.02, error=None):
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    return fn, calls
+
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight("test")
+        fn, calls = _counting()
+        results = await asyncio.gather(*(flight.do("k", fn) for _ in range(5)))
+        assert results == ["ok"] * 5
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight("test")
+        fn, calls = _counting()
+        await asyncio.gather(flight.do("a", fn), flight.do("b", fn))
+        assert len(calls) == 2
+
+    async def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight("test")
+        fn, calls = _counting()
+        await flight.do("k", fn)
+        await flight.do("k", fn)
+        assert len(calls) == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight("test")
+        fn, calls = _counting(delay=0.05)
+        quitter = asyncio.create_task(flight.do("k", fn))
+        stayer = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0.01)
+        quitter.cancel()
+        assert await stayer == "ok"
+        assert quitter.cancelled()
+        assert len(calls) == 1
+
+    async def test_runs_to_completion_when_every_caller_leaves(self):
+        flight = SingleFlight("test")
+        done = asyncio.Event()
+
+        async def fn():
+            await asyncio.sleep(0.02)
+            done.set()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(flight.do("k", fn), 0.001)
+        await asyncio.wait_for(done.wait(), 1)
+
+    async def test_errors_reach_every_caller(self):
+        flight = SingleFlight("test")
+        fn, calls = _counting(error=RuntimeError("boom"))
+        results = await asyncio.gather(flight.do("k", fn), flight.do("k", fn), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(calls) == 1
+
+
+class TestIngestDeduplication:
+    async def test_concurrent_requests_for_same_account_fetch_once(self):
+        calls = []
+
+        class SlowGitHub:
+            async def fetch(self, identifier):
+                calls.append(identifier)
+                await asyncio.sleep(0.02)
+                return {"repos": [{"name": "x"}]}
+
+        with patch.dict("app.graph.nodes.ingest.CONNECTOR_MAP", {"github": SlowGitHub}, clear=True):
+            bundles = await asyncio.gather(
+                _fetch_user_data({"github": "popular"}),
+                _fetch_user_data({"github": "Popular"}),
+                _fetch_user_data({"github": "@popular"}),
+            )
+
+        assert len(calls) == 1
+        assert all(b == {"github": {"repos": [{"name": "x"}]}} for b in bundles)
@@ -201,6 +201,28 @@ class TestFetchWithFakeHTTP:
         assert result["top_tracks"][0]["name"] == "Nights"
         assert result["listening_hours"] == [22, 23, 1, 14]
 
+    @pytest.mark.asyncio
+    async def test_fetch_with_injected_client(self):
+        """fetch() uses the injected client and sends the token on every request."""
+        seen_auth = []
+        inner = _mock_handler(
+            artists=FAKE_TOP_ARTISTS,
+            tracks=FAKE_TOP_TRACKS,
+            recent=FAKE_RECENTLY_PLAYED,
+        )
+
+        def handler(request):
+            seen_auth.append(request.headers.get("Authorization"))
+            return inner(request)
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.spotify.com/v1") as client:
+            result = await SpotifyConnector(access_token="fake-token", client=client).fetch()
+
+        assert seen_auth == ["Bearer fake-token"] * 3
+        assert result["top_tracks"][0]["name"] == "Nights"
+        assert result["listening_hours"] == [22, 23, 1, 14]
+
     @pytest.mark.asyncio
     async def test_empty_listening_history(self, connector):
         """All endpoints return empty — should get empty lists everywhere."""
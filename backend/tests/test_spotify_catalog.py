@@ -0,0 +1,159 @@
+"""Tests for the shared Spotify artist/track catalog."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.connectors.spotify import SpotifyConnector
+from app.services.cache import MemoryBackend
+from app.services.spotify_catalog import SpotifyCatalog
+
+
+def _artist(i: int) -> dict:
+    return {
+        "id": f"a{i}",
+        "name": f"Artist {i}",
+        "genres": ["indie"],
+        "popularity": i,
+        "images": [{"url": "https://i.scdn.co/image/x", "height": 640, "width": 640}],
+        "followers": {"total": 1000 * i},
+    }
+
+
+def _catalog_server():
+    """Answers /artists?ids= and records which IDs were requested."""
+    requested: list[list[str]] = []
+
+    def handler(request):
+        ids = request.url.params["ids"].split(",")
+        requested.append(ids)
+        return httpx.Response(200, json={"artists": [_artist(int(i[1:])) if i != "a404" else None for i in ids]})
+
+    return handler, requested
+
+
+# ── unit: resolve ─────────────────────────────────────────────────
+
+class TestResolve:
+    async def _artists(self, catalog, handler, ids):
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.spotify.com/v1") as client:
+            return await catalog.artists(client, ids, {"Authorization": "Bearer t"})
+
+    async def test_fills_misses_in_batches_of_50(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        handler, requested = _catalog_server()
+        records = await self._artists(catalog, handler, [f"a{i}" for i in range(120)])
+        assert [len(batch) for batch in requested] == [50, 50, 20]
+        assert records[7] == {"id": "a7", "name": "Artist 7", "genres": ["indie"], "popularity": 7}
+
+    async def test_only_requests_unknown_ids(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        await catalog.remember_artists([_artist(1), _artist(2)])
+        handler, requested = _catalog_server()
+        records = await self._artists(catalog, handler, ["a1", "a3", "a2", "a3"])
+        assert requested == [["a3"]]
+        assert [r["id"] for r in records] == ["a1", "a3", "a2", "a3"]
+        assert catalog.stats() == {"hits": 2, "misses": 1}
+
+    async def test_all_cached_makes_no_request(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        await catalog.remember_artists([_artist(1)])
+        handler, requested = _catalog_server()
+        await self._artists(catalog, handler, ["a1"])
+        assert requested == []
+
+    async def test_unknown_ids_are_dropped(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        handler, _ = _catalog_server()
+        records = await self._artists(catalog, handler, ["a1", "a404"])
+        assert [r["id"] for r in records] == ["a1"]
+
+    async def test_expired_token_raises(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        with pytest.raises(PermissionError, match="expired or invalid"):
+            await self._artists(catalog, lambda r: httpx.Response(401), ["a1"])
+
+
+# ── unit: connector ───────────────────────────────────────────────
+
+def _spotify_server(top_artists: list[dict], tracks: list[dict], artist_lookups: list[list[str]]):
+    """/me/top/* and recently-played for one user, plus /artists?ids= recording what was asked for."""
+    catalog_handler, _ = _catalog_server()
+
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/top/artists"):
+            return httpx.Response(200, json={"items": top_artists})
+        if path.endswith("/top/tracks"):
+            return httpx.Response(200, json={"items": tracks})
+        if path.endswith("/recently-played"):
+            return httpx.Response(200, json={"items": [{"played_at": "2025-12-01T22:30:00Z", "track": tracks[-1]}]})
+        artist_lookups.append(request.url.params["ids"].split(","))
+        return catalog_handler(request)
+
+    return handler
+
+
+def _track(i: int, *artist_ids: int) -> dict:
+    return {"id": f"t{i}", "name": f"Track {i}", "artists": [{"id": f"a{a}", "name": f"Artist {a}"} for a in artist_ids]}
+
+
+class TestConnector:
+    async def _fetch(self, catalog, handler):
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.spotify.com/v1") as client:
+            result = await SpotifyConnector("tok", client=client, catalog=catalog).fetch()
+        await catalog.flush()
+        return result
+
+    async def test_track_artist_genres_resolved_through_catalog(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        lookups: list[list[str]] = []
+        # a1 is a top artist; a2 only appears on tracks (twice: top track and recently played)
+        handler = _spotify_server([_artist(1)], [_track(1, 1), _track(2, 2)], lookups)
+        result = await self._fetch(catalog, handler)
+
+        assert lookups == [["a2"]]
+        assert result["top_artists"] == [{"name": "Artist 1", "genres": ["indie"], "popularity": 1}]
+        assert result["top_genres"] == ["indie"]
+        assert catalog.stats() == {"hits": 0, "misses": 1}
+
+    async def test_next_user_reads_artists_from_catalog(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        await self._fetch(catalog, _spotify_server([_artist(1)], [_track(1, 2)], []))
+
+        lookups: list[list[str]] = []
+        # Another user: a1 (someone's top artist) and a2 (looked up before) are both known
+        await self._fetch(catalog, _spotify_server([_artist(3)], [_track(3, 1, 2)], lookups))
+        assert lookups == []
+        assert catalog.stats()["hits"] == 2
+
+    async def test_lookup_failure_keeps_top_artist_genres(self):
+        catalog = SpotifyCatalog(MemoryBackend())
+        inner = _spotify_server([_artist(1)], [_track(1, 2)], [])
+
+        def handler(request):
+            if request.url.path == "/v1/artists":
+                return httpx.Response(503)
+            return inner(request)
+
+        result = await self._fetch(catalog, handler)
+        assert result["top_genres"] == ["indie"]
+
+    async def test_fetch_does_not_wait_for_catalog_writes(self):
+        class SlowBackend(MemoryBackend):
+            async def set(self, key, value, ttl=None):
+                await asyncio.sleep(10)
+
+        def handler(request):
+            return httpx.Response(200, json={"items": [_artist(1)]})
+
+        catalog = SpotifyCatalog(SlowBackend())
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="https://api.spotify.com/v1") as client:
+            result = await asyncio.wait_for(SpotifyConnector("tok", client=client, catalog=catalog).fetch(), 1)
+        assert result["top_artists"][0]["name"] == "Artist 1"
+        assert len(catalog._pending) == 1
+        catalog._pending.pop().cancel()